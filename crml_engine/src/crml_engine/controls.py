@@ -42,15 +42,30 @@ def _collect_valid_controls(
     return all_controls
 
 
+def _control_reduction_index(
+    controls: List[Dict[str, Any]],
+) -> Tuple[np.ndarray, Dict[str, List[int]]]:
+    """Precompute per-control reductions and an id -> positions index."""
+    reductions = np.fromiter(
+        (calculate_effective_reduction(c) for c in controls),
+        dtype=np.float64,
+        count=len(controls),
+    )
+    positions: Dict[str, List[int]] = {}
+    for i, control in enumerate(controls):
+        positions.setdefault(control['id'], []).append(i)
+    return reductions, positions
+
+
 def _apply_controls_in_series(
     base_lambda: float,
     all_controls: List[Dict[str, Any]],
+    reductions: np.ndarray,
 ) -> Tuple[float, List[Dict[str, Any]]]:
     effective_lambda = base_lambda
     control_details: List[Dict[str, Any]] = []
 
-    for control in all_controls:
-        reduction = calculate_effective_reduction(control)
+    for control, reduction in zip(all_controls, reductions.tolist()):
 
         # Apply reduction (multiplicative for defense in depth)
         lambda_before = effective_lambda
@@ -168,7 +183,8 @@ def apply_control_effectiveness(
         return result
     
     # Calculate effective lambda with controls in series
-    effective_lambda, control_details = _apply_controls_in_series(base_lambda, all_controls)
+    reductions, positions = _control_reduction_index(all_controls)
+    effective_lambda, control_details = _apply_controls_in_series(base_lambda, all_controls, reductions)
     
     # Apply dependencies/correlations if specified
     if 'dependencies' in controls_config:
@@ -176,7 +192,8 @@ def apply_control_effectiveness(
             effective_lambda,
             base_lambda,
             all_controls,
-            controls_config['dependencies']
+            controls_config['dependencies'],
+            reduction_index=(reductions, positions),
         )
     
     # Calculate total reduction percentage
@@ -207,7 +224,9 @@ def adjust_for_dependencies(
     effective_lambda: float,
     base_lambda: float,
     controls: List[Dict],
-    dependencies: List[Dict]
+    dependencies: List[Dict],
+    *,
+    reduction_index: Optional[Tuple[np.ndarray, Dict[str, List[int]]]] = None,
 ) -> float:
     """
     Adjust effective lambda for control dependencies/correlations.
@@ -220,6 +239,8 @@ def adjust_for_dependencies(
         base_lambda: Original baseline lambda
         controls: List of all controls
         dependencies: List of dependency specifications
+        reduction_index: Optional precomputed (reductions, id -> positions)
+            for `controls`; built once here when omitted
     
     Returns:
         Adjusted effective lambda
@@ -227,6 +248,8 @@ def adjust_for_dependencies(
     if not dependencies:
         return effective_lambda
     
+    reductions, positions = reduction_index or _control_reduction_index(controls)
+
     # For each dependency group, reduce effectiveness based on correlation
     for dep in dependencies:
         dep_control_ids = dep.get('controls', [])
@@ -236,9 +259,9 @@ def adjust_for_dependencies(
             continue
         
         # Find controls in this dependency group
-        dep_controls = [c for c in controls if c['id'] in dep_control_ids]
+        dep_idx = [i for cid in set(dep_control_ids) for i in positions.get(cid, ())]
         
-        if len(dep_controls) < 2:
+        if len(dep_idx) < 2:
             continue
         
         # Calculate adjustment factor based on correlation
@@ -248,7 +271,7 @@ def adjust_for_dependencies(
         
         # Simple model: reduce combined effectiveness by correlation factor
         # More sophisticated models could use copulas
-        avg_reduction = np.mean([calculate_effective_reduction(c) for c in dep_controls])
+        avg_reduction = float(np.mean(reductions[dep_idx]))
         
         # Adjustment: when correlation is high, treat controls as more redundant
         redundancy_factor = correlation * avg_reduction * 0.5  # Conservative adjustment
@@ -21,12 +21,18 @@
 #   print(result.model_dump())
 from typing import Optional, List, Any, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 _BANNER_WIDTH = 50
 
+# Emit NaN/Infinity in JSON output (as json.dumps does) instead of pydantic's
+# default of null, so non-finite metrics stay distinguishable from missing ones.
+_RESULT_CONFIG = ConfigDict(ser_json_inf_nan="constants")
+
 class Metrics(BaseModel):
+    model_config = _RESULT_CONFIG
+
     eal: Optional[float] = Field(None, description="Expected annual loss (mean of the annual loss distribution).")
     var_95: Optional[float] = Field(None, description="Value at Risk at the 95th percentile.")
     var_99: Optional[float] = Field(None, description="Value at Risk at the 99th percentile.")
@@ -37,11 +43,15 @@ class Metrics(BaseModel):
     std_dev: Optional[float] = Field(None, description="Standard deviation of the loss distribution.")
 
 class Distribution(BaseModel):
+    model_config = _RESULT_CONFIG
+
     bins: List[float] = Field(default_factory=list, description="Histogram bin edges.")
     frequencies: List[int] = Field(default_factory=list, description="Histogram bin counts.")
     raw_data: List[float] = Field(default_factory=list, description="Optional raw sample losses (may be truncated).")
 
 class Metadata(BaseModel):
+    model_config = _RESULT_CONFIG
+
     runs: int = Field(..., description="Number of simulation runs/samples.")
     seed: Optional[int] = Field(None, description="Random seed used for the run (if any).")
     currency: Optional[str] = Field(None, description="Currency display symbol (if available).")
@@ -59,6 +69,8 @@ class Metadata(BaseModel):
     correlation_info: Optional[List[dict]] = Field(None, description="Optional correlation metadata (engine-specific).")
 
 class SimulationResult(BaseModel):
+    model_config = _RESULT_CONFIG
+
     success: bool = Field(False, description="True if simulation completed successfully.")
     metrics: Optional[Metrics] = Field(None, description="Computed summary statistics for the run.")
     distribution: Optional[Distribution] = Field(None, description="Distribution artifacts for loss samples.")
@@ -15,7 +15,6 @@ import json
 from typing import Union, Optional, Tuple, Any
 
 import hashlib
-import os
 import crml_lang
 
 from crml_engine.pipeline import plan_bundle
@@ -44,6 +43,7 @@ from .models.fx_model import (
 from .models.constants import DEFAULT_FX_RATES
 from .simulation.engine import run_monte_carlo
 from .simulation.severity import SeverityEngine
+from .simulation.utils import is_file_path, linear_histogram
 from .copula import gaussian_copula_uniforms
 
 
@@ -71,7 +71,7 @@ def _input_reference_from_yaml_content(yaml_content: Union[str, dict]) -> Any:
     digest: Optional[str] = None
 
     if isinstance(yaml_content, str):
-        if os.path.isfile(yaml_content):
+        if is_file_path(yaml_content):
             uri = yaml_content
             try:
                 with open(yaml_content, "rb") as f:
@@ -99,7 +99,7 @@ def _try_parse_scenario(yaml_content: Union[str, dict]) -> Optional[Any]:
     """
     try:
         lang = _crml_lang_module()
-        if isinstance(yaml_content, str) and os.path.isfile(yaml_content):
+        if isinstance(yaml_content, str) and is_file_path(yaml_content):
             with open(yaml_content, "r", encoding="utf-8") as f:
                 return lang.CRScenario.load_from_yaml_str(f.read())
         if isinstance(yaml_content, str):
@@ -394,7 +394,7 @@ def _load_yaml_root_for_routing(source: Union[str, dict]) -> Optional[dict]:
         return None
 
     try:
-        if os.path.isfile(source):
+        if is_file_path(source):
             with open(source, "r", encoding="utf-8") as f:
                 loaded = _yaml.safe_load(f)
         else:
@@ -409,7 +409,7 @@ def _infer_source_kind(source: Union[str, dict]) -> str:
     """Infer runtime source_kind for portfolio/bundle runners."""
     if isinstance(source, dict):
         return "data"
-    if isinstance(source, str) and os.path.isfile(source):
+    if isinstance(source, str) and is_file_path(source):
         return "path"
     return "yaml"
 
@@ -576,6 +576,75 @@ def _load_text_file(path: str) -> str:
         return f.read()
 
 
+def _control_coefficients(sc: Any, control_state: dict[str, np.ndarray]) -> Tuple[
+    dict[str, float], dict[str, float], float, float
+]:
+    """Collect a scenario's control strengths for frequency and severity.
+
+    The strength of a control is effectiveness × coverage. Controls with a
+    sampled state are keyed by id; controls without one are always on and fold
+    into a constant factor.
+
+    Returns:
+        (freq_coef, sev_coef, freq_const, sev_const)
+    """
+    freq_coef: dict[str, float] = {}
+    sev_coef: dict[str, float] = {}
+    freq_const = 1.0
+    sev_const = 1.0
+
+    for ctrl in sc.controls:
+        eff = float(ctrl.combined_implementation_effectiveness or 0.0)
+        cov = float(ctrl.combined_coverage_value if ctrl.combined_coverage_value is not None else 1.0)
+        strength = eff * cov
+        if strength == 0.0:
+            continue
+
+        affects = (ctrl.affects or "frequency").lower()
+        sampled = ctrl.id in control_state
+        if affects in ("frequency", "both"):
+            if sampled:
+                # States are binary, so repeated controls compose as
+                # 1 - (1 - a)(1 - b).
+                freq_coef[ctrl.id] = 1.0 - (1.0 - freq_coef.get(ctrl.id, 0.0)) * (1.0 - strength)
+            else:
+                freq_const *= 1.0 - strength
+        if affects in ("severity", "both"):
+            if sampled:
+                sev_coef[ctrl.id] = 1.0 - (1.0 - sev_coef.get(ctrl.id, 0.0)) * (1.0 - strength)
+            else:
+                sev_const *= 1.0 - strength
+
+    return freq_coef, sev_coef, freq_const, sev_const
+
+
+def _apply_control_coefficients(
+    coef: dict[str, float], const: float, control_state: dict[str, np.ndarray], n_runs: int
+) -> np.ndarray:
+    """Per-run multiplier `const × Π (1 - c × state)` over the given controls.
+
+    Because states are binary, log(1 - c × state) = state × log(1 - c), so the
+    product is one matrix-vector product of the log coefficients with the
+    state rows of just these controls. Controls with full strength (c >= 1)
+    have no finite log and are applied as a zeroing mask instead.
+    """
+    partial = [(cid, c) for cid, c in coef.items() if c < 1.0]
+    full = [cid for cid, c in coef.items() if c >= 1.0]
+
+    if partial:
+        states = np.vstack([control_state[cid] for cid, _ in partial])
+        log_keep = np.log1p(-np.array([c for _, c in partial], dtype=np.float64))
+        mult = np.exp(log_keep @ states)
+        mult *= const
+    else:
+        mult = np.full(n_runs, const, dtype=np.float64)
+
+    if full:
+        # Zero the runs where any of the (few) full-strength controls is on.
+        mult[np.vstack([control_state[cid] for cid in full]).any(axis=0)] = 0.0
+    return mult
+
+
 def _control_multipliers_for_scenario(sc: Any, control_state: dict[str, np.ndarray], n_runs: int) -> tuple[np.ndarray, np.ndarray]:
     """Compute per-run frequency and severity multipliers for a planned scenario.
 
@@ -585,6 +654,7 @@ def _control_multipliers_for_scenario(sc: Any, control_state: dict[str, np.ndarr
     - multiplier = 1 - reduction
 
     where `state` is 1 when the control is functioning on that run, else 0.
+    Only the state rows of controls the scenario references are read.
 
     Args:
         sc: Planned scenario object with `.controls`.
@@ -594,23 +664,11 @@ def _control_multipliers_for_scenario(sc: Any, control_state: dict[str, np.ndarr
     Returns:
         (freq_mult, sev_mult) arrays of shape (n_runs,).
     """
-    freq_mult = np.ones(n_runs, dtype=np.float64)
-    sev_mult = np.ones(n_runs, dtype=np.float64)
-
-    for ctrl in sc.controls:
-        eff = float(ctrl.combined_implementation_effectiveness or 0.0)
-        cov = float(ctrl.combined_coverage_value if ctrl.combined_coverage_value is not None else 1.0)
-        state = control_state.get(ctrl.id)
-        if state is None:
-            state = np.ones(n_runs, dtype=np.float64)
-        reduction = eff * cov * state
-        affects = (ctrl.affects or "frequency").lower()
-        if affects in ("frequency", "both"):
-            freq_mult = freq_mult * (1.0 - reduction)
-        if affects in ("severity", "both"):
-            sev_mult = sev_mult * (1.0 - reduction)
-
-    return freq_mult, sev_mult
+    freq_coef, sev_coef, freq_const, sev_const = _control_coefficients(sc, control_state)
+    return (
+        _apply_control_coefficients(freq_coef, freq_const, control_state, n_runs),
+        _apply_control_coefficients(sev_coef, sev_const, control_state, n_runs),
+    )
 
 
 def _aggregate_portfolio_losses(
@@ -666,7 +724,8 @@ def _run_single_portfolio_scenario(
     *,
     sc: Any,
     idx: int,
-    control_state: dict[str, np.ndarray],
+    freq_mult: np.ndarray,
+    sev_mult: np.ndarray,
     n_runs: int,
     seed: Optional[int],
     fx_config: FXConfig,
@@ -679,7 +738,8 @@ def _run_single_portfolio_scenario(
     Args:
         sc: Planned scenario (resolved by `plan_portfolio()`).
         idx: Scenario index in the plan (used to perturb the base seed).
-        control_state: Mapping control_id -> {0,1} array.
+        freq_mult: Per-run frequency multiplier from control effects.
+        sev_mult: Per-run severity multiplier from control effects.
         n_runs: Number of Monte Carlo runs.
         seed: Optional base seed.
         fx_config: FX configuration used for output currency conversion.
@@ -709,8 +769,6 @@ def _run_single_portfolio_scenario(
         except Exception as e:
             raise ValueError(f"Failed to read scenario '{sc.id}': {e}") from e
 
-    freq_mult, sev_mult = _control_multipliers_for_scenario(sc, control_state, n_runs)
-
     scenario_seed = None if seed is None else int(seed + idx * 1000)
     res = run_monte_carlo(
         scenario_input,
@@ -747,10 +805,14 @@ def _run_portfolio_scenarios(
     scenario_weights: list[float] = []
 
     for idx, sc in enumerate(scenarios):
+        # Evaluated per scenario so only one scenario's multipliers are alive
+        # at a time.
+        freq_mult, sev_mult = _control_multipliers_for_scenario(sc, control_state, n_runs)
         losses, weight = _run_single_portfolio_scenario(
             sc=sc,
             idx=idx,
-            control_state=control_state,
+            freq_mult=freq_mult,
+            sev_mult=sev_mult,
             n_runs=n_runs,
             seed=seed,
             fx_config=fx_config,
@@ -780,11 +842,11 @@ def _compute_metrics_and_distribution(total: np.ndarray, *, bin_count: int = 50)
         std_dev=float(np.std(total)),
     )
 
-    hist, bin_edges = np.histogram(total, bins=bin_count)
+    hist, bin_edges = linear_histogram(total, bins=bin_count, lo=metrics.min, hi=metrics.max)
     distribution = Distribution(
         bins=bin_edges.tolist(),
         frequencies=hist.tolist(),
-        raw_data=total.tolist()[:1000],
+        raw_data=total[:1000].tolist(),
     )
     return metrics, distribution
 
@@ -851,6 +913,7 @@ def run_portfolio_bundle_simulation(
     n_runs: int = 10000,
     seed: Optional[int] = None,
     fx_config: Optional[FXConfig] = None,
+    trusted: bool = False,
 ) -> EngineSimulationResult:
     """Run a CRML portfolio bundle simulation.
 
@@ -867,6 +930,10 @@ def run_portfolio_bundle_simulation(
         n_runs: Number of Monte Carlo iterations.
         seed: Optional base seed.
         fx_config: Optional FXConfig.
+        trusted: Skip Pydantic validation when loading the bundle. Only use
+            for bundles from a trusted producer (e.g. written by
+            `CRPortfolioBundle.dump_to_yaml`), since malformed input is not
+            rejected.
 
     Returns:
         A `SimulationResult` for the bundled portfolio.
@@ -879,13 +946,13 @@ def run_portfolio_bundle_simulation(
     try:
         if source_kind == "path":
             assert isinstance(bundle_source, str)
-            bundle = lang.CRPortfolioBundle.load_from_yaml(bundle_source)
+            bundle = lang.CRPortfolioBundle.load_from_yaml(bundle_source, trusted=trusted)
         elif source_kind == "yaml":
             assert isinstance(bundle_source, str)
-            bundle = lang.CRPortfolioBundle.load_from_yaml_str(bundle_source)
+            bundle = lang.CRPortfolioBundle.load_from_yaml_str(bundle_source, trusted=trusted)
         else:
             assert isinstance(bundle_source, dict)
-            bundle = lang.CRPortfolioBundle.model_validate(bundle_source)
+            bundle = lang.CRPortfolioBundle.load_from_data(bundle_source, trusted=trusted)
     except Exception as e:
         return _portfolio_error_result(str(e))
 
@@ -1254,8 +1321,18 @@ def run_simulation_cli(file_path: str, n_runs: int = 10000, output_format: str =
         return False
 
     if output_format == 'json':
-        # Use model_dump for pretty JSON output
-        print(json.dumps(result.model_dump(), indent=2))
+        import sys
+
+        # Serialize in pydantic-core straight to UTF-8 bytes (no intermediate
+        # dict walk); write them to the binary stream when there is one.
+        payload = result.__pydantic_serializer__.to_json(result, indent=2) + b"\n"
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None:
+            sys.stdout.write(payload.decode("utf-8"))
+        else:
+            sys.stdout.flush()
+            out.write(payload)
+            out.flush()
         return result.success
 
     # Text output
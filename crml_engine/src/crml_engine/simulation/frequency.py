@@ -117,6 +117,7 @@ class FrequencyEngine:
         seed: Optional[int] = None,
         uniforms: Optional[np.ndarray] = None,
         rate_multiplier: Optional[object] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """Generate per-run event counts for the configured frequency model.
 
@@ -133,12 +134,14 @@ class FrequencyEngine:
                 provide attributes consistent with the chosen model.
             n_runs: Number of Monte Carlo iterations.
             cardinality: Exposure multiplier (e.g., number of assets).
-            seed: Optional seed (currently the engine uses NumPy global RNG;
-                this argument is reserved for future local RNG handling).
+            seed: Optional seed for a fresh PCG64 generator; ignored when
+                `rng` is given.
             uniforms: Optional uniform variates in (0, 1) used for inverse-CDF
                 sampling in some branches to support copula correlation.
             rate_multiplier: Optional scalar or per-run multiplier applied to
                 the computed rate in the poisson branch.
+            rng: Optional generator to draw from (e.g. a child generator
+                spawned for a parallel worker).
 
         Returns:
             Integer numpy array of shape (n_runs,) with event counts.
@@ -146,10 +149,8 @@ class FrequencyEngine:
         Raises:
             ValueError: If `rate_multiplier` is an array with wrong shape.
         """
-        # Note: seed is handled globally by numpy in the main engine, 
-        # but passed here if we ever want local random states.
-
-        rng = np.random.default_rng(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
 
         if freq_model == 'poisson':
             return FrequencyEngine._generate_poisson(
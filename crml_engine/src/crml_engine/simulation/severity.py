@@ -128,6 +128,7 @@ class SeverityEngine:
         components: Optional[List[Dict[str, Any]]],
         total_events: int,
         fx_config: FXConfig,
+        rng: np.random.Generator,
     ) -> np.ndarray:
         if not components:
             return np.zeros(total_events)
@@ -155,7 +156,7 @@ class SeverityEngine:
                 sigma=_safe_parse(ln_data.get('sigma')),
                 currency=ln_data.get('currency'),
             )
-            return cls.generate_severity('lognormal', p, None, total_events, fx_config)
+            return cls.generate_severity('lognormal', p, None, total_events, fx_config, rng=rng)
 
         if 'gamma' in first:
             g_data = first['gamma']
@@ -167,7 +168,7 @@ class SeverityEngine:
                 scale=_safe_parse(g_data.get('scale')),
                 currency=g_data.get('currency'),
             )
-            return cls.generate_severity('gamma', p, None, total_events, fx_config)
+            return cls.generate_severity('gamma', p, None, total_events, fx_config, rng=rng)
 
         return np.zeros(total_events)
 
@@ -233,6 +234,7 @@ class SeverityEngine:
         total_events: int,
         fx_config: FXConfig,
         seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """Generate per-event severity samples in the FX base currency.
 
@@ -253,6 +255,10 @@ class SeverityEngine:
             components: Mixture components for the "mixture" model.
             total_events: Number of per-event samples to generate.
             fx_config: FX configuration used to normalize values.
+            seed: Optional seed used when `rng` is not given.
+            rng: Optional generator to draw from. Passing the same generator
+                across calls continues one stream, so severities can be drawn
+                in chunks.
 
         Returns:
             Float numpy array of shape (total_events,) representing per-event
@@ -267,7 +273,8 @@ class SeverityEngine:
             return np.array([])
             
         base_currency = fx_config.base_currency
-        rng = np.random.default_rng(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
 
         if sev_model == 'lognormal':
             return cls._generate_lognormal(
@@ -292,6 +299,7 @@ class SeverityEngine:
                 components=components,
                 total_events=total_events,
                 fx_config=fx_config,
+                rng=rng,
             )
 
         return np.zeros(total_events)
@@ -1,10 +1,30 @@
 """
 Shared utilities for CRML simulation.
 """
-from typing import Union, Any
+import os
+from typing import Union, Any, Tuple
+
+import numpy as np
 
 NumberOrString = Union[int, float, str]
 
+# Longest string still probed as a file path; real paths are far shorter than
+# any non-trivial inline YAML document.
+MAX_PATH_PROBE_LENGTH = 4096
+
+
+def is_file_path(value: str) -> bool:
+    """Return True if `value` names an existing file rather than inline YAML.
+
+    Strings that can only be inline documents (multi-line or very long) are
+    rejected without a filesystem `stat`, which also avoids ENAMETOOLONG-style
+    errors on large documents.
+    """
+    if "\n" in value or len(value) > MAX_PATH_PROBE_LENGTH:
+        return False
+    return os.path.isfile(value)
+
+
 def parse_numberish_value(v: NumberOrString) -> float:
     """Parse a numeric value encoded as an int/float/string.
 
@@ -69,3 +89,42 @@ def format_pydantic_error(e: Any) -> list[str]:
         messages.append(f"[{loc}] {msg}")
 
     return messages
+
+
+def linear_histogram(values: np.ndarray, *, bins: int, lo: float, hi: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Histogram `values` into `bins` equal-width bins spanning [lo, hi].
+
+    Equivalent to `np.histogram(values, bins=bins, range=(lo, hi))` for values
+    inside the range, but bins by direct index arithmetic and `np.bincount`,
+    with the same correction NumPy applies to values landing on bin edges.
+    The top edge is inclusive, as with NumPy.
+
+    Args:
+        values: Samples, all expected to lie within [lo, hi]. Out-of-range
+            samples are clamped into the first/last bin.
+        bins: Number of bins (>= 1).
+        lo: Lower edge of the first bin.
+        hi: Upper edge of the last bin. If `hi <= lo`, the range is widened
+            to [lo - 0.5, hi + 0.5] as `np.histogram` does.
+
+    Returns:
+        (counts, edges) with shapes (bins,) and (bins + 1,).
+    """
+    lo = float(lo)
+    hi = float(hi)
+    if hi <= lo:
+        lo, hi = lo - 0.5, hi + 0.5
+
+    values = np.asarray(values)
+    if not np.issubdtype(values.dtype, np.floating):
+        values = values.astype(np.float64)
+    # Edges take the samples' float precision, as in `np.histogram`.
+    edges = np.linspace(lo, hi, bins + 1, dtype=np.result_type(lo, hi, values))
+    idx = ((values - lo) * (bins / (hi - lo))).astype(np.int64)
+    np.clip(idx, 0, bins - 1, out=idx)
+    # The arithmetic can be one bin off for values at (or within rounding of)
+    # an edge; compare against the actual edges as `np.histogram` does. The
+    # outer bins are left alone so out-of-range samples stay clamped.
+    idx -= (values < edges[idx]) & (idx > 0)
+    idx += (values >= edges[idx + 1]) & (idx < bins - 1)
+    return np.bincount(idx, minlength=bins), edges
@@ -8,16 +8,10 @@ This package contains:
 The reference runtime/simulation lives in the separate `crml_engine` package.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .api import (
-    CRScenario,
-    CRPortfolio,
-    CRPortfolioBundle,
-    CRControlCatalog,
-    CRAttackCatalog,
-    CRAssessment,
-    CRControlRelationships,
-    CRAttackControlRelationships,
-    CRSimulationResult,
     load_from_yaml,
     load_from_yaml_str,
     dump_to_yaml,
@@ -36,7 +30,49 @@ from .validators import (
     validate_attack_control_relationships,
 )
 
-from .bundling import BundleReport, bundle_portfolio
+if TYPE_CHECKING:
+    from .api import (
+        CRAssessment,
+        CRAttackCatalog,
+        CRAttackControlRelationships,
+        CRControlCatalog,
+        CRControlRelationships,
+        CRPortfolio,
+        CRPortfolioBundle,
+        CRScenario,
+        CRSimulationResult,
+    )
+    from .bundling import BundleReport, bundle_portfolio
+
+# Document models and the bundler are resolved on first access so that
+# `import crml_lang` (e.g. for `validate`) does not build every model schema.
+_LAZY_EXPORTS = {
+    "CRScenario": ".api",
+    "CRPortfolio": ".api",
+    "CRPortfolioBundle": ".api",
+    "CRControlCatalog": ".api",
+    "CRAttackCatalog": ".api",
+    "CRAssessment": ".api",
+    "CRControlRelationships": ".api",
+    "CRAttackControlRelationships": ".api",
+    "CRSimulationResult": ".api",
+    "BundleReport": ".bundling",
+    "bundle_portfolio": ".bundling",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 __all__ = [
     "CRScenario",
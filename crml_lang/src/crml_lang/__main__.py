@@ -2,16 +2,11 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 from typing import Optional
 
-from .cli import (
-    bundle_portfolio_to_yaml,
-    import_oscal_catalog_to_control_catalog_yaml,
-    import_scf_catalog_to_control_catalog_yaml,
-    validate_to_text,
-)
-
 
+@lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="crml-lang", description="crml-lang CLI")
     sub = p.add_subparsers(dest="cmd", required=True)
@@ -82,9 +77,13 @@ def main(argv: Optional[list[str]] = None) -> int:
         args = _build_parser().parse_args(argv)
 
         if args.cmd == "validate":
+            from .cli import validate_to_text
+
             return validate_to_text(args.file)
 
         if args.cmd == "bundle-portfolio":
+            from .cli import bundle_portfolio_to_yaml
+
             return bundle_portfolio_to_yaml(
                 args.in_portfolio,
                 args.out_bundle,
@@ -92,6 +91,8 @@ def main(argv: Optional[list[str]] = None) -> int:
             )
 
         if args.cmd == "oscal-import-catalog":
+            from .cli import import_oscal_catalog_to_control_catalog_yaml
+
             return import_oscal_catalog_to_control_catalog_yaml(
                 args.in_oscal_catalog,
                 args.out_control_catalog,
@@ -105,6 +106,8 @@ def main(argv: Optional[list[str]] = None) -> int:
             )
 
         if args.cmd == "scf-import-catalog":
+            from .cli import import_scf_catalog_to_control_catalog_yaml
+
             return import_scf_catalog_to_control_catalog_yaml(
                 args.in_scf_catalog,
                 args.out_control_catalog,
@@ -30,7 +30,30 @@ Validate a scenario document (schema + semantic warnings)::
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import singledispatch
+from importlib import import_module
+import threading
+import types
+from types import new_class
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AliasChoices, BaseModel, ConfigDict
 
 from .yamlio import (
     dump_yaml_to_path,
@@ -39,253 +62,452 @@ from .yamlio import (
     load_yaml_mapping_from_str,
 )
 
-from .models.scenario_model import CRScenario as _CRScenario
-from .models.assessment_model import CRAssessment as _CRAssessment
-from .models.control_catalog_model import CRControlCatalog as _CRControlCatalog
-from .models.attack_catalog_model import CRAttackCatalog as _CRAttackCatalog
-from .models.attack_control_relationships_model import (
-    CRAttackControlRelationships as _CRAttackControlRelationships,
-)
-from .models.control_relationships_model import CRControlRelationships as _CRControlRelationships
-from .models.portfolio_model import CRPortfolio as _CRPortfolio
-from .models.portfolio_bundle import CRPortfolioBundle as _CRPortfolioBundle
-from .models.simulation_result import CRSimulationResult
 from .validators import ValidationMessage, ValidationReport, validate, validate_portfolio
 from .validators import validate_attack_catalog
 from .validators import validate_attack_control_relationships
 
 
-def _drop_empty_portfolio_bundle_warnings(data: dict[str, Any]) -> None:
-    """Remove `portfolio_bundle.warnings` if it is an empty list.
+_M = TypeVar("_M", bound=BaseModel)
 
-    This keeps bundle YAML concise while still allowing warnings to be present
-    when they exist. The field remains optional during validation.
-    """
 
-    payload = data.get("portfolio_bundle")
-    if not isinstance(payload, dict):
-        return
+def _unwrap_annotation(annotation: Any) -> Any:
+    """Strip `Annotated[...]` wrappers from a type annotation."""
 
-    warnings = payload.get("warnings")
-    if isinstance(warnings, list) and len(warnings) == 0:
-        payload.pop("warnings", None)
+    while get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    return annotation
 
 
-class CRScenario(_CRScenario):
-    """Root CRML Scenario document model.
+def _field_keys(name: str, field: Any) -> list[str]:
+    """Return the mapping keys that may carry the value of a model field."""
 
-    This is a small subclass of the internal Pydantic model that adds
-    convenience constructors for YAML.
+    keys = [name]
+    if isinstance(field.alias, str):
+        keys.append(field.alias)
+    validation_alias = field.validation_alias
+    if isinstance(validation_alias, str):
+        keys.append(validation_alias)
+    elif isinstance(validation_alias, AliasChoices):
+        keys.extend(c for c in validation_alias.choices if isinstance(c, str))
+    return keys
+
+
+def _model_accepts(model: type[BaseModel], data: Mapping[str, Any]) -> bool:
+    """Cheap structural check used to pick a model out of a `Union`.
+
+    A model accepts `data` if every key maps to one of its fields and every
+    `Literal` field present in `data` (typically a `type`/`kind`
+    discriminator) holds one of the allowed values.
     """
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRScenario":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    known: set[str] = set()
+    for name, field in model.model_fields.items():
+        keys = _field_keys(name, field)
+        known.update(keys)
+        annotation = _unwrap_annotation(field.annotation)
+        if get_origin(annotation) is not Literal:
+            continue
+        for key in keys:
+            if key in data and data[key] not in get_args(annotation):
+                return False
+    return all(k in known for k in data)
+
+
+# `X | Y` annotations have their own origin type, which only exists on 3.10+.
+_UnionType = getattr(types, "UnionType", None)
+_UNION_ORIGINS = (Union,) if _UnionType is None else (Union, _UnionType)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build `value` for `annotation` without validation (see `_construct_recursive`)."""
+
+    annotation = _unwrap_annotation(annotation)
+    if value is None:
+        return None
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct_recursive(annotation, value) if isinstance(value, Mapping) else value
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in _UNION_ORIGINS:
+        members = [_unwrap_annotation(a) for a in args if a is not type(None)]
+        if isinstance(value, Mapping):
+            for member in members:
+                if isinstance(member, type) and issubclass(member, BaseModel) and _model_accepts(member, value):
+                    return _construct_recursive(member, value)
+        if len(members) == 1:
+            return _construct_value(members[0], value)
+        return value
+    if origin in (list, List) and args and isinstance(value, list):
+        return [_construct_value(args[0], v) for v in value]
+    if origin in (dict, Dict) and len(args) == 2 and isinstance(value, Mapping):
+        return {k: _construct_value(args[1], v) for k, v in value.items()}
+    return value
+
+
+def _construct_recursive(cls: type[_M], data: Mapping[str, Any]) -> _M:
+    """Build `cls` from `data` via `model_construct`, recursing into nested models.
+
+    `model_construct` alone only builds the outer model and leaves nested
+    payloads as plain dicts; this walks `cls.model_fields` and constructs
+    nested `BaseModel` fields (including inside `Optional`/`List`/`Dict`/
+    `Union`) as well. Field aliases are honoured.
+
+    No validators run and no values are coerced, so `data` must already be in
+    canonical form — e.g. the output of `dump_to_yaml*` on a validated model.
+    """
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRScenario":
-        data = load_yaml_mapping_from_str(yaml_text)
+    values: dict[str, Any] = {}
+    for name, field in cls.model_fields.items():
+        for key in _field_keys(name, field):
+            if key in data:
+                values[name] = _construct_value(field.annotation, data[key])
+                break
+    return cls.model_construct(**values)
+
+
+# Public document class -> internal model whose validator/serializer it reuses.
+_SCHEMA_OWNERS: dict[type, type[BaseModel]] = {}
+
+
+def _model_load_from_yaml_data(cls: type[_M], data: dict[str, Any], *, trusted: bool) -> _M:
+    if trusted:
+        return _construct_recursive(cls, data)
+
+    owner = _SCHEMA_OWNERS.get(cls)
+    if owner is None:
         return cls.model_validate(data)
+    # Validate with the parent's schema directly into an instance of `cls`,
+    # exactly as `BaseModel.__init__` does.
+    return owner.__pydantic_validator__.validate_python(data, self_instance=cls.__new__(cls))
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        """Serialize this model to a YAML file at `path`."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        """Serialize this model to a YAML string."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+def _model_load_from_yaml(cls: type[_M], path: str, *, trusted: bool = False) -> _M:
+    """Load `cls` from a YAML file.
 
-class CRPortfolioBundle(_CRPortfolioBundle):
-    """Engine-agnostic portfolio bundle.
+    By default the document is fully validated. Pass `trusted=True` only when
+    the YAML is known to come from a trusted producer (for instance a bundle
+    previously written by `dump_to_yaml`); validation is then skipped.
+    """
 
-    The bundle model (schema/contract) is defined in `crml_lang`.
-    Deterministic creation of bundles from portfolios is implemented in `crml_lang` (see `bundle_portfolio`).
+    return _model_load_from_yaml_data(cls, load_yaml_mapping_from_path(path), trusted=trusted)
 
-    The engine consumes bundles by building an execution plan from them (see `crml_engine.pipeline.plan_bundle`).
+
+def _model_load_from_yaml_str(cls: type[_M], yaml_text: str, *, trusted: bool = False) -> _M:
+    """Load `cls` from YAML text. See `_model_load_from_yaml` for `trusted`."""
+
+    return _model_load_from_yaml_data(cls, load_yaml_mapping_from_str(yaml_text), trusted=trusted)
+
+
+_D = TypeVar("_D", bound="_YamlDocument")
+
+if TYPE_CHECKING:
+    # Every concrete subclass is also a Pydantic model; say so for type
+    # checkers without changing the runtime MRO.
+    _YamlDocumentBase = BaseModel
+else:
+    _YamlDocumentBase = object
+
+
+class _YamlDocument(_YamlDocumentBase):
+    """YAML convenience constructors shared by the root document models.
+
+    Mixed into each public document class below, ahead of the internal
+    Pydantic model it extends.
     """
 
+    __slots__ = ()
+
     @classmethod
-    def load_from_yaml(cls, path: str) -> "CRPortfolioBundle":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    def load_from_yaml(cls: type[_D], path: str, *, trusted: bool = False) -> _D:
+        return _model_load_from_yaml(cls, path, trusted=trusted)
 
     @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRPortfolioBundle":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+    def load_from_yaml_str(cls: type[_D], yaml_text: str, *, trusted: bool = False) -> _D:
+        return _model_load_from_yaml_str(cls, yaml_text, trusted=trusted)
+
+    @classmethod
+    def load_many_from_yaml(
+        cls: type[_D], paths: Iterable[str], *, max_workers: Optional[int] = None, trusted: bool = False
+    ) -> list[_D]:
+        """Load several YAML files of this document type using a thread pool.
+
+        Results are returned in input order; the first failure is re-raised.
+        File reads overlap, so this mainly helps when many documents live on
+        slow or networked storage.
+        """
+        paths = list(paths)
+        if len(paths) <= 1 or max_workers == 1:
+            return [_model_load_from_yaml(cls, p, trusted=trusted) for p in paths]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda p: _model_load_from_yaml(cls, p, trusted=trusted), paths))
+
+    @classmethod
+    def load_from_data(cls: type[_D], data: Mapping[str, Any], *, trusted: bool = False) -> _D:
+        """Build from an already-parsed mapping. See `_model_load_from_yaml` for `trusted`."""
+        return _model_load_from_yaml_data(cls, dict(data), trusted=trusted)
+
+    def _yaml_data(self, *, exclude_none: bool) -> dict[str, Any]:
+        return self.model_dump(by_alias=True, exclude_none=exclude_none)
 
     def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
         """Serialize this model to a YAML file at `path`."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        _drop_empty_portfolio_bundle_warnings(data)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
+        dump_yaml_to_path(self._yaml_data(exclude_none=exclude_none), path, sort_keys=sort_keys)
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        """Serialize this model to a YAML string."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        _drop_empty_portfolio_bundle_warnings(data)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+    def dump_to_yaml_str(
+        self, *, sort_keys: bool = False, exclude_none: bool = True, reuse_buffer: bool = False
+    ) -> str:
+        """Serialize this model to a YAML string.
 
-def load_from_yaml(path: str) -> CRScenario:
-    """Load a CRML scenario from a YAML file path."""
-    return CRScenario.load_from_yaml(path)
+        `reuse_buffer=True` emits into a per-thread buffer kept between calls
+        (see `crml_lang.yamlio.dump_yaml_to_str`).
+        """
+        data = self._yaml_data(exclude_none=exclude_none)
+        return dump_yaml_to_str(data, sort_keys=sort_keys, reuse_buffer=reuse_buffer)
 
 
-def load_from_yaml_str(yaml_text: str) -> CRScenario:
-    """Load a CRML scenario from a YAML string."""
-    return CRScenario.load_from_yaml_str(yaml_text)
+_DumpOmission = tuple[tuple[str, ...], Callable[[Any], bool]]
 
+# Bundle YAML stays concise by leaving out `portfolio_bundle.warnings` when it
+# is empty; the field remains optional during validation.
+_PORTFOLIO_BUNDLE_OMISSIONS: tuple[_DumpOmission, ...] = (
+    (("portfolio_bundle", "warnings"), lambda v: v == []),
+)
 
-def dump_to_yaml(model: Union[CRScenario, Mapping[str, Any]], path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-    """Serialize a scenario model (or mapping) to a YAML file."""
-    if isinstance(model, CRScenario):
-        model.dump_to_yaml(path, sort_keys=sort_keys, exclude_none=exclude_none)
-        return
 
-    dump_yaml_to_path(dict(model), path, sort_keys=sort_keys)
+def _dump_exclude(model: Any, omissions: tuple[_DumpOmission, ...]) -> Optional[dict[str, Any]]:
+    """Evaluate `(field path, predicate)` omission rules into a `model_dump` exclude spec.
 
+    Rules are resolved against the model's attributes and applied by the
+    serializer itself, so there is no second pass over the dumped mapping.
+    """
 
-def dump_to_yaml_str(model: Union[CRScenario, Mapping[str, Any]], *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-    """Serialize a scenario model (or mapping) to a YAML string."""
-    if isinstance(model, CRScenario):
-        return model.dump_to_yaml_str(sort_keys=sort_keys, exclude_none=exclude_none)
+    exclude: dict[str, Any] = {}
+    for path, predicate in omissions:
+        value = model
+        for name in path:
+            value = getattr(value, name, None)
+        if not predicate(value):
+            continue
+        node = exclude
+        for name in path[:-1]:
+            node = node.setdefault(name, {})
+        node[path[-1]] = True
+    return exclude or None
 
-    return dump_yaml_to_str(dict(model), sort_keys=sort_keys)
 
+def _yaml_data_omitting(omissions: tuple[_DumpOmission, ...]) -> Callable[..., dict[str, Any]]:
+    """Build a `_yaml_data` override that applies the given omission rules."""
 
-class CRPortfolio(_CRPortfolio):
-    """Root CRML Portfolio document model."""
+    def _yaml_data(self: Any, *, exclude_none: bool) -> dict[str, Any]:
+        exclude = _dump_exclude(self, omissions)
+        return self.model_dump(by_alias=True, exclude_none=exclude_none, exclude=exclude)
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRPortfolio":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    return _yaml_data
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRPortfolio":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
+_portfolio_bundle_yaml_data = _yaml_data_omitting(_PORTFOLIO_BUNDLE_OMISSIONS)
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
 
+def portfolio_bundle_yaml_data(bundle: BaseModel, *, exclude_none: bool = True) -> dict[str, Any]:
+    """Return the YAML mapping `CRPortfolioBundle.dump_to_yaml` would write.
 
-class CRControlCatalog(_CRControlCatalog):
-    """Root CRML Control Catalog document model."""
+    Also accepts the internal bundle model (e.g. `BundleReport.bundle`), so
+    callers can serialize an already-validated bundle without rewrapping it.
+    """
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRControlCatalog":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    return _portfolio_bundle_yaml_data(bundle, exclude_none=exclude_none)
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRControlCatalog":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
+if TYPE_CHECKING:
+    # Static view of the lazily built classes below, for type checkers and
+    # IDEs; at runtime they come from `_build_document_class`.
+    from .models.assessment_model import CRAssessment as _CRAssessment
+    from .models.attack_catalog_model import CRAttackCatalog as _CRAttackCatalog
+    from .models.attack_control_relationships_model import (
+        CRAttackControlRelationships as _CRAttackControlRelationships,
+    )
+    from .models.control_catalog_model import CRControlCatalog as _CRControlCatalog
+    from .models.control_relationships_model import CRControlRelationships as _CRControlRelationships
+    from .models.portfolio_bundle import CRPortfolioBundle as _CRPortfolioBundle
+    from .models.portfolio_model import CRPortfolio as _CRPortfolio
+    from .models.scenario_model import CRScenario as _CRScenario
+    from .models.simulation_result import CRSimulationResult
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+    class CRScenario(_YamlDocument, _CRScenario): ...
 
+    class CRPortfolioBundle(_YamlDocument, _CRPortfolioBundle): ...
 
-class CRAttackCatalog(_CRAttackCatalog):
-    """Root CRML Attack Catalog document model."""
+    class CRPortfolio(_YamlDocument, _CRPortfolio): ...
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAttackCatalog":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    class CRControlCatalog(_YamlDocument, _CRControlCatalog): ...
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAttackCatalog":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+    class CRAttackCatalog(_YamlDocument, _CRAttackCatalog): ...
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
+    class CRAssessment(_YamlDocument, _CRAssessment): ...
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+    class CRControlRelationships(_YamlDocument, _CRControlRelationships): ...
 
+    class CRAttackControlRelationships(_YamlDocument, _CRAttackControlRelationships): ...
 
-class CRAssessment(_CRAssessment):
-    """Root CRML Assessment document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAssessment":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+# Public document classes are built on first access (PEP 562 `__getattr__`)
+# so that importing this module does not pay for building every Pydantic
+# schema up front. Each entry: (module, internal class name, docstring,
+# extra class attributes).
+_DOCUMENT_CLASSES: dict[str, tuple[str, str, str, dict[str, Any]]] = {
+    "CRScenario": (
+        ".models.scenario_model",
+        "CRScenario",
+        """Root CRML Scenario document model.
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAssessment":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+    This is a small subclass of the internal Pydantic model that adds
+    convenience constructors for YAML.
+    """,
+        {},
+    ),
+    "CRPortfolioBundle": (
+        ".models.portfolio_bundle",
+        "CRPortfolioBundle",
+        """Engine-agnostic portfolio bundle.
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
+    The bundle model (schema/contract) is defined in `crml_lang`.
+    Deterministic creation of bundles from portfolios is implemented in `crml_lang` (see `bundle_portfolio`).
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+    The engine consumes bundles by building an execution plan from them (see `crml_engine.pipeline.plan_bundle`).
+    """,
+        {"_yaml_data": _portfolio_bundle_yaml_data},
+    ),
+    "CRPortfolio": (".models.portfolio_model", "CRPortfolio", "Root CRML Portfolio document model.", {}),
+    "CRControlCatalog": (
+        ".models.control_catalog_model",
+        "CRControlCatalog",
+        "Root CRML Control Catalog document model.",
+        {},
+    ),
+    "CRAttackCatalog": (
+        ".models.attack_catalog_model",
+        "CRAttackCatalog",
+        "Root CRML Attack Catalog document model.",
+        {},
+    ),
+    "CRAssessment": (".models.assessment_model", "CRAssessment", "Root CRML Assessment document model.", {}),
+    "CRControlRelationships": (
+        ".models.control_relationships_model",
+        "CRControlRelationships",
+        "Root CRML Control Relationships document model.",
+        {},
+    ),
+    "CRAttackControlRelationships": (
+        ".models.attack_control_relationships_model",
+        "CRAttackControlRelationships",
+        "Root CRML Attack-to-Control Relationships document model.",
+        {},
+    ),
+}
+
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "CRSimulationResult": (".models.simulation_result", "CRSimulationResult"),
+}
+
+
+def _build_document_class(name: str) -> type:
+    module_name, base_name, doc, attrs = _DOCUMENT_CLASSES[name]
+    base = getattr(import_module(module_name, __package__), base_name)
+
+    def exec_body(ns: dict[str, Any]) -> None:
+        ns.update(attrs)
+        # Methods only: keep the instance layout identical to the parent model.
+        ns["__slots__"] = ()
+        # Build the core schema on first validation rather than at class creation.
+        ns["model_config"] = ConfigDict(defer_build=True)
+        ns["__doc__"] = doc
+        ns["__module__"] = __name__
+        ns["__qualname__"] = name
+
+    cls: Any = new_class(name, (_YamlDocument, base), exec_body=exec_body)
+    # The public class only adds methods, so it shares the parent's serializer
+    # rather than building an identical one; YAML loads reuse the parent's
+    # validator via `_SCHEMA_OWNERS`.
+    cls.__pydantic_serializer__ = base.__pydantic_serializer__
+    _SCHEMA_OWNERS[cls] = base
+    return cls
+
+
+# Serializes first access so concurrent threads cannot each build their own
+# (mutually non-`isinstance`) copy of a document class. Re-entrant because
+# importing a model module may resolve further names from this module.
+_lazy_lock = threading.RLock()
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _DOCUMENT_CLASSES and name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _lazy_lock:
+        value = globals().get(name)
+        if value is not None:
+            return value
+        if name in _DOCUMENT_CLASSES:
+            value = _build_document_class(name)
+        else:
+            module_name, attr = _LAZY_IMPORTS[name]
+            value = getattr(import_module(module_name, __package__), attr)
+        globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _scenario_class() -> Any:
+    return globals().get("CRScenario") or __getattr__("CRScenario")
 
 
-class CRControlRelationships(_CRControlRelationships):
-    """Root CRML Control Relationships document model."""
+def load_from_yaml(path: str) -> CRScenario:
+    """Load a CRML scenario from a YAML file path."""
+    return _model_load_from_yaml_data(_scenario_class(), load_yaml_mapping_from_path(path), trusted=False)
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRControlRelationships":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRControlRelationships":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+def load_from_yaml_str(yaml_text: str) -> CRScenario:
+    """Load a CRML scenario from a YAML string."""
+    return _model_load_from_yaml_data(_scenario_class(), load_yaml_mapping_from_str(yaml_text), trusted=False)
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+@singledispatch
+def dump_to_yaml(model: Union[BaseModel, Mapping[str, Any]], path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
+    """Serialize a CRML document model (or mapping) to a YAML file."""
+    dump_yaml_to_path(model if isinstance(model, dict) else dict(model), path, sort_keys=sort_keys)
 
 
-class CRAttackControlRelationships(_CRAttackControlRelationships):
-    """Root CRML Attack-to-Control Relationships document model."""
+@dump_to_yaml.register(BaseModel)
+def _dump_model_to_yaml(model: BaseModel, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
+    dump_yaml_to_path(model.model_dump(by_alias=True, exclude_none=exclude_none), path, sort_keys=sort_keys)
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAttackControlRelationships":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAttackControlRelationships":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+@dump_to_yaml.register(_YamlDocument)
+def _dump_document_to_yaml(model: _YamlDocument, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
+    model.dump_to_yaml(path, sort_keys=sort_keys, exclude_none=exclude_none)
 
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
 
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
+@singledispatch
+def dump_to_yaml_str(model: Union[BaseModel, Mapping[str, Any]], *, sort_keys: bool = False, exclude_none: bool = True) -> str:
+    """Serialize a CRML document model (or mapping) to a YAML string."""
+    return dump_yaml_to_str(model if isinstance(model, dict) else dict(model), sort_keys=sort_keys)
+
+
+@dump_to_yaml_str.register(BaseModel)
+def _dump_model_to_yaml_str(model: BaseModel, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
+    return dump_yaml_to_str(model.model_dump(by_alias=True, exclude_none=exclude_none), sort_keys=sort_keys)
+
+
+@dump_to_yaml_str.register(_YamlDocument)
+def _dump_document_to_yaml_str(model: _YamlDocument, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
+    return model.dump_to_yaml_str(sort_keys=sort_keys, exclude_none=exclude_none)
+
 
 __all__ = [
     "CRScenario",
@@ -301,6 +523,7 @@ __all__ = [
     "load_from_yaml_str",
     "dump_to_yaml",
     "dump_to_yaml_str",
+    "portfolio_bundle_yaml_data",
     "validate",
     "validate_portfolio",
     "validate_attack_catalog",
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Literal, Mapping, Optional, Union
+from functools import partial
+from typing import Any, Callable, Literal, Mapping, Optional, Sequence, TypeVar, Union
+
+from pydantic import BaseModel
 
 from crml_lang.models.assessment_model import CRAssessment
 from crml_lang.models.attack_catalog_model import CRAttackCatalog
@@ -17,7 +22,10 @@ from crml_lang.models.portfolio_bundle import (
     PortfolioBundlePayload,
 )
 from crml_lang.models.portfolio_model import CRPortfolio
-from crml_lang.yamlio import load_yaml_mapping_from_path, load_yaml_mapping_from_str
+from crml_lang.yamlio import load_yaml_mapping_from_bytes, load_yaml_mapping_from_str
+
+
+_DocT = TypeVar("_DocT", bound=BaseModel)
 
 
 @dataclass(frozen=True)
@@ -30,16 +38,178 @@ class BundleReport:
     bundle: Optional[CRPortfolioBundle] = None
 
 
+# Parsed YAML documents, keyed by absolute path and validated against the
+# file's (st_mtime_ns, st_size) on every lookup. Entries are shared, not copied:
+# callers only hand them to `model_validate`, which does not mutate its input.
+_YAML_CACHE_MAX_ENTRIES = 256
+_yaml_cache: dict[str, tuple[int, int, dict[str, Any]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def _read_file_bytes(path: str, size: int) -> bytes:
+    """Read a whole file with raw `os.read` calls, sized from an existing stat.
+
+    Asking for one byte more than the stat size lets a single read both fetch
+    the file and detect EOF; the loop only runs if the file grew in between.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        buf = os.read(fd, size + 1)
+        if len(buf) <= size:
+            return buf
+        chunks = [buf]
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
 def _load_yaml_file(path: str) -> dict[str, Any]:
-    """Load a YAML file from disk and require a mapping at the root."""
-    return load_yaml_mapping_from_path(path)
+    """Load a YAML file from disk and require a mapping at the root.
+
+    Results are cached per process; a changed mtime or size invalidates the
+    entry.
+    """
+    st = os.stat(path)
+    key = _path_key(path)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = load_yaml_mapping_from_bytes(_read_file_bytes(path, st.st_size))
+    with _yaml_cache_lock:
+        _yaml_cache.pop(key, None)
+        if len(_yaml_cache) >= _YAML_CACHE_MAX_ENTRIES:
+            _yaml_cache.pop(next(iter(_yaml_cache)))
+        _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+_IS_WINDOWS = os.name == "nt"
+
+
+def _is_abs(p: str) -> bool:
+    """`os.path.isabs` with a plain prefix check on the common POSIX path."""
+    if p.startswith("/"):
+        return True
+    return _IS_WINDOWS and os.path.isabs(p)
+
+
+def _abspath(p: str) -> str:
+    """`os.path.abspath`, skipping the getcwd/normpath work for already-absolute paths."""
+    return p if _is_abs(p) else os.path.abspath(p)
+
+
+def _path_key(p: str) -> str:
+    """Normalized absolute path used to identify a referenced file."""
+    return os.path.normpath(_abspath(p))
 
 
 def _resolve_path(base_dir: Optional[str], p: str) -> str:
     """Resolve a possibly-relative path against a base directory."""
-    if base_dir and not os.path.isabs(p):
+    if not base_dir or _is_abs(p):
+        return p
+    if _IS_WINDOWS:
         return os.path.join(base_dir, p)
-    return p
+    return base_dir + p if base_dir.endswith("/") else base_dir + "/" + p
+
+
+def _path_resolver(base_dir: Optional[str]) -> Callable[[str], str]:
+    """Return a `_resolve_path` equivalent with `base_dir` bound once.
+
+    On POSIX the separator-terminated prefix is computed here, so resolving
+    each reference is a single `startswith` check plus a concatenation.
+    """
+    if _IS_WINDOWS or not base_dir:
+        return partial(_resolve_path, base_dir)
+    prefix = base_dir if base_dir.endswith("/") else base_dir + "/"
+    return lambda p: p if p.startswith("/") else prefix + p
+
+
+# Pack reference categories, in bundle order:
+# (portfolio field / bundle_portfolio kwarg, document model,
+#  model-mode reference label, model-mode content label, inline-failure label).
+_INLINE_SPECS: tuple[tuple[str, type[BaseModel], str, str, str], ...] = (
+    ("control_catalogs", CRControlCatalog, "a control catalog", "catalog", "control catalog"),
+    ("assessments", CRAssessment, "an assessment", "catalog", "assessment"),
+    (
+        "control_relationships",
+        CRControlRelationships,
+        "a control relationships",
+        "pack",
+        "control relationships pack",
+    ),
+    ("attack_catalogs", CRAttackCatalog, "an attack catalog", "catalog", "attack catalog"),
+    (
+        "attack_control_relationships",
+        CRAttackControlRelationships,
+        "an attack-to-control relationships",
+        "mapping",
+        "attack-control relationships mapping",
+    ),
+)
+
+_MAX_PREFETCH_WORKERS = 32
+
+
+def _referenced_paths(portfolio_doc: CRPortfolio, base_dir: Optional[str]) -> list[str]:
+    """Resolved paths of every pack and scenario file the portfolio references."""
+    portfolio = portfolio_doc.portfolio
+    resolve = _path_resolver(base_dir)
+    paths: list[str] = []
+    for field, *_ in _INLINE_SPECS:
+        for p in getattr(portfolio, field) or []:
+            if isinstance(p, str) and p:
+                paths.append(resolve(p))
+    for sref in portfolio.scenarios:
+        paths.append(resolve(sref.path))
+    return paths
+
+
+def _prefetch_yaml_files(paths: list[str]) -> dict[str, Any]:
+    """Read and parse referenced YAML files concurrently.
+
+    Returns a mapping of path -> parsed mapping, or the exception raised while
+    loading it. Validation is left to the callers so that model construction
+    stays on the calling thread.
+    """
+
+    def load(path: str) -> Any:
+        try:
+            return _load_yaml_file(path)
+        except Exception as e:
+            return e
+
+    # Each distinct file is read once, even when referenced from several slots
+    # or categories, or spelled differently (e.g. `a/../b.yaml` vs `b.yaml`).
+    unique = list(dict.fromkeys(_path_key(p) for p in paths))
+    if len(unique) <= 1:
+        return {p: load(p) for p in unique}
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_PREFETCH_WORKERS, len(unique))) as pool:
+        return dict(zip(unique, pool.map(load, unique)))
+
+
+def _load_prefetched(path: str, prefetched: Optional[Mapping[str, Any]]) -> dict[str, Any]:
+    """Return a prefetched YAML mapping (re-raising its load error), or load it now."""
+    loaded = prefetched.get(_path_key(path)) if prefetched is not None else None
+    if loaded is None:
+        return _load_yaml_file(path)
+    if isinstance(loaded, Exception):
+        raise loaded
+    return loaded
+
+
+def _load_validated(path: str, model_cls: type[_DocT], prefetched: Optional[Mapping[str, Any]]) -> _DocT:
+    """Load `path` (prefetched when available) and validate it as `model_cls`.
+
+    Only the parsed YAML is cached; each bundle gets its own model instances,
+    since the models are mutable.
+    """
+    return model_cls.model_validate(_load_prefetched(path, prefetched))
 
 
 def _load_portfolio_doc(
@@ -67,7 +237,7 @@ def _load_portfolio_doc(
     data: dict[str, Any]
     if source_kind == "path":
         assert isinstance(source, str)
-        base_dir = os.path.dirname(os.path.abspath(source))
+        base_dir = os.path.dirname(_abspath(source))
         try:
             data = _load_yaml_file(source)
         except Exception as e:
@@ -96,233 +266,68 @@ def _load_portfolio_doc(
     return portfolio_doc, data, base_dir, errors
 
 
-def _inline_pack_paths(
-    *,
-    paths: list[str],
-    base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
-    warnings: list[BundleMessage],
-    model_mode_warning_path_prefix: str,
-    model_mode_warning_message: str,
-) -> list[str]:
-    """Resolve pack reference paths.
-
-    In model-mode (`source_kind == "model"`), file paths cannot be inlined and
-    are returned as an empty list while emitting warnings.
-    """
-    if source_kind == "model":
-        for idx, _ in enumerate(paths):
-            warnings.append(
-                BundleMessage(
-                    level="warning",
-                    path=f"{model_mode_warning_path_prefix}[{idx}]",
-                    message=model_mode_warning_message,
-                )
-            )
-        return []
-
+def _inline_pack_paths(*, paths: Sequence[str], base_dir: Optional[str]) -> list[str]:
+    """Resolve pack reference paths, skipping empty or non-string entries."""
+    resolve = _path_resolver(base_dir)
     resolved_paths: list[str] = []
     for p in paths:
         if not isinstance(p, str) or not p:
             continue
-        resolved_paths.append(_resolve_path(base_dir, p))
+        resolved_paths.append(resolve(p))
     return resolved_paths
 
 
-def _inline_control_catalogs(
-    *,
-    portfolio_doc: CRPortfolio,
-    base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
-    warnings: list[BundleMessage],
-    initial: list[CRControlCatalog],
-) -> list[CRControlCatalog]:
-    """Inline referenced control catalog documents into the bundle payload."""
-    out = list(initial)
-    paths = portfolio_doc.portfolio.control_catalogs or []
-
-    resolved_paths = _inline_pack_paths(
-        paths=list(paths),
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        model_mode_warning_path_prefix="portfolio.control_catalogs",
-        model_mode_warning_message=(
-            "Portfolio references a control catalog path, but bundling is in model-mode; "
-            "provide `control_catalogs` to inline catalog content."
-        ),
-    )
-
-    for idx, rp in enumerate(resolved_paths):
-        original = paths[idx]
-        try:
-            out.append(CRControlCatalog.model_validate(_load_yaml_file(rp)))
-        except Exception as e:
-            warnings.append(
-                BundleMessage(
-                    level="warning",
-                    path=f"portfolio.control_catalogs[{idx}]",
-                    message=f"Failed to inline control catalog '{original}': {e}",
-                )
-            )
-
-    return out
-
-
-def _inline_assessments(
-    *,
-    portfolio_doc: CRPortfolio,
-    base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
-    warnings: list[BundleMessage],
-    initial: list[CRAssessment],
-) -> list[CRAssessment]:
-    """Inline referenced assessment documents into the bundle payload."""
-    out = list(initial)
-    paths = portfolio_doc.portfolio.assessments or []
-
-    resolved_paths = _inline_pack_paths(
-        paths=list(paths),
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        model_mode_warning_path_prefix="portfolio.assessments",
-        model_mode_warning_message=(
-            "Portfolio references an assessment path, but bundling is in model-mode; "
-            "provide `assessments` to inline catalog content."
-        ),
-    )
-
-    for idx, rp in enumerate(resolved_paths):
-        original = paths[idx]
-        try:
-            out.append(CRAssessment.model_validate(_load_yaml_file(rp)))
-        except Exception as e:
-            warnings.append(
-                BundleMessage(
-                    level="warning",
-                    path=f"portfolio.assessments[{idx}]",
-                    message=f"Failed to inline assessment '{original}': {e}",
-                )
-            )
-
-    return out
-
-
-def _inline_control_relationships(
-    *,
-    portfolio_doc: CRPortfolio,
-    base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
-    warnings: list[BundleMessage],
-    initial: list[CRControlRelationships],
-) -> list[CRControlRelationships]:
-    """Inline referenced control-relationships packs into the bundle payload."""
-    out = list(initial)
-    paths = portfolio_doc.portfolio.control_relationships or []
-
-    resolved_paths = _inline_pack_paths(
-        paths=list(paths),
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        model_mode_warning_path_prefix="portfolio.control_relationships",
-        model_mode_warning_message=(
-            "Portfolio references a control relationships path, but bundling is in model-mode; "
-            "provide `control_relationships` to inline pack content."
-        ),
-    )
-
-    for idx, rp in enumerate(resolved_paths):
-        original = paths[idx]
-        try:
-            out.append(CRControlRelationships.model_validate(_load_yaml_file(rp)))
-        except Exception as e:
-            warnings.append(
-                BundleMessage(
-                    level="warning",
-                    path=f"portfolio.control_relationships[{idx}]",
-                    message=f"Failed to inline control relationships pack '{original}': {e}",
-                )
-            )
-
-    return out
+def _model_mode_reference_warnings(portfolio_doc: CRPortfolio, warnings: list[BundleMessage]) -> None:
+    """Warn about every pack path reference, since model-mode cannot read files."""
+    portfolio = portfolio_doc.portfolio
+    for field, _, reference_label, content_label, _ in _INLINE_SPECS:
+        paths = getattr(portfolio, field)
+        if not paths:
+            continue
+        message = (
+            f"Portfolio references {reference_label} path, but bundling is in model-mode; "
+            f"provide `{field}` to inline {content_label} content."
+        )
+        # Every field is a literal built here, so skip per-item validation.
+        warnings.extend(
+            BundleMessage.model_construct(level="warning", path=f"portfolio.{field}[{idx}]", message=message)
+            for idx in range(len(paths))
+        )
 
 
-def _inline_attack_catalogs(
+def _inline_category(
+    spec: tuple[str, type[BaseModel], str, str, str],
     *,
     portfolio_doc: CRPortfolio,
     base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
     warnings: list[BundleMessage],
-    initial: list[CRAttackCatalog],
-) -> list[CRAttackCatalog]:
-    """Inline referenced attack-catalog documents into the bundle payload."""
-    out = list(initial)
-    paths = portfolio_doc.portfolio.attack_catalogs or []
-
-    resolved_paths = _inline_pack_paths(
-        paths=list(paths),
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        model_mode_warning_path_prefix="portfolio.attack_catalogs",
-        model_mode_warning_message=(
-            "Portfolio references an attack catalog path, but bundling is in model-mode; "
-            "provide `attack_catalogs` to inline catalog content."
-        ),
-    )
+    prefetched: Optional[Mapping[str, Any]] = None,
+    initial: Sequence[Any],
+) -> list[Any]:
+    """Inline the referenced documents of one pack category (see `_INLINE_SPECS`).
 
-    for idx, rp in enumerate(resolved_paths):
-        original = paths[idx]
-        try:
-            out.append(CRAttackCatalog.model_validate(_load_yaml_file(rp)))
-        except Exception as e:
-            warnings.append(
-                BundleMessage(
-                    level="warning",
-                    path=f"portfolio.attack_catalogs[{idx}]",
-                    message=f"Failed to inline attack catalog '{original}': {e}",
-                )
-            )
-
-    return out
+    Caller-provided documents (`initial`) come first. The input sequence is
+    never mutated; when nothing is inlined it is handed back without a copy.
+    """
+    field, model_cls, _, _, failure_label = spec
+    paths = getattr(portfolio_doc.portfolio, field) or ()
 
+    resolved_paths = _inline_pack_paths(paths=paths, base_dir=base_dir)
+    if not resolved_paths:
+        return initial if isinstance(initial, list) else list(initial)
 
-def _inline_attack_control_relationships(
-    *,
-    portfolio_doc: CRPortfolio,
-    base_dir: Optional[str],
-    source_kind: Literal["path", "yaml", "data", "model"],
-    warnings: list[BundleMessage],
-    initial: list[CRAttackControlRelationships],
-) -> list[CRAttackControlRelationships]:
-    """Inline referenced attack-to-control relationships mappings into the bundle payload."""
-    out = list(initial)
-    paths = portfolio_doc.portfolio.attack_control_relationships or []
-
-    resolved_paths = _inline_pack_paths(
-        paths=list(paths),
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        model_mode_warning_path_prefix="portfolio.attack_control_relationships",
-        model_mode_warning_message=(
-            "Portfolio references an attack-to-control relationships path, but bundling is in model-mode; "
-            "provide `attack_control_relationships` to inline mapping content."
-        ),
-    )
-
+    out = [*initial]
     for idx, rp in enumerate(resolved_paths):
         original = paths[idx]
         try:
-            out.append(CRAttackControlRelationships.model_validate(_load_yaml_file(rp)))
+            out.append(_load_validated(rp, model_cls, prefetched))
         except Exception as e:
+            # Fields are strings formatted here; no need to validate them.
             warnings.append(
-                BundleMessage(
+                BundleMessage.model_construct(
                     level="warning",
-                    path=f"portfolio.attack_control_relationships[{idx}]",
-                    message=f"Failed to inline attack-control relationships mapping '{original}': {e}",
+                    path=f"portfolio.{field}[{idx}]",
+                    message=f"Failed to inline {failure_label} '{original}': {e}",
                 )
             )
 
@@ -335,6 +340,7 @@ def _inline_scenarios(
     base_dir: Optional[str],
     source_kind: Literal["path", "yaml", "data", "model"],
     scenarios: Optional[Mapping[str, CRScenario]],
+    prefetched: Optional[Mapping[str, Any]] = None,
 ) -> tuple[list[BundledScenario], list[BundleMessage]]:
     """Inline scenario documents referenced by the portfolio.
 
@@ -344,6 +350,7 @@ def _inline_scenarios(
     """
     errors: list[BundleMessage] = []
     bundled: list[BundledScenario] = []
+    resolve = _path_resolver(base_dir)
 
     for idx, sref in enumerate(portfolio_doc.portfolio.scenarios):
         if source_kind == "model":
@@ -371,9 +378,9 @@ def _inline_scenarios(
                 )
                 return [], errors
         else:
-            scenario_path = _resolve_path(base_dir, sref.path)
+            scenario_path = resolve(sref.path)
             try:
-                scenario_doc = CRScenario.model_validate(_load_yaml_file(scenario_path))
+                scenario_doc = _load_validated(scenario_path, CRScenario, prefetched)
             except Exception as e:
                 errors.append(
                     BundleMessage(
@@ -429,45 +436,35 @@ def bundle_portfolio(
     if load_errors or portfolio_doc is None:
         return BundleReport(ok=False, errors=load_errors, warnings=warnings, bundle=None)
 
-    control_catalogs_out = _inline_control_catalogs(
-        portfolio_doc=portfolio_doc,
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        initial=list(control_catalogs or []),
-    )
-
-    assessments_out = _inline_assessments(
-        portfolio_doc=portfolio_doc,
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        initial=list(assessments or []),
-    )
-
-    control_relationships_out = _inline_control_relationships(
-        portfolio_doc=portfolio_doc,
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        initial=list(control_relationships or []),
-    )
-
-    attack_catalogs_out = _inline_attack_catalogs(
-        portfolio_doc=portfolio_doc,
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        initial=list(attack_catalogs or []),
-    )
-
-    attack_control_relationships_out = _inline_attack_control_relationships(
-        portfolio_doc=portfolio_doc,
-        base_dir=base_dir,
-        source_kind=source_kind,
-        warnings=warnings,
-        initial=list(attack_control_relationships or []),
-    )
+    provided: dict[str, Optional[list[Any]]] = {
+        "control_catalogs": control_catalogs,
+        "assessments": assessments,
+        "control_relationships": control_relationships,
+        "attack_catalogs": attack_catalogs,
+        "attack_control_relationships": attack_control_relationships,
+    }
+    packs: dict[str, Any]
+    prefetched: Optional[dict[str, Any]] = None
+    if source_kind == "model":
+        # Nothing can be read from disk: bundle the provided packs as-is and
+        # only warn about the path references.
+        packs = {field: docs or [] for field, docs in provided.items()}
+        _model_mode_reference_warnings(portfolio_doc, warnings)
+    else:
+        # Overlap disk reads and YAML parsing for every referenced file up
+        # front; the inline helpers then only validate.
+        prefetched = _prefetch_yaml_files(_referenced_paths(portfolio_doc, base_dir))
+        packs = {
+            spec[0]: _inline_category(
+                spec,
+                portfolio_doc=portfolio_doc,
+                base_dir=base_dir,
+                warnings=warnings,
+                prefetched=prefetched,
+                initial=provided[spec[0]] or (),
+            )
+            for spec in _INLINE_SPECS
+        }
 
     # Inline scenarios referenced by the portfolio.
     bundled_scenarios, scenario_errors = _inline_scenarios(
@@ -475,6 +472,7 @@ def bundle_portfolio(
         base_dir=base_dir,
         source_kind=source_kind,
         scenarios=scenarios,
+        prefetched=prefetched,
     )
     if scenario_errors:
         return BundleReport(ok=False, errors=scenario_errors, warnings=warnings, bundle=None)
@@ -482,15 +480,11 @@ def bundle_portfolio(
     payload = PortfolioBundlePayload(
         portfolio=portfolio_doc,
         scenarios=bundled_scenarios,
-        control_catalogs=control_catalogs_out,
-        assessments=assessments_out,
-        control_relationships=control_relationships_out,
-        attack_catalogs=attack_catalogs_out,
-        attack_control_relationships=attack_control_relationships_out,
+        **packs,
         warnings=warnings,
         metadata={
             "source_kind": source_kind,
-            **({"source_path": os.path.abspath(source)} if source_kind == "path" and isinstance(source, str) else {}),
+            **({"source_path": _abspath(source)} if source_kind == "path" and isinstance(source, str) else {}),
         },
     )
 
@@ -9,10 +9,35 @@ Note: `crml_lang` also has a separate XLSX-focused CLI under
 
 from __future__ import annotations
 
+from importlib import import_module
+from types import ModuleType
 from typing import Optional, TextIO
 
 import sys
 
+from crml_lang import bundle_portfolio, validate_document
+from crml_lang.api import portfolio_bundle_yaml_data
+from crml_lang.yamlio import dump_yaml_to_path
+
+
+# Optional integrations, imported on first use and kept for later calls.
+_oscal_mod: Optional[ModuleType] = None
+_scf_mod: Optional[ModuleType] = None
+
+
+def _oscal_integration() -> ModuleType:
+    global _oscal_mod
+    if _oscal_mod is None:
+        _oscal_mod = import_module("crml_lang.integrations.oscal")
+    return _oscal_mod
+
+
+def _scf_integration() -> ModuleType:
+    global _scf_mod
+    if _scf_mod is None:
+        _scf_mod = import_module("crml_lang.integrations.scf")
+    return _scf_mod
+
 
 def bundle_portfolio_to_yaml(
     in_portfolio: str,
@@ -30,18 +55,16 @@ def bundle_portfolio_to_yaml(
     stdout = stdout or sys.stdout
     stderr = stderr or sys.stderr
 
-    from crml_lang import CRPortfolioBundle, bundle_portfolio
-
     report = bundle_portfolio(in_portfolio, source_kind="path")
     if not report.ok or report.bundle is None:
         for m in report.errors:
             print(m.message, file=stderr)
         return 1
 
-    bundle = CRPortfolioBundle.model_validate(
-        report.bundle.model_dump(by_alias=True, exclude_none=True)
-    )
-    bundle.dump_to_yaml(out_bundle, sort_keys=bool(sort_keys))
+    # `report.bundle` is already validated: serialize it with the bundle YAML
+    # dump rules directly, with no rewrap or dump/validate round-trip.
+    data = portfolio_bundle_yaml_data(report.bundle)
+    dump_yaml_to_path(data, out_bundle, sort_keys=bool(sort_keys))
     print(f"Wrote {out_bundle}", file=stdout)
     return 0
 
@@ -61,8 +84,6 @@ def validate_to_text(
     stderr = stderr or sys.stderr
 
     try:
-        from crml_lang import validate_document
-
         report = validate_document(path, source_kind="path")
         print(report.render_text(source_label=path), file=stdout)
         return 0 if report.ok else 1
@@ -94,20 +115,16 @@ def import_oscal_catalog_to_control_catalog_yaml(
     stderr = stderr or sys.stderr
 
     try:
-        from crml_lang.integrations.oscal import (
-            OscalCatalogProvenance,
-            oscal_catalog_to_crml_control_catalog,
-            read_oscal_catalog,
-        )
+        oscal = _oscal_integration()
 
-        oscal_catalog = read_oscal_catalog(in_oscal_catalog)
-        crml_catalog = oscal_catalog_to_crml_control_catalog(
+        oscal_catalog = oscal.read_oscal_catalog(in_oscal_catalog)
+        crml_catalog = oscal.oscal_catalog_to_crml_control_catalog(
             oscal_catalog,
             namespace=namespace,
             framework=framework,
             catalog_id=catalog_id,
             meta_name=meta_name,
-            provenance=OscalCatalogProvenance(
+            provenance=oscal.OscalCatalogProvenance(
                 source_path=in_oscal_catalog,
                 source_url=source_url,
                 license=license_terms,
@@ -142,10 +159,7 @@ def import_scf_catalog_to_control_catalog_yaml(
     stderr = stderr or sys.stderr
 
     try:
-        from crml_lang.integrations.scf import read_scf_catalog_as_crml
-        from crml_lang.yamlio import dump_yaml_to_path
-
-        crml_catalog = read_scf_catalog_as_crml(in_scf_catalog)
+        crml_catalog = _scf_integration().read_scf_catalog_as_crml(in_scf_catalog)
         
         data = crml_catalog.model_dump(by_alias=True, exclude_none=True)
         dump_yaml_to_path(data, out_control_catalog, sort_keys=bool(sort_keys))
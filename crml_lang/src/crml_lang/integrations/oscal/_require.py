@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from typing import Optional, Union
+
+# Outcome of the first dependency check: True once trestle imported, or the
+# ImportError to re-raise. The check never re-runs within a process.
+_checked: Optional[Union[bool, ImportError]] = None
+
 
 def require_oscal() -> None:
     """Ensure the optional OSCAL dependency is available.
@@ -7,10 +13,20 @@ def require_oscal() -> None:
     We use Compliance Trestle as the OSCAL Python model library.
     """
 
-    try:
-        import trestle  # noqa: F401
-    except Exception as exc:  # pragma: no cover
-        raise ImportError(
-            "OSCAL support requires optional dependencies. "
-            "Install with: pip install \"crml-lang[oscal]\""
-        ) from exc
+    global _checked
+    if _checked is True:
+        return
+    if _checked is None:
+        try:
+            import trestle  # noqa: F401
+        except Exception as exc:  # pragma: no cover
+            err = ImportError(
+                "OSCAL support requires optional dependencies. "
+                "Install with: pip install \"crml-lang[oscal]\""
+            )
+            err.__cause__ = exc
+            _checked = err
+        else:
+            _checked = True
+            return
+    raise _checked.with_traceback(None)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
@@ -41,6 +42,42 @@ def _load_mapping_from_json_or_yaml(text: str) -> dict[str, Any]:
     return load_yaml_mapping_from_str(text)
 
 
+def _load_mapping_from_path(path: Path) -> dict[str, Any]:
+    """Parse an OSCAL document, dispatching on the file extension.
+
+    `.json` files go straight to the JSON parser and `.yaml`/`.yml` files to
+    the YAML loader; only unknown extensions pay for the JSON-then-YAML probe.
+    """
+
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        import json
+
+        with path.open("rb") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError("OSCAL JSON document must be an object at top-level")
+        return data
+
+    if suffix in (".yaml", ".yml"):
+        from crml_lang.yamlio import load_yaml_mapping_from_path
+
+        return load_yaml_mapping_from_path(str(path))
+
+    return _load_mapping_from_json_or_yaml(_read_text(path))
+
+
+@lru_cache(maxsize=1)
+def _trestle_catalog_class() -> Any:
+    """Import Trestle's Catalog model once; later calls reuse the cached class."""
+
+    require_oscal()
+
+    from trestle.oscal.catalog import Catalog  # type: ignore
+
+    return Catalog
+
+
 def read_oscal_catalog(path: str | Path):
     """Read an OSCAL Catalog from JSON or YAML.
 
@@ -50,18 +87,19 @@ def read_oscal_catalog(path: str | Path):
         A `trestle.oscal.catalog.Catalog` instance.
     """
 
-    require_oscal()
-
-    from trestle.oscal.catalog import Catalog  # type: ignore
-
+    Catalog = _trestle_catalog_class()
     p = Path(path)
 
     # Prefer Trestle's own read path when available.
     if hasattr(Catalog, "oscal_read"):
         return Catalog.oscal_read(str(p))
 
+    # JSON: let pydantic v2 parse and validate the raw bytes in one pass.
+    if p.suffix.lower() == ".json" and hasattr(Catalog, "model_validate_json"):
+        return Catalog.model_validate_json(p.read_bytes())
+
     # Fallback: parse into dict and construct a model.
-    data = _load_mapping_from_json_or_yaml(_read_text(p))
+    data = _load_mapping_from_path(p)
 
     if hasattr(Catalog, "model_validate"):
         return Catalog.model_validate(data)  # pydantic v2
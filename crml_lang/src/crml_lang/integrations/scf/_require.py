@@ -1,11 +1,25 @@
+import sys
 from importlib.util import find_spec
+from typing import Optional, Union
+
+# Outcome of the first dependency check: True once openpyxl was found, or the
+# ImportError to re-raise. The check never re-runs within a process.
+_checked: Optional[Union[bool, ImportError]] = None
+
 
 def require_scf() -> None:
     """
     Raises ImportError if `openpyxl` is not installed.
     """
-    if find_spec("openpyxl") is None:
-        raise ImportError(
+    global _checked
+    if _checked is True:
+        return
+    if _checked is None:
+        if sys.modules.get("openpyxl") is not None or find_spec("openpyxl") is not None:
+            _checked = True
+            return
+        _checked = ImportError(
             "The 'scf' integration requires `openpyxl`. "
             "Install with: pip install \"crml-lang[scf]\""
         )
+    raise _checked.with_traceback(None)
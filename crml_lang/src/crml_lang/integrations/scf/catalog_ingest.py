@@ -1,9 +1,11 @@
 import logging
+import re
+import string
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from crml_lang.models.control_catalog_model import (
-    ControlCatalogEntry,
     ControlCatalog,
     CRControlCatalog,
 )
@@ -19,102 +21,268 @@ COL_QUESTION = ["Control Question", "Question"]
 COL_DOMAIN = ["Domain", "Family"]
 COL_CAPABILITY = ["Capability"]
 
-def _find_column_index(headers: List[str], candidates: List[str]) -> int:
-    """Return the index of the first matching candidate header, or -1."""
-    if not headers:
-        return -1
-    lower_headers = [h.lower().strip() if h else "" for h in headers]
+# Lowercased once at import; header cells are matched case-insensitively.
+_COL_SCF_ID_LC = tuple(c.lower() for c in COL_SCF_ID)
+_COL_QUESTION_LC = tuple(c.lower() for c in COL_QUESTION)
+_COL_DOMAIN_LC = tuple(c.lower() for c in COL_DOMAIN)
+_COL_CAPABILITY_LC = tuple(c.lower() for c in COL_CAPABILITY)
+
+# The header row is usually not the first one (might be row 2 or 3).
+_HEADER_SCAN_ROWS = 20
+
+# Some producers write bogus `dimension` metadata: "A1:A1" (which truncates
+# read-only iteration to one cell) or the full 1,048,576-row sheet (which
+# pads iteration with empty rows). Past this size the declared dimensions are
+# ignored and only the rows actually present in the XML are read.
+_MAX_TRUSTED_ROWS = 200_000
+# SCF catalogs are contiguous; a run this long of blank rows ends the data.
+_MAX_BLANK_RUN = 50
+
+def _header_positions(row: Any) -> Dict[str, int]:
+    """Map each normalized (lowercased, stripped) header cell to its first column index."""
+    positions: Dict[str, int] = {}
+    for i, h in enumerate(row):
+        if h is not None:
+            positions.setdefault(str(h).lower().strip(), i)
+    return positions
+
+def _find_column_index(headers: Dict[str, int], candidates: Tuple[str, ...]) -> int:
+    """Return the index of the first matching (pre-lowercased) candidate header, or -1."""
     for c in candidates:
-        if c.lower() in lower_headers:
-            return lower_headers.index(c.lower())
+        idx = headers.get(c)
+        if idx is not None:
+            return idx
     return -1
 
-def read_scf_catalog_as_crml(path: Union[str, Path]) -> CRControlCatalog:
-    """
-    Reads an SCF Excel file and converts it to a CRML ControlCatalog.
-    """
-    require_scf()
-    import openpyxl
+def _data_rows(rows: Iterable[Any], first_row: int) -> Iterator[Tuple[int, Any]]:
+    """Yield (sheet row number, row) for the non-blank rows, stopping at the
+    first long run of blank ones. `first_row` is the sheet row of the first
+    item in `rows`."""
+    blank_run = 0
+    for row_number, row in enumerate(rows, start=first_row):
+        if not row or all(v is None for v in row):
+            blank_run += 1
+            if blank_run >= _MAX_BLANK_RUN:
+                return
+            continue
+        blank_run = 0
+        yield row_number, row
 
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"SCF file not found: {path}")
+def _row_fields(
+    row: Any, id_idx: int, question_idx: int, domain_idx: int
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Extract (namespaced id, question, domain) from a data row."""
+    # Rows are not padded to a common width, so bounds-check each column.
+    # Read-only cells are native values: only strings need stripping, and
+    # numbers/dates are stringified as-is.
+    n = len(row)
+    val = row[id_idx] if id_idx < n else None
+    c_id = val.strip() if isinstance(val, str) else (None if val is None else str(val))
+    if not c_id:
+        return None, None, None
 
-    wb = openpyxl.load_workbook(filename=path, read_only=True, data_only=True)
-    
+    # Ensure it has a namespace. CRML demands namespaced IDs.
+    # Also remove spaces from the ID part
+    if " " in c_id:
+        c_id = c_id.replace(" ", "")
+    if ":" not in c_id:
+        c_id = "scf:" + c_id
+
+    val = row[question_idx] if -1 < question_idx < n else None
+    c_question = val.strip() if isinstance(val, str) else (None if val is None else str(val))
+    val = row[domain_idx] if -1 < domain_idx < n else None
+    c_domain = val.strip() if isinstance(val, str) else (None if val is None else str(val))
+    return c_id, c_question, c_domain
+
+def _debug_rows_without_id(
+    rows: Iterable[Tuple[int, Any]], id_idx: int, question_idx: int, domain_idx: int
+) -> Iterator[Tuple[Optional[str], Optional[str], Optional[str]]]:
+    """Extract `_row_fields` from numbered rows, logging the rows that have no id."""
+    for row_number, row in rows:
+        f = _row_fields(row, id_idx, question_idx, domain_idx)
+        if not f[0]:
+            logger.debug("Skipping non-blank SCF row %d: no control id", row_number)
+        yield f
+
+# Fallback header detection for SCF exports whose columns were renamed: the
+# header row is the one whose cells look least like the rows below it, judged
+# by character-class profiles; columns are then identified by their content.
+_HEADER_CANDIDATE_ROWS = 5
+_CHAR_CLASS_TABLE = str.maketrans(
+    {
+        **{c: "0" for c in string.digits},
+        **{c: "A" for c in string.ascii_uppercase},
+        **{c: "a" for c in string.ascii_lowercase},
+        **{c: " " for c in string.whitespace},
+    }
+)
+_SCF_ID_RE = re.compile(r"^[A-Z]{2,4}-\d")
+
+def _char_profile(value: Any) -> Tuple[float, ...]:
+    """Character-class fractions (digit, upper, lower, space, other) and a length term."""
+    text = value if isinstance(value, str) else str(value)
+    n = len(text)
+    if not n:
+        return (0.0,) * 6
+    classes = text.translate(_CHAR_CLASS_TABLE)
+    digits, upper, lower, space = (classes.count(c) for c in "0Aa ")
+    other = n - digits - upper - lower - space
+    return (digits / n, upper / n, lower / n, space / n, other / n, min(n, 100) / 100)
+
+def _outlier_score(row: Any, below: List[Any]) -> float:
+    """Sum over the row's cells of the distance to their column's mean profile below."""
+    score = 0.0
+    for j, value in enumerate(row):
+        if value is None:
+            continue
+        column = [_char_profile(r[j]) for r in below if j < len(r) and r[j] is not None]
+        if not column:
+            continue
+        mean = [sum(p[k] for p in column) / len(column) for k in range(6)]
+        score += sum(abs(a - b) for a, b in zip(_char_profile(value), mean))
+    return score
+
+def _matching_column(rows: List[Any], predicate: Any, exclude: Tuple[int, ...] = ()) -> int:
+    """Index of the column whose non-empty string cells mostly satisfy `predicate`, or -1."""
+    width = max((len(r) for r in rows), default=0)
+    for j in range(width):
+        if j in exclude:
+            continue
+        values = [r[j] for r in rows if j < len(r) and isinstance(r[j], str) and r[j].strip()]
+        if values and sum(1 for v in values if predicate(v.strip())) * 2 >= len(values):
+            return j
+    return -1
+
+def _infer_header(window: List[Any]) -> Optional[Tuple[int, Dict[str, int]]]:
+    """Locate the header row and the id/question/domain columns without known labels."""
+    candidates = [i for i, row in enumerate(window) if row and any(v is not None for v in row)]
+    if len(candidates) < 2:
+        return None
+
+    header_idx = max(
+        candidates[:_HEADER_CANDIDATE_ROWS],
+        key=lambda i: _outlier_score(window[i], [window[k] for k in candidates if k > i]),
+    )
+    data_rows = [window[k] for k in candidates if k > header_idx]
+    id_idx = _matching_column(data_rows, _SCF_ID_RE.match)
+    if id_idx == -1:
+        return None
+
+    headers = _header_positions(window[header_idx])
+    question_idx = _find_column_index(headers, _COL_QUESTION_LC)
+    if question_idx == -1:
+        question_idx = _matching_column(data_rows, lambda v: v.endswith("?"), exclude=(id_idx,))
+    return header_idx, {
+        'id': id_idx,
+        'domain': _find_column_index(headers, _COL_DOMAIN_LC),
+        'question': question_idx,
+        'capability': _find_column_index(headers, _COL_CAPABILITY_LC),
+    }
+
+def _read_scf_controls(wb: Any) -> List[Dict[str, Any]]:
+    """Extract control entry payloads from an open (read-only) SCF workbook.
+
+    Entries are returned as plain dicts and validated together when the
+    `ControlCatalog` is built, in one pass through the compiled validator.
+    """
     # Try to find the relevant sheet. Usually "SCF 20xx" or just the active one.
-    sheet = wb.active
-    # If there's a sheet with "SCF" in the name, prefer that.
-    for sheet_name in wb.sheetnames:
-        if "SCF" in sheet_name and "20" in sheet_name: # Matches "SCF 2024.1" etc.
-            sheet = wb[sheet_name]
-            break
+    # Pick the name first and fetch only the chosen worksheet.
+    sheet_name = next(
+        (name for name in wb.sheetnames if "SCF" in name and "20" in name),  # Matches "SCF 2024.1" etc.
+        None,
+    )
+    sheet = wb[sheet_name] if sheet_name is not None else wb.active
 
-    rows = list(sheet.iter_rows(values_only=True))
-    if not rows:
+    max_row, max_col = sheet.max_row, sheet.max_column
+    if (max_row == 1 and max_col == 1) or (max_row or 0) > _MAX_TRUSTED_ROWS:
+        sheet.reset_dimensions()
+
+    # Stream rows: only the header-scan window is buffered, the data rows are
+    # consumed from the same iterator so the sheet is never held in memory.
+    row_iter = sheet.iter_rows(values_only=True)
+    header_window = list(islice(row_iter, _HEADER_SCAN_ROWS))
+    if not header_window:
         raise ValueError("SCF file seems empty.")
 
     # Find header row (usually not the first one, might be row 2 or 3)
     header_idx = -1
     col_map = {}
 
-    for i, row in enumerate(rows[:20]): # Scan first 20 rows
-        str_row = [str(c) if c is not None else "" for c in row]
-        idx_id = _find_column_index(str_row, COL_SCF_ID)
+    for i, row in enumerate(header_window):
+        headers = _header_positions(row)
+        idx_id = _find_column_index(headers, _COL_SCF_ID_LC)
         
         if idx_id != -1:
             header_idx = i
             col_map['id'] = idx_id
-            col_map['domain'] = _find_column_index(str_row, COL_DOMAIN)
-            col_map['question'] = _find_column_index(str_row, COL_QUESTION)
-            col_map['capability'] = _find_column_index(str_row, COL_CAPABILITY)
+            col_map['domain'] = _find_column_index(headers, _COL_DOMAIN_LC)
+            col_map['question'] = _find_column_index(headers, _COL_QUESTION_LC)
+            col_map['capability'] = _find_column_index(headers, _COL_CAPABILITY_LC)
             break
             
     if header_idx == -1:
-        raise ValueError("Could not identify SCF headers. Looked for 'SCF #'")
+        inferred = _infer_header(header_window)
+        if inferred is None:
+            raise ValueError("Could not identify SCF headers. Looked for 'SCF #'")
+        header_idx, col_map = inferred
+        logger.warning(
+            "No known SCF header labels found; inferred header row %d with columns %s",
+            header_idx + 1,
+            col_map,
+        )
 
-    controls: List[ControlCatalogEntry] = []
+    # Column positions are fixed for the whole sheet; bind them once.
+    id_idx = col_map['id']
+    question_idx = col_map['question']
+    domain_idx = col_map['domain']
 
-    # Iterate data rows
-    for row in rows[header_idx+1:]:
-        if not row:
-            continue
-            
-        def get_val(key):
-            idx = col_map.get(key, -1)
-            if idx != -1 and idx < len(row):
-                val = row[idx]
-                return str(val).strip() if val is not None else None
-            return None
+    # SCF uses a few dozen domains: share one string and one list per domain
+    # (validation copies the list into each entry).
+    domain_tags: Dict[str, List[str]] = {}
 
-        c_id = get_val('id')
-        if not c_id:
-            continue
-            
-        # Ensure it has a namespace. CRML demands namespaced IDs.
-        # Also remove spaces from the ID part
-        c_id = c_id.replace(" ", "")
-        if ":" not in c_id:
-            c_id = f"scf:{c_id}"
+    def tags_for(domain: Optional[str]) -> Optional[List[str]]:
+        if not domain:
+            return None
+        tags = domain_tags.get(domain)
+        if tags is None:
+            tags = domain_tags[domain] = [domain]
+        return tags
 
-        c_question = get_val('question')
-        c_domain = get_val('domain')
-        
+    # Read-only iteration starts at sheet row 1 and yields empty rows for gaps,
+    # so the row after the header is sheet row header_idx + 2.
+    rows = _data_rows(chain(islice(header_window, header_idx + 1, None), row_iter), header_idx + 2)
+    fields: Iterable[Tuple[Optional[str], Optional[str], Optional[str]]]
+    # Diagnostics are checked once per sheet: with DEBUG off, the row loop
+    # carries no logging calls at all.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SCF sheet %r: header at row %d, columns %s", sheet.title, header_idx + 1, col_map)
+        fields = _debug_rows_without_id(rows, id_idx, question_idx, domain_idx)
+    else:
+        fields = (_row_fields(row, id_idx, question_idx, domain_idx) for _, row in rows)
+    return [
         # Use Question as title if available
-        title = c_question if c_question else f"SCF Control {c_id}"
-        
-        tags = []
-        if c_domain:
-            tags.append(c_domain)
-            
-        entry = ControlCatalogEntry(
-            id=c_id,
-            title=title,
-            tags=tags if tags else None,
-        )
-        controls.append(entry)
+        {"id": c_id, "title": c_question or f"SCF Control {c_id}", "tags": tags_for(c_domain)}
+        for c_id, c_question, c_domain in fields
+        if c_id
+    ]
+
+def read_scf_catalog_as_crml(path: Union[str, Path]) -> CRControlCatalog:
+    """
+    Reads an SCF Excel file and converts it to a CRML ControlCatalog.
+    """
+    require_scf()
+    import openpyxl
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"SCF file not found: {path}")
 
-    wb.close()
+    wb = openpyxl.load_workbook(filename=path, read_only=True, data_only=True, keep_links=False)
+    try:
+        controls = _read_scf_controls(wb)
+    finally:
+        # Read-only workbooks keep the archive open until closed.
+        wb.close()
     
     # Construct Catalog
     catalog_payload = ControlCatalog(
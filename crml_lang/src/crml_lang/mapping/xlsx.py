@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, Union
 
 from ..models.control_catalog_model import CRControlCatalog
 from ..models.attack_catalog_model import CRAttackCatalog
@@ -46,78 +51,232 @@ def _doc_meta_columns(*, tags_desc: str) -> List[Tuple[str, str, str]]:
     ]
 
 
-def _xlsx_header_row(ws) -> int:
-    # Mapping sheets created by this exporter hide row 1 (machine keys) and
-    # show row 2 as the human header.
-    return 2 if ws.row_dimensions[1].hidden else 1
+def _doc_meta_cells(meta) -> List[Any]:
+    # Values for `_doc_meta_columns`; constant across a document's rows, so
+    # writers compute them once per document.
+    return [meta.name, meta.version, meta.description, _to_json_export_cell(meta.tags)]
 
 
-def _xlsx_header_index(ws, name: str) -> int:
-    # Machine header row is always row 1.
-    header = [c.value for c in ws[1]]
-    try:
-        return header.index(name) + 1
-    except ValueError as e:
-        raise KeyError(name) from e
+def _xlsx_list_formula(items: List[str]) -> str:
+    # Escape double-quotes for Excel list literals by doubling them.
+    return '"' + ",".join(s.replace('"', '""') for s in items) + '"'
+
+
+# List-validation formulas for the static relationship_type enums, built once.
+_CONTROL_RELATIONSHIP_TYPES_FORMULA = _xlsx_list_formula(
+    [
+        "overlaps_with",
+        "mitigates",
+        "supports",
+        "equivalent_to",
+        "parent_of",
+        "child_of",
+        "backstops",
+    ]
+)
+_ATTACK_CONTROL_RELATIONSHIP_TYPES_FORMULA = _xlsx_list_formula(
+    ["mitigated_by", "detectable_by", "respondable_by"]
+)
+
+
+# Purely-presentational formatting per sheet. This intentionally does not
+# change the workbook schema.
+_SHEET_FORMATS: Dict[str, Dict[str, Any]] = {
+    _SHEET_META: {
+        "column_widths": {"format": 22, "version": 12, "created_at": 22, "header_rows": 12},
+    },
+    _SHEET_CONTROL_CATALOGS: {
+        "column_widths": {
+            "doc_name": 22,
+            "doc_tags_json": 22,
+            "framework": 20,
+            "control_id": 18,
+            "title": 32,
+            "url": 34,
+            "tags_json": 22,
+            "defense_in_depth_layers_json": 22,
+        },
+        "wrap_columns": ["doc_tags_json", "tags_json", "defense_in_depth_layers_json"],
+    },
+    _SHEET_ATTACK_CATALOGS: {
+        "column_widths": {
+            "doc_name": 22,
+            "doc_tags_json": 22,
+            "framework": 26,
+            "attack_id": 18,
+            "title": 40,
+            "url": 34,
+            "tags_json": 22,
+            "phases_json": 22,
+        },
+        "wrap_columns": ["doc_tags_json", "tags_json", "phases_json"],
+    },
+    _SHEET_CONTROL_RELATIONSHIPS: {
+        "column_widths": {
+            "doc_name": 22,
+            "doc_tags_json": 22,
+            "source_id": 18,
+            "target_id": 18,
+            "relationship_type": 16,
+            "overlap_weight": 14,
+            "overlap_dimensions_json": 26,
+            "overlap_rationale": 34,
+            "confidence": 12,
+            "groupings_json": 26,
+            "references_json": 26,
+            "description": 34,
+        },
+        "list_validations": [
+            ("relationship_type", _CONTROL_RELATIONSHIP_TYPES_FORMULA)
+        ],
+        "number_formats": [("overlap_weight", "0.00"), ("confidence", "0.00")],
+        "wrap_columns": [
+            "doc_tags_json",
+            "overlap_dimensions_json",
+            "overlap_rationale",
+            "groupings_json",
+            "description",
+            "references_json",
+        ],
+    },
+    _SHEET_ATTACK_CONTROL_RELATIONSHIPS: {
+        "column_widths": {
+            "doc_name": 22,
+            "doc_tags_json": 22,
+            "attack_id": 18,
+            "control_id": 18,
+            "relationship_type": 16,
+            "strength": 12,
+            "confidence": 12,
+            "tags_json": 22,
+            "references_json": 26,
+            "description": 34,
+            "metadata_json": 26,
+        },
+        "list_validations": [
+            ("relationship_type", _ATTACK_CONTROL_RELATIONSHIP_TYPES_FORMULA)
+        ],
+        "number_formats": [("strength", "0.00"), ("confidence", "0.00")],
+        "wrap_columns": [
+            "doc_tags_json",
+            "description",
+            "tags_json",
+            "references_json",
+            "metadata_json",
+        ],
+    },
+}
+
 
+class _XlsxSheetWriter:
+    """Stream rows into a write-only worksheet.
 
-def _xlsx_set_freeze_and_filter(ws, *, header_row: int, first_body_row: int, get_column_letter) -> None:
-    ws.freeze_panes = f"A{first_body_row}"
-    if ws.max_row >= header_row and ws.max_column >= 1:
-        ws.auto_filter.ref = f"A{header_row}:{get_column_letter(ws.max_column)}{ws.max_row}"
+    Write-only sheets cannot be revisited once a row is flushed, so sheet
+    level settings (freeze panes, widths, hidden machine row) are applied up
+    front, cell styles are attached while appending, and the auto-filter and
+    list validations are added by `finish()` once the row count is known.
 
+    Only the configured `wrap_columns` and `number_formats` columns get styled
+    cells; every other value is written as-is.
+    """
 
-def _xlsx_style_header_row(ws, *, header_row: int, header_fill, header_font, header_align) -> None:
-    for cell in ws[header_row]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_align
+    def __init__(self, wb, title: str, columns: list[tuple[str, str, str]], *, human_header: bool = True) -> None:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.comments import Comment
+        from openpyxl.utils import get_column_letter
+
+        cfg = _SHEET_FORMATS.get(title, {})
+        keys = [c[0] for c in columns]
+        col_index = {k: i for i, k in enumerate(keys)}
+
+        self._ws = ws = wb.create_sheet(title)
+        self._cell = WriteOnlyCell
+        self._header_row = 2 if human_header else 1
+        self._last_col = get_column_letter(len(keys))
+        self._body_rows = 0
+        header_fill, header_font, header_align, wrap_align = _xlsx_styles()
+        number_formats = {
+            col_index[k]: fmt for k, fmt in cfg.get("number_formats", ()) if k in col_index
+        }
+        wrap_cols = {col_index[k] for k in cfg.get("wrap_columns", ()) if k in col_index}
+
+        def _column_style(i: int):
+            # Resolve the column's style ids once; assigning alignment or
+            # number_format per cell re-hashes the style objects every time.
+            template = WriteOnlyCell(ws)
+            if i in wrap_cols:
+                template.alignment = wrap_align
+            if i in number_formats:
+                template.number_format = number_formats[i]
+            return template._style
+
+        self._styled_cols = [(i, _column_style(i)) for i in sorted(wrap_cols | number_formats.keys())]
+        self._validations = [
+            (get_column_letter(col_index[k] + 1), formula)
+            for k, formula in cfg.get("list_validations", ())
+            if k in col_index
+        ]
 
+        ws.freeze_panes = f"A{self._header_row + 1}"
+        for col_name, width in cfg.get("column_widths", {}).items():
+            if col_name in col_index:
+                ws.column_dimensions[get_column_letter(col_index[col_name] + 1)].width = width
+        # Column-level defaults so values typed into these columns later wrap
+        # or pick up the number format too.
+        for i in wrap_cols:
+            ws.column_dimensions[get_column_letter(i + 1)].alignment = wrap_align
+        for i, fmt in number_formats.items():
+            ws.column_dimensions[get_column_letter(i + 1)].number_format = fmt
+
+        header_template = WriteOnlyCell(ws)
+        header_template.fill = header_fill
+        header_template.font = header_font
+        header_template.alignment = header_align
+        header_style = header_template._style
+
+        def _header_cell(value: str, desc: str):
+            cell = WriteOnlyCell(ws, value=value)
+            cell._style = copy(header_style)
+            # A Comment can only be bound to one cell (openpyxl copies bound
+            # ones on assignment), so these are created per cell.
+            if desc:
+                cell.comment = Comment(desc, "crml")
+            return cell
+
+        if human_header:
+            # Row 1: machine keys (hidden)
+            # Row 2: human labels (visible) + comments with descriptions
+            ws.row_dimensions[1].hidden = True
+            ws.append(keys)
+            ws.append([_header_cell(label, desc) for _, label, desc in columns])
+        else:
+            ws.append([_header_cell(key, "") for key in keys])
 
-def _xlsx_wrap_body_cells(ws, *, first_body_row: int, wrap_align) -> None:
-    for row in ws.iter_rows(min_row=first_body_row, max_row=ws.max_row, values_only=False):
-        for cell in row:
-            v = cell.value
+    def append(self, values: list[Any]) -> None:
+        row = list(values)
+        for idx, style in self._styled_cols:
+            v = row[idx]
             if v is None:
                 continue
-            if isinstance(v, str) and ("{" in v or "[" in v or "\n" in v):
-                cell.alignment = wrap_align
+            cell = self._cell(self._ws, value=v)
+            cell._style = copy(style)
+            row[idx] = cell
+        self._ws.append(row)
+        self._body_rows += 1
 
+    def finish(self) -> None:
+        from openpyxl.worksheet.datavalidation import DataValidation
 
-def _xlsx_apply_column_widths(ws, *, widths: dict[str, float], get_column_letter) -> None:
-    for col_name, width in widths.items():
-        try:
-            idx = _xlsx_header_index(ws, col_name)
-        except KeyError:
-            continue
-        ws.column_dimensions[get_column_letter(idx)].width = width
+        hr = self._header_row
+        last_row = hr + self._body_rows
+        self._ws.auto_filter.ref = f"A{hr}:{self._last_col}{last_row}"
+        if not self._body_rows:
+            return
 
-
-def _xlsx_style_sheet(
-    ws,
-    *,
-    header_fill,
-    header_font,
-    header_align,
-    wrap_align,
-    get_column_letter,
-    column_widths: Optional[Dict[str, float]] = None,
-) -> None:
-    hr = _xlsx_header_row(ws)
-    first_body_row = hr + 1
-    _xlsx_set_freeze_and_filter(
-        ws, header_row=hr, first_body_row=first_body_row, get_column_letter=get_column_letter
-    )
-    _xlsx_style_header_row(
-        ws,
-        header_row=hr,
-        header_fill=header_fill,
-        header_font=header_font,
-        header_align=header_align,
-    )
-    _xlsx_wrap_body_cells(ws, first_body_row=first_body_row, wrap_align=wrap_align)
-    if column_widths:
-        _xlsx_apply_column_widths(ws, widths=column_widths, get_column_letter=get_column_letter)
+        for col, formula in self._validations:
+            dv = DataValidation(type="list", formula1=formula, allow_blank=True)
+            dv.add(f"{col}{hr + 1}:{col}{last_row}")
+            self._ws.data_validations.append(dv)
 
 
 def _control_catalog_get_or_create_doc(
@@ -129,8 +288,8 @@ def _control_catalog_get_or_create_doc(
     doc_tags: Any,
     catalog_id: Optional[str],
     framework: str,
+    key: Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]],
 ) -> dict[str, Any]:
-    key = _doc_key(doc_name, doc_version, doc_description, doc_tags, catalog_id)
     container = out_by_doc.get(key)
     if container is None:
         container = {
@@ -158,10 +317,12 @@ def _control_catalog_get_or_create_doc(
     return container
 
 
-def _control_catalog_parse_ref_obj(*, control_id: Optional[str], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    ref_standard = _cell_str(data.get("ref_standard"))
-    ref_control = _cell_str(data.get("ref_control"))
-    ref_requirement = _cell_str(data.get("ref_requirement"))
+def _control_catalog_parse_ref_obj(
+    *, control_id: Optional[str], standard: Any, control: Any, requirement: Any
+) -> Optional[Dict[str, Any]]:
+    ref_standard = _cell_str(standard)
+    ref_control = _cell_str(control)
+    ref_requirement = _cell_str(requirement)
 
     if ref_standard is None and ref_control is None and ref_requirement is None:
         return None
@@ -174,44 +335,10 @@ def _control_catalog_parse_ref_obj(*, control_id: Optional[str], data: Dict[str,
     }
 
 
-def _xlsx_add_list_validation(ws, *, column_name: str, allowed: list[str]) -> None:
-    from openpyxl.utils import get_column_letter
-    from openpyxl.worksheet.datavalidation import DataValidation
-
-    try:
-        col_idx = _xlsx_header_index(ws, column_name)
-    except KeyError:
-        return
-
-    start_row = _xlsx_header_row(ws) + 1
-    if ws.max_row < start_row:
-        return
-
-    # Escape double-quotes for Excel list literals by doubling them.
-    safe_items = [s.replace('"', '""') for s in allowed]
-    formula = '"' + ",".join(safe_items) + '"'
-    dv = DataValidation(type="list", formula1=formula, allow_blank=True)
-    ws.add_data_validation(dv)
-    dv.add(
-        f"{get_column_letter(col_idx)}{start_row}:{get_column_letter(col_idx)}{ws.max_row}"
-    )
-
-
-def _xlsx_number_format(ws, *, column_name: str, fmt: str) -> None:
-    try:
-        col_idx = _xlsx_header_index(ws, column_name)
-    except KeyError:
-        return
-
-    start_row = _xlsx_header_row(ws) + 1
-    for r in range(start_row, ws.max_row + 1):
-        cell = ws.cell(row=r, column=col_idx)
-        if cell.value is None:
-            continue
-        cell.number_format = fmt
-
-
+@lru_cache(maxsize=None)
 def _xlsx_module():
+    # Cached once openpyxl imports; a failed import is not cached, so
+    # installing it later in the same process still works.
     try:
         import openpyxl  # type: ignore
 
@@ -222,15 +349,68 @@ def _xlsx_module():
         ) from e
 
 
+@lru_cache(maxsize=None)
+def _xlsx_styles() -> Tuple[Any, Any, Any, Any]:
+    """Shared (header fill, header font, header alignment, wrap alignment).
+
+    openpyxl style objects are plain values that each workbook interns into
+    its own style table, so one set can serve every sheet and export.
+    """
+
+    from openpyxl.styles import Alignment, Font, PatternFill
+
+    return (
+        PatternFill("solid", fgColor="F2F2F2"),
+        Font(bold=True),
+        Alignment(vertical="top", wrap_text=True),
+        Alignment(vertical="top", wrap_text=True),
+    )
+
+
+# json.dumps() builds a fresh JSONEncoder whenever non-default options are
+# passed; JSON cells are encoded per row, so reuse a single instance.
+# Cell values are plain data dumped from CRML models and cannot contain
+# reference cycles, so skip the encoder's per-container cycle bookkeeping.
+_JSON_CELL_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, check_circular=False)
+_JSON_EXPORT_CELL_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False)
+
+
 def _to_json_cell(value: Any) -> Optional[str]:
+    """Canonical (key-sorted) JSON, for values compared or used as keys."""
     if value is None:
         return None
-    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return _JSON_CELL_ENCODER.encode(value)
+
+
+def _to_json_export_cell(value: Any) -> Optional[str]:
+    """JSON for exported cells.
+
+    Values come from CRML models, whose dict key order is already stable
+    (field declaration order, or the document's own order), so skip sorting.
+    """
+    if value is None:
+        return None
+    return _JSON_EXPORT_CELL_ENCODER.encode(value)
+
+
+# Exported JSON cells are compact documents without surrounding whitespace,
+# so call the decoder's C scanner directly and only go through json.loads
+# (whitespace, trailing data, error reporting) when that does not consume
+# the whole cell.
+_JSON_CELL_SCAN = json.JSONDecoder().scan_once
 
 
 def _from_json_cell(text: Any) -> Any:
     if text is None:
         return None
+    if type(text) is str:
+        try:
+            value, end = _JSON_CELL_SCAN(text, 0)
+        except (StopIteration, ValueError):
+            pass
+        else:
+            if end == len(text):
+                return value
     if isinstance(text, str):
         s = text.strip()
         if s == "":
@@ -239,7 +419,14 @@ def _from_json_cell(text: Any) -> Any:
     raise TypeError(f"Expected JSON cell as string, got {type(text).__name__}")
 
 
+# The cell helpers run once per imported cell. openpyxl hands back exact
+# str/int/float values, so check those by type identity before falling back
+# to the general (subclass-aware) handling.
+
+
 def _cell_str(v: Any) -> Optional[str]:
+    if type(v) is str:
+        return v or None
     if v is None:
         return None
     s = str(v)
@@ -247,8 +434,17 @@ def _cell_str(v: Any) -> Optional[str]:
 
 
 def _cell_float(v: Any) -> Optional[float]:
+    t = type(v)
+    if t is float:
+        return v
     if v is None:
         return None
+    if t is int:
+        return float(v)
+    return _cell_float_slow(v)
+
+
+def _cell_float_slow(v: Any) -> Optional[float]:
     if isinstance(v, (int, float)):
         return float(v)
     if isinstance(v, str):
@@ -260,10 +456,13 @@ def _cell_float(v: Any) -> Optional[float]:
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+    # Whole seconds: truncate the timestamp rather than replace() a datetime.
+    return datetime.fromtimestamp(int(time.time()), timezone.utc).isoformat()
 
 
 def _try_int(v: Any) -> Optional[int]:
+    if type(v) is int:
+        return v
     if v is None:
         return None
     try:
@@ -272,13 +471,17 @@ def _try_int(v: Any) -> Optional[int]:
         return None
 
 
+_UNSAFE_CHARS_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_DASH_RUN_RE = re.compile(r"-+")
+
+
 def _safe_filename(name: str) -> str:
     s = name.strip()
     if not s:
         return "document"
 
-    s = re.sub(r"[^A-Za-z0-9._-]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _UNSAFE_CHARS_RE.sub("-", s)
+    s = _DASH_RUN_RE.sub("-", s).strip("-")
     return s or "document"
 
 
@@ -298,26 +501,98 @@ def _doc_key(
     )
 
 
-def _read_sheet_rows(wb, sheet_name: str, *, header_rows: int) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+def _read_sheet_rows(
+    wb, sheet_name: str, *, header_rows: int
+) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """Return the machine header and a lazy iterator over body rows.
+
+    Body rows are streamed from the sheet rather than buffered, so callers
+    must consume them before the workbook is closed.
+    """
+
     if sheet_name not in wb.sheetnames:
-        return ([], [])
+        return ([], iter(()))
 
     ws = wb[sheet_name]
-    rows = list(ws.iter_rows(values_only=True))
-    if len(rows) <= header_rows:
-        return ([], [])
+    # max_row is unknown (None) for read-only sheets without dimensions.
+    max_row = ws.max_row
+    if max_row is not None and max_row <= header_rows:
+        return ([], iter(()))
+
+    rows = ws.values
+    first = next(rows, None)
+    if first is None:
+        return ([], iter(()))
+    for _ in range(header_rows - 1):
+        next(rows, None)
+
+    header = [str(c) for c in first]
+    return (header, rows)
 
-    header = [str(c) for c in rows[0]]
-    body = list(rows[header_rows:])
-    return (header, body)
 
+_DOC_META_KEYS = ("doc_name", "doc_version", "doc_description", "doc_tags_json")
 
-def _read_doc_meta(data: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str], Any]:
-    doc_name = _cell_str(data.get("doc_name"))
-    doc_version = _cell_str(data.get("doc_version"))
-    doc_description = _cell_str(data.get("doc_description"))
-    doc_tags = _from_json_cell(data.get("doc_tags_json"))
-    return (doc_name, doc_version, doc_description, doc_tags)
+
+def _column_picker(
+    header: List[str], names: Tuple[str, ...]
+) -> Tuple[Callable[[Tuple[Any, ...]], Tuple[Any, ...]], int]:
+    """Build an itemgetter returning the `names` columns of a row, in order.
+
+    Columns absent from the header map to `len(header)`; rows passed through
+    `_padded_rows` with the returned width are long enough for every position
+    and read None there.
+    """
+
+    pos = {name: i for i, name in enumerate(header)}
+    absent = len(header)
+    idx = [pos.get(name, absent) for name in names]
+    return itemgetter(*idx), max(idx) + 1
+
+
+def _padded_rows(rows: Iterable[Tuple[Any, ...]], width: int) -> Iterator[Tuple[Any, ...]]:
+    for row in rows:
+        # Blank rows (e.g. left behind by deleted data) have no document name
+        # and would be skipped by the readers anyway; drop them before any
+        # column parsing.
+        if not row or not any(row):
+            continue
+        n = len(row)
+        if n < width:
+            row = tuple(row) + (None,) * (width - n)
+        yield row
+
+
+_DocIdent = Tuple[
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Any,
+    Optional[str],
+    Optional[Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]]],
+]
+
+
+def _read_doc_ident(cells: Tuple[Any, ...], cache: Dict[Tuple[Any, ...], _DocIdent]) -> _DocIdent:
+    """Parse a row's document meta and payload id, plus its `_doc_key`.
+
+    `cells` starts with the _DOC_META_KEYS columns followed by the payload
+    (catalog/pack) id. Every row of a document repeats these cells verbatim,
+    so results are memoized in `cache` on the raw cell values: tags JSON is
+    decoded and re-encoded once per document instead of once per row. The key
+    is None when the row has no document name.
+    """
+
+    raw = cells[:5]
+    ident = cache.get(raw)
+    if ident is None:
+        doc_name = _cell_str(raw[0])
+        doc_version = _cell_str(raw[1])
+        doc_description = _cell_str(raw[2])
+        doc_tags = _from_json_cell(raw[3])
+        payload_id = _cell_str(raw[4])
+        key = _doc_key(doc_name, doc_version, doc_description, doc_tags, payload_id) if doc_name else None
+        ident = cache[raw] = (doc_name, doc_version, doc_description, doc_tags, payload_id, key)
+    return ident
 
 
 def _get_or_create_container(
@@ -375,11 +650,20 @@ def sheet_name_for_error(payload_key: str) -> str:
     return payload_key
 
 
-def _group_last_or_new(rel_list: list[dict[str, Any]], *, key_field: str, key_value: str, targets_key: str) -> dict[str, Any]:
-    if rel_list and rel_list[-1].get(key_field) == key_value:
-        return rel_list[-1]
-    grouped: dict[str, Any] = {key_field: key_value, targets_key: []}
-    rel_list.append(grouped)
+def _get_or_create_group(
+    groups: dict[str, dict[str, Any]],
+    rel_list: list[dict[str, Any]],
+    *,
+    key_field: str,
+    key_value: str,
+    targets_key: str,
+) -> dict[str, Any]:
+    # Rows of one source need not be adjacent; `groups` indexes the entries
+    # of `rel_list` so they merge in first-seen order.
+    grouped = groups.get(key_value)
+    if grouped is None:
+        grouped = groups[key_value] = {key_field: key_value, targets_key: []}
+        rel_list.append(grouped)
     return grouped
 
 
@@ -410,24 +694,24 @@ def export_xlsx(
 
     openpyxl = _xlsx_module()
 
-    catalogs = list(control_catalogs) + _load_docs_from_paths(
-        control_catalog_paths, CRControlCatalog
-    )
-    attack_catalogs_list = list(attack_catalogs) + _load_docs_from_paths(
-        attack_catalog_paths, CRAttackCatalog
-    )
-    rels = list(control_relationships) + _load_docs_from_paths(
-        control_relationship_paths, CRControlRelationships
-    )
-    attck_rels = list(attack_control_relationships) + _load_docs_from_paths(
-        attack_control_relationship_paths, CRAttackControlRelationships
+    catalogs_from_paths, attack_catalogs_from_paths, rels_from_paths, attck_rels_from_paths = (
+        _load_docs_from_paths(
+            [
+                (control_catalog_paths, CRControlCatalog),
+                (attack_catalog_paths, CRAttackCatalog),
+                (control_relationship_paths, CRControlRelationships),
+                (attack_control_relationship_paths, CRAttackControlRelationships),
+            ]
+        )
     )
+    catalogs = list(control_catalogs) + catalogs_from_paths
+    attack_catalogs_list = list(attack_catalogs) + attack_catalogs_from_paths
+    rels = list(control_relationships) + rels_from_paths
+    attck_rels = list(attack_control_relationships) + attck_rels_from_paths
 
-    wb = openpyxl.Workbook()
-
-    # Remove the default sheet.
-    if wb.worksheets:
-        wb.remove(wb.worksheets[0])
+    # Write-only mode streams each row straight to the sheet XML instead of
+    # keeping a cell object per value in memory until save.
+    wb = openpyxl.Workbook(write_only=True)
 
     _write_meta_sheet(wb)
     _write_control_catalogs_sheet(wb, catalogs)
@@ -435,137 +719,10 @@ def export_xlsx(
     _write_control_relationships_sheet(wb, rels)
     _write_attack_control_relationships_sheet(wb, attck_rels)
 
-    _apply_workbook_formatting(wb)
-
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     wb.save(out_path)
 
 
-def _apply_workbook_formatting(wb) -> None:
-    """Apply purely-presentational formatting to make sheets nicer to use.
-
-    This intentionally does not change the workbook schema.
-    """
-
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-
-    header_fill = PatternFill("solid", fgColor="F2F2F2")
-    header_font = Font(bold=True)
-    header_align = Alignment(vertical="top", wrap_text=True)
-    wrap_align = Alignment(vertical="top", wrap_text=True)
-
-    sheet_configs: list[tuple[str, dict[str, Any]]] = [
-        (
-            _SHEET_META,
-            {
-                "column_widths": {"format": 22, "version": 12, "created_at": 22, "header_rows": 12},
-            },
-        ),
-        (
-            _SHEET_CONTROL_CATALOGS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "framework": 20,
-                    "control_id": 18,
-                    "title": 32,
-                    "url": 34,
-                    "tags_json": 22,
-                    "defense_in_depth_layers_json": 22,
-                },
-            },
-        ),
-        (
-            _SHEET_ATTACK_CATALOGS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "framework": 26,
-                    "attack_id": 18,
-                    "title": 40,
-                    "url": 34,
-                    "tags_json": 22,
-                },
-            },
-        ),
-        (
-            _SHEET_CONTROL_RELATIONSHIPS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "source_id": 18,
-                    "target_id": 18,
-                    "relationship_type": 16,
-                    "overlap_weight": 14,
-                    "overlap_dimensions_json": 26,
-                    "overlap_rationale": 34,
-                    "confidence": 12,
-                    "groupings_json": 26,
-                    "references_json": 26,
-                    "description": 34,
-                },
-                "list_validations": [
-                    (
-                        "relationship_type",
-                        [
-                            "overlaps_with",
-                            "mitigates",
-                            "supports",
-                            "equivalent_to",
-                            "parent_of",
-                            "child_of",
-                            "backstops",
-                        ],
-                    )
-                ],
-                "number_formats": [("overlap_weight", "0.00"), ("confidence", "0.00")],
-            },
-        ),
-        (
-            _SHEET_ATTACK_CONTROL_RELATIONSHIPS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "attack_id": 18,
-                    "control_id": 18,
-                    "relationship_type": 16,
-                    "strength": 12,
-                    "confidence": 12,
-                    "tags_json": 22,
-                    "references_json": 26,
-                    "description": 34,
-                    "metadata_json": 26,
-                },
-                "list_validations": [
-                    ("relationship_type", ["mitigated_by", "detectable_by", "respondable_by"])
-                ],
-                "number_formats": [("strength", "0.00"), ("confidence", "0.00")],
-            },
-        ),
-    ]
-
-    for sheet_name, cfg in sheet_configs:
-        if sheet_name not in wb.sheetnames:
-            continue
-        ws = wb[sheet_name]
-        _xlsx_style_sheet(
-            ws,
-            header_fill=header_fill,
-            header_font=header_font,
-            header_align=header_align,
-            wrap_align=wrap_align,
-            get_column_letter=get_column_letter,
-            column_widths=cfg.get("column_widths"),
-        )
-
-        for col_name, allowed in (cfg.get("list_validations") or []):
-            _xlsx_add_list_validation(ws, column_name=str(col_name), allowed=list(allowed))
-
-        for col_name, fmt in (cfg.get("number_formats") or []):
-            _xlsx_number_format(ws, column_name=str(col_name), fmt=str(fmt))
-
-
 def import_xlsx(source: Union[str, Path, Any]) -> ImportedXlsx:
     """Import CRML documents from an XLSX workbook created by `export_xlsx`.
 
@@ -576,14 +733,25 @@ def import_xlsx(source: Union[str, Path, Any]) -> ImportedXlsx:
 
     openpyxl = _xlsx_module()
 
-    if isinstance(source, (str, Path)):
-        wb = openpyxl.load_workbook(str(source))
-    else:
-        wb = source
-    _validate_meta_sheet(wb)
+    if not isinstance(source, (str, Path)):
+        return _import_workbook(source)
 
-    header_rows = _get_header_rows(wb)
+    # The importer only needs cell values, so stream the sheets lazily and
+    # skip styles/formulas instead of building a full in-memory workbook.
+    wb = openpyxl.load_workbook(str(source), read_only=True, data_only=True)
+    try:
+        return _import_workbook(wb)
+    finally:
+        wb.close()
+
+
+def _import_workbook(wb) -> ImportedXlsx:
+    meta_header, meta_values = _validate_meta_sheet(wb)
 
+    header_rows = _get_header_rows(meta_header, meta_values)
+
+    # The readers validate their assembled dicts with model_validate();
+    # serializing them just to use model_validate_json() measured slower.
     return ImportedXlsx(
         control_catalogs=_read_control_catalogs_sheet(wb, header_rows=header_rows),
         attack_catalogs=_read_attack_catalogs_sheet(wb, header_rows=header_rows),
@@ -592,26 +760,63 @@ def import_xlsx(source: Union[str, Path, Any]) -> ImportedXlsx:
     )
 
 
-def _load_docs_from_paths(paths: Iterable[Union[str, Path]], model_cls) -> List[Any]:
-    if not paths:
-        return []
+_MAX_LOAD_WORKERS = 32
+
+
+def _load_docs_from_paths(groups: List[Tuple[Iterable[Union[str, Path]], Any]]) -> List[List[Any]]:
+    """Load and validate the documents of each (paths, model_cls) group.
+
+    All files are read and parsed concurrently up front; validation then runs
+    on the calling thread in the original order, so the first failing file
+    (in argument order) is the one reported.
+    """
 
     from ..yamlio import load_yaml_mapping_from_path
 
+    def load(path: str) -> Any:
+        try:
+            return load_yaml_mapping_from_path(path)
+        except Exception as e:
+            return e
+
+    materialized = [([str(p) for p in paths], model_cls) for paths, model_cls in groups]
+    all_paths = [p for paths, _ in materialized for p in paths]
+    if len(all_paths) <= 1:
+        loaded = iter([load(p) for p in all_paths])
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(all_paths))) as pool:
+            loaded = iter(list(pool.map(load, all_paths)))
+
     out = []
-    for p in paths:
-        data = load_yaml_mapping_from_path(str(p))
-        out.append(model_cls.model_validate(data))
+    for paths, model_cls in materialized:
+        docs = []
+        for _ in paths:
+            data = next(loaded)
+            if isinstance(data, Exception):
+                raise data
+            docs.append(model_cls.model_validate(data))
+        out.append(docs)
     return out
 
 
 def _write_meta_sheet(wb) -> None:
-    ws = wb.create_sheet(_SHEET_META)
-    ws.append(["format", "version", "created_at", "header_rows"])
+    ws = _XlsxSheetWriter(
+        wb,
+        _SHEET_META,
+        [(k, k, "") for k in ("format", "version", "created_at", "header_rows")],
+        human_header=False,
+    )
     ws.append([_WORKBOOK_FORMAT, _WORKBOOK_VERSION, _now_iso(), 2])
+    ws.finish()
 
 
-def _validate_meta_sheet(wb) -> None:
+def _validate_meta_sheet(wb) -> Tuple[List[Any], List[Any]]:
+    """Check the `_meta` sheet and return its (header, values) rows.
+
+    The rows are returned so callers don't re-read the sheet; in read-only
+    mode every `iter_rows` call parses the sheet XML again.
+    """
+
     if _SHEET_META not in wb.sheetnames:
         raise ValueError("XLSX workbook is missing required sheet '_meta'")
 
@@ -633,23 +838,17 @@ def _validate_meta_sheet(wb) -> None:
         raise ValueError(f"Unsupported workbook format: {fmt!r}")
     if ver != _WORKBOOK_VERSION:
         raise ValueError(f"Unsupported workbook version: {ver!r}")
+    return header, values
 
 
-def _get_header_rows(wb) -> int:
-    """Number of header rows in mapping sheets.
+def _get_header_rows(header: List[Any], values: List[Any]) -> int:
+    """Number of header rows in mapping sheets, from the `_meta` rows.
 
     Current format always uses 2 header rows:
     - Row 1 (hidden): machine keys
     - Row 2 (visible): human labels
     """
 
-    ws = wb[_SHEET_META]
-    rows = list(ws.iter_rows(min_row=1, max_row=2, values_only=True))
-    if len(rows) < 2:
-        return 1
-    header = list(rows[0] or [])
-    values = list(rows[1] or [])
-
     def _get(name: str) -> Any:
         try:
             return values[header.index(name)]
@@ -668,30 +867,10 @@ def _get_header_rows(wb) -> int:
     return 2
 
 
-def _write_human_header(ws, columns: list[tuple[str, str, str]]) -> None:
-    """Write a two-row header.
-
-    Row 1: machine keys (hidden)
-    Row 2: human labels (visible) + comments with descriptions
-    """
-
-    from openpyxl.comments import Comment
-
-    ws.append([c[0] for c in columns])
-    ws.append([c[1] for c in columns])
-
-    ws.row_dimensions[1].hidden = True
-
-    for idx, (_, _, desc) in enumerate(columns, start=1):
-        if not desc:
-            continue
-        ws.cell(row=2, column=idx).comment = Comment(desc, "crml")
-
-
 def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
-    ws = wb.create_sheet(_SHEET_CONTROL_CATALOGS)
-    _write_human_header(
-        ws,
+    ws = _XlsxSheetWriter(
+        wb,
+        _SHEET_CONTROL_CATALOGS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC_EXAMPLE)
         + [
             ("catalog_id", "Catalog id", "Optional catalog identifier (catalog.id)."),
@@ -714,6 +893,7 @@ def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
     for doc in docs:
         meta = doc.meta
         cat = doc.catalog
+        doc_cells = _doc_meta_cells(meta) + [cat.id, cat.framework]
         for entry in cat.controls:
             ref_standard = ref_control = ref_requirement = None
             if entry.ref is not None:
@@ -722,29 +902,25 @@ def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
                 ref_requirement = entry.ref.requirement
 
             ws.append(
-                [
-                    meta.name,
-                    meta.version,
-                    meta.description,
-                    _to_json_cell(meta.tags),
-                    cat.id,
-                    cat.framework,
+                doc_cells
+                + [
                     entry.id,
                     ref_standard,
                     ref_control,
                     ref_requirement,
                     entry.title,
                     entry.url,
-                    _to_json_cell(entry.tags),
-                    _to_json_cell(entry.defense_in_depth_layers),
+                    _to_json_export_cell(entry.tags),
+                    _to_json_export_cell(entry.defense_in_depth_layers),
                 ]
             )
+    ws.finish()
 
 
 def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog]) -> None:
-    ws = wb.create_sheet(_SHEET_ATTACK_CATALOGS)
-    _write_human_header(
-        ws,
+    ws = _XlsxSheetWriter(
+        wb,
+        _SHEET_ATTACK_CATALOGS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("catalog_id", "Catalog id", "Required catalog identifier / namespace (catalog.id)."),
@@ -770,24 +946,21 @@ def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog]) -> None:
     for doc in docs:
         meta = doc.meta
         cat = doc.catalog
+        doc_cells = _doc_meta_cells(meta) + [cat.id, cat.framework]
         for entry in cat.attacks:
             ws.append(
-                [
-                    meta.name,
-                    meta.version,
-                    meta.description,
-                    _to_json_cell(meta.tags),
-                    cat.id,
-                    cat.framework,
+                doc_cells
+                + [
                     entry.id,
                     entry.kind,
                     entry.title,
                     entry.url,
                     entry.parent,
-                    _to_json_cell(entry.tags),
-                    _to_json_cell(entry.phases),
+                    _to_json_export_cell(entry.tags),
+                    _to_json_export_cell(entry.phases),
                 ]
             )
+    ws.finish()
 
 
 def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatalog]:
@@ -796,15 +969,43 @@ def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatal
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
-    for row in body_rows:
-        data = dict(zip(header, row))
+    pick, width = _column_picker(
+        header,
+        _DOC_META_KEYS
+        + (
+            "catalog_id",
+            "framework",
+            "control_id",
+            "ref_standard",
+            "ref_control",
+            "ref_requirement",
+            "title",
+            "url",
+            "tags_json",
+            "defense_in_depth_layers_json",
+        ),
+    )
 
-        doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
+    doc_cache: Dict[Tuple[Any, ...], _DocIdent] = {}
+    for row in _padded_rows(body_rows, width):
+        cells = pick(row)
+        doc_name, doc_version, doc_description, doc_tags, catalog_id, key = _read_doc_ident(cells, doc_cache)
         if not doc_name:
             continue
 
-        catalog_id = _cell_str(data.get("catalog_id"))
-        framework = _cell_str(data.get("framework"))
+        (
+            framework_cell,
+            control_id_cell,
+            ref_standard_cell,
+            ref_control_cell,
+            ref_requirement_cell,
+            title_cell,
+            url_cell,
+            tags_cell,
+            layers_cell,
+        ) = cells[5:]
+
+        framework = _cell_str(framework_cell)
         if not framework:
             raise ValueError(f"control_catalogs row missing framework for doc {doc_name!r}")
 
@@ -816,21 +1017,25 @@ def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatal
             doc_tags=doc_tags,
             catalog_id=catalog_id,
             framework=framework,
+            key=key,
         )
 
-        control_id = _cell_str(data.get("control_id"))
-        ref_obj = _control_catalog_parse_ref_obj(control_id=control_id, data=data)
+        control_id = _cell_str(control_id_cell)
+        ref_obj = _control_catalog_parse_ref_obj(
+            control_id=control_id,
+            standard=ref_standard_cell,
+            control=ref_control_cell,
+            requirement=ref_requirement_cell,
+        )
 
         container["catalog"]["controls"].append(
             {
                 "id": control_id,
                 "ref": ref_obj,
-                "title": _cell_str(data.get("title")),
-                "url": _cell_str(data.get("url")),
-                "tags": _from_json_cell(data.get("tags_json")),
-                "defense_in_depth_layers": _from_json_cell(
-                    data.get("defense_in_depth_layers_json")
-                ),
+                "title": _cell_str(title_cell),
+                "url": _cell_str(url_cell),
+                "tags": _from_json_cell(tags_cell),
+                "defense_in_depth_layers": _from_json_cell(layers_cell),
             }
         )
 
@@ -843,21 +1048,46 @@ def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
-    for row in body_rows:
-        data = dict(zip(header, row))
+    pick, width = _column_picker(
+        header,
+        _DOC_META_KEYS
+        + (
+            "catalog_id",
+            "framework",
+            "attack_id",
+            "kind",
+            "title",
+            "url",
+            "parent",
+            "tags_json",
+            "phases_json",
+        ),
+    )
 
-        doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
+    doc_cache: Dict[Tuple[Any, ...], _DocIdent] = {}
+    for row in _padded_rows(body_rows, width):
+        cells = pick(row)
+        doc_name, doc_version, doc_description, doc_tags, catalog_id, key = _read_doc_ident(cells, doc_cache)
         if not doc_name:
             continue
 
-        catalog_id = _cell_str(data.get("catalog_id"))
-        framework = _cell_str(data.get("framework"))
+        (
+            framework_cell,
+            attack_id_cell,
+            kind_cell,
+            title_cell,
+            url_cell,
+            parent_cell,
+            tags_cell,
+            phases_cell,
+        ) = cells[5:]
+
+        framework = _cell_str(framework_cell)
         if not framework:
             raise ValueError(f"attack_catalogs row missing framework for doc {doc_name!r}")
         if not catalog_id:
             raise ValueError(f"attack_catalogs row missing catalog_id for doc {doc_name!r}")
 
-        key = _doc_key(doc_name, doc_version, doc_description, doc_tags, catalog_id)
         container = out_by_doc.get(key)
         if container is None:
             container = {
@@ -884,13 +1114,13 @@ def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog
 
         container["catalog"]["attacks"].append(
             {
-                "id": _cell_str(data.get("attack_id")),
-                "kind": _cell_str(data.get("kind")),
-                "title": _cell_str(data.get("title")),
-                "url": _cell_str(data.get("url")),
-                "parent": _cell_str(data.get("parent")),
-                "tags": _from_json_cell(data.get("tags_json")),
-                "phases": _from_json_cell(data.get("phases_json")),
+                "id": _cell_str(attack_id_cell),
+                "kind": _cell_str(kind_cell),
+                "title": _cell_str(title_cell),
+                "url": _cell_str(url_cell),
+                "parent": _cell_str(parent_cell),
+                "tags": _from_json_cell(tags_cell),
+                "phases": _from_json_cell(phases_cell),
             }
         )
 
@@ -898,9 +1128,9 @@ def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog
 
 
 def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -> None:
-    ws = wb.create_sheet(_SHEET_CONTROL_RELATIONSHIPS)
-    _write_human_header(
-        ws,
+    ws = _XlsxSheetWriter(
+        wb,
+        _SHEET_CONTROL_RELATIONSHIPS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("pack_id", "Pack id", "Optional relationship pack identifier (relationships.id)."),
@@ -925,25 +1155,19 @@ def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -
         ],
     )
 
-    def _row(meta, pack, rel, target) -> list[Any]:
+    def _row(rel_cells: list[Any], target) -> list[Any]:
         groupings_json = None
         if target.groupings:
-            groupings_json = _to_json_cell([g.model_dump(exclude_none=True) for g in target.groupings])
+            groupings_json = _to_json_export_cell([g.model_dump(exclude_none=True) for g in target.groupings])
         references_json = None
         if target.references:
-            references_json = _to_json_cell([r.model_dump(exclude_none=True) for r in target.references])
-
-        return [
-            meta.name,
-            meta.version,
-            meta.description,
-            _to_json_cell(meta.tags),
-            pack.id,
-            rel.source,
+            references_json = _to_json_export_cell([r.model_dump(exclude_none=True) for r in target.references])
+
+        return rel_cells + [
             target.target,
             target.relationship_type,
             target.overlap.weight,
-            _to_json_cell(target.overlap.dimensions),
+            _to_json_export_cell(target.overlap.dimensions),
             target.overlap.rationale,
             target.confidence,
             groupings_json,
@@ -954,9 +1178,12 @@ def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -
     for doc in docs:
         meta = doc.meta
         pack = doc.relationships
+        doc_cells = _doc_meta_cells(meta) + [pack.id]
         for rel in pack.relationships:
+            rel_cells = doc_cells + [rel.source]
             for target in rel.targets:
-                ws.append(_row(meta, pack, rel, target))
+                ws.append(_row(rel_cells, target))
+    ws.finish()
 
 
 def _read_control_relationships_sheet(
@@ -966,16 +1193,46 @@ def _read_control_relationships_sheet(
     if not header:
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
+    groups_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, dict[str, Any]]] = {}
+
+    pick, width = _column_picker(
+        header,
+        _DOC_META_KEYS
+        + (
+            "pack_id",
+            "source_id",
+            "target_id",
+            "relationship_type",
+            "overlap_weight",
+            "overlap_dimensions_json",
+            "overlap_rationale",
+            "confidence",
+            "groupings_json",
+            "description",
+            "references_json",
+        ),
+    )
 
-    for row in body_rows:
-        data = dict(zip(header, row))
-
-        doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
+    doc_cache: Dict[Tuple[Any, ...], _DocIdent] = {}
+    for row in _padded_rows(body_rows, width):
+        cells = pick(row)
+        doc_name, doc_version, doc_description, doc_tags, pack_id, key = _read_doc_ident(cells, doc_cache)
         if not doc_name:
             continue
-        pack_id = _cell_str(data.get("pack_id"))
 
-        key = _doc_key(doc_name, doc_version, doc_description, doc_tags, pack_id)
+        (
+            source_id_cell,
+            target_id_cell,
+            relationship_type_cell,
+            overlap_weight_cell,
+            overlap_dimensions_cell,
+            overlap_rationale_cell,
+            confidence_cell,
+            groupings_cell,
+            description_cell,
+            references_cell,
+        ) = cells[5:]
+
         container = out_by_doc.get(key)
         if container is None:
             container = {
@@ -992,28 +1249,34 @@ def _read_control_relationships_sheet(
                 },
             }
             out_by_doc[key] = container
+            groups_by_doc[key] = {}
 
-        source_id = _cell_str(data.get("source_id"))
-        target_id = _cell_str(data.get("target_id"))
+        source_id = _cell_str(source_id_cell)
+        target_id = _cell_str(target_id_cell)
         if not source_id or not target_id:
             raise ValueError(f"control_relationships row missing source/target in doc {doc_name!r}")
 
-        overlap_weight = _cell_float(data.get("overlap_weight"))
+        overlap_weight = _cell_float(overlap_weight_cell)
         if overlap_weight is None:
             raise ValueError(
                 f"control_relationships row missing overlap_weight for {source_id!r} -> {target_id!r}"
             )
 
-        relationship_type = _cell_str(data.get("relationship_type"))
-        overlap_dimensions = _from_json_cell(data.get("overlap_dimensions_json"))
-        overlap_rationale = _cell_str(data.get("overlap_rationale"))
-        confidence = _cell_float(data.get("confidence"))
-        groupings = _from_json_cell(data.get("groupings_json"))
-        description = _cell_str(data.get("description"))
-        references = _from_json_cell(data.get("references_json"))
-
-        rel_list = container["relationships"]["relationships"]
-        grouped = _group_last_or_new(rel_list, key_field="source", key_value=source_id, targets_key="targets")
+        relationship_type = _cell_str(relationship_type_cell)
+        overlap_dimensions = _from_json_cell(overlap_dimensions_cell)
+        overlap_rationale = _cell_str(overlap_rationale_cell)
+        confidence = _cell_float(confidence_cell)
+        groupings = _from_json_cell(groupings_cell)
+        description = _cell_str(description_cell)
+        references = _from_json_cell(references_cell)
+
+        grouped = _get_or_create_group(
+            groups_by_doc[key],
+            container["relationships"]["relationships"],
+            key_field="source",
+            key_value=source_id,
+            targets_key="targets",
+        )
 
         grouped["targets"].append(
             {
@@ -1037,9 +1300,9 @@ def _read_control_relationships_sheet(
 def _write_attack_control_relationships_sheet(
     wb, docs: list[CRAttackControlRelationships]
 ) -> None:
-    ws = wb.create_sheet(_SHEET_ATTACK_CONTROL_RELATIONSHIPS)
-    _write_human_header(
-        ws,
+    ws = _XlsxSheetWriter(
+        wb,
+        _SHEET_ATTACK_CONTROL_RELATIONSHIPS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("pack_id", "Pack id", "Optional relationship pack identifier (relationships.id)."),
@@ -1062,30 +1325,29 @@ def _write_attack_control_relationships_sheet(
     for doc in docs:
         meta = doc.meta
         pack = doc.relationships
+        doc_cells = _doc_meta_cells(meta) + [pack.id]
+        metadata_json = _to_json_export_cell(pack.metadata)
         for rel in pack.relationships:
+            rel_cells = doc_cells + [rel.attack]
             for tgt in rel.targets:
                 ws.append(
-                    [
-                        meta.name,
-                        meta.version,
-                        meta.description,
-                        _to_json_cell(meta.tags),
-                        pack.id,
-                        rel.attack,
+                    rel_cells
+                    + [
                         tgt.control,
                         tgt.relationship_type,
                         tgt.strength,
                         tgt.confidence,
                         tgt.description,
-                        _to_json_cell(tgt.tags),
-                        _to_json_cell(
+                        _to_json_export_cell(tgt.tags),
+                        _to_json_export_cell(
                             [r.model_dump(exclude_none=True) for r in (tgt.references or [])]
                         )
                         if tgt.references
                         else None,
-                        _to_json_cell(pack.metadata),
+                        metadata_json,
                     ]
                 )
+    ws.finish()
 
 
 def _read_attack_control_relationships_sheet(
@@ -1095,18 +1357,51 @@ def _read_attack_control_relationships_sheet(
     if not header:
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
+    groups_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, dict[str, Any]]] = {}
+
+    pick, width = _column_picker(
+        header,
+        _DOC_META_KEYS
+        + (
+            "pack_id",
+            "attack_id",
+            "control_id",
+            "relationship_type",
+            "strength",
+            "confidence",
+            "description",
+            "tags_json",
+            "references_json",
+            "metadata_json",
+        ),
+    )
 
-    for row in body_rows:
-        data = dict(zip(header, row))
-
-        doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
+    doc_cache: Dict[Tuple[Any, ...], _DocIdent] = {}
+    metadata_cache: Dict[Any, Any] = {}
+    for row in _padded_rows(body_rows, width):
+        cells = pick(row)
+        doc_name, doc_version, doc_description, doc_tags, pack_id, key = _read_doc_ident(cells, doc_cache)
         if not doc_name:
             continue
 
-        pack_id = _cell_str(data.get("pack_id"))
-        metadata = _from_json_cell(data.get("metadata_json"))
+        (
+            attack_id_cell,
+            control_id_cell,
+            relationship_type_cell,
+            strength_cell,
+            confidence_cell,
+            description_cell,
+            tags_cell,
+            references_cell,
+            metadata_cell,
+        ) = cells[5:]
+
+        metadata_raw = metadata_cell
+        if metadata_raw in metadata_cache:
+            metadata = metadata_cache[metadata_raw]
+        else:
+            metadata = metadata_cache[metadata_raw] = _from_json_cell(metadata_raw)
 
-        key = _doc_key(doc_name, doc_version, doc_description, doc_tags, pack_id)
         container = out_by_doc.get(key)
         if container is None:
             container = {
@@ -1124,28 +1419,34 @@ def _read_attack_control_relationships_sheet(
                 },
             }
             out_by_doc[key] = container
+            groups_by_doc[key] = {}
         else:
             if container["relationships"].get("metadata") != metadata:
                 raise ValueError(
                     f"attack_control_relationships sheet has conflicting metadata for doc {doc_name!r}"
                 )
 
-        attack_id = _cell_str(data.get("attack_id"))
-        control_id = _cell_str(data.get("control_id"))
-        relationship_type = _cell_str(data.get("relationship_type"))
+        attack_id = _cell_str(attack_id_cell)
+        control_id = _cell_str(control_id_cell)
+        relationship_type = _cell_str(relationship_type_cell)
         if not attack_id or not control_id or not relationship_type:
             raise ValueError(
                 f"attack_control_relationships row missing required fields in doc {doc_name!r}"
             )
 
-        strength = _cell_float(data.get("strength"))
-        confidence = _cell_float(data.get("confidence"))
-        description = _cell_str(data.get("description"))
-        tags = _from_json_cell(data.get("tags_json"))
-        references = _from_json_cell(data.get("references_json"))
-
-        rel_list = container["relationships"]["relationships"]
-        grouped = _group_last_or_new(rel_list, key_field="attack", key_value=attack_id, targets_key="targets")
+        strength = _cell_float(strength_cell)
+        confidence = _cell_float(confidence_cell)
+        description = _cell_str(description_cell)
+        tags = _from_json_cell(tags_cell)
+        references = _from_json_cell(references_cell)
+
+        grouped = _get_or_create_group(
+            groups_by_doc[key],
+            container["relationships"]["relationships"],
+            key_field="attack",
+            key_value=attack_id,
+            targets_key="targets",
+        )
 
         grouped["targets"].append(
             {
@@ -1175,6 +1476,8 @@ def write_imported_as_yaml(
     out = []
     Path(out_dir).mkdir(parents=True, exist_ok=True)
 
+    # model_dump() output goes straight to the YAML emitter, which dominates
+    # the cost here; model_dump_json() would only add a JSON round-trip.
     def _write(doc_type: str, doc_name: str, payload: dict[str, Any]) -> str:
         base = _safe_filename(doc_name)
         path = str(Path(out_dir) / f"{base}-{doc_type}.yaml")
@@ -1,23 +1,63 @@
-from .simulation_result import (
-	Artifact,
-	CurrencyUnit,
-	EngineInfo,
-	HistogramArtifact,
-	InputInfo,
-	Measure,
-	ResultPayload,
-	RunInfo,
-	SamplesArtifact,
-	CRSimulationResult,
-	Units,
-)
-
-from .scenario_model import CRScenario
-from .assessment_model import CRAssessment
-from .control_catalog_model import CRControlCatalog
-from .attack_catalog_model import CRAttackCatalog
-from .control_relationships_model import CRControlRelationships
-from .portfolio_model import CRPortfolio
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+	from .assessment_model import CRAssessment
+	from .attack_catalog_model import CRAttackCatalog
+	from .control_catalog_model import CRControlCatalog
+	from .control_relationships_model import CRControlRelationships
+	from .portfolio_model import CRPortfolio
+	from .scenario_model import CRScenario
+	from .simulation_result import (
+		Artifact,
+		CRSimulationResult,
+		CurrencyUnit,
+		EngineInfo,
+		HistogramArtifact,
+		InputInfo,
+		Measure,
+		ResultPayload,
+		RunInfo,
+		SamplesArtifact,
+		Units,
+	)
+
+# Resolved on first access so importing one model module does not import
+# (and build schemas for) every other document model.
+_LAZY_EXPORTS = {
+	"Artifact": ".simulation_result",
+	"CurrencyUnit": ".simulation_result",
+	"EngineInfo": ".simulation_result",
+	"HistogramArtifact": ".simulation_result",
+	"InputInfo": ".simulation_result",
+	"Measure": ".simulation_result",
+	"ResultPayload": ".simulation_result",
+	"RunInfo": ".simulation_result",
+	"SamplesArtifact": ".simulation_result",
+	"CRSimulationResult": ".simulation_result",
+	"Units": ".simulation_result",
+	"CRScenario": ".scenario_model",
+	"CRAssessment": ".assessment_model",
+	"CRControlCatalog": ".control_catalog_model",
+	"CRAttackCatalog": ".attack_catalog_model",
+	"CRControlRelationships": ".control_relationships_model",
+	"CRPortfolio": ".portfolio_model",
+}
+
+
+def __getattr__(name: str) -> Any:
+	module_name = _LAZY_EXPORTS.get(name)
+	if module_name is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+	value = getattr(import_module(module_name, __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
 	"Artifact",
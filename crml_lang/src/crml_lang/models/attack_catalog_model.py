@@ -4,15 +4,13 @@ from typing import Annotated, List, Literal, Optional, Set
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .control_ref import NamespacedId
 from .scenario_model import Meta
 
 
 AttackId = Annotated[
-    str,
+    NamespacedId,
     Field(
-        min_length=1,
-        max_length=256,
-        pattern=r"^[a-z][a-z0-9_-]{0,31}:[^\s]{1,223}$",
         description=(
             "Attack identifier in canonical namespaced form 'namespace:key' (no whitespace). "
             "The namespace is expected to match the attack catalog's catalog.id."
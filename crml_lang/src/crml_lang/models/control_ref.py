@@ -25,12 +25,16 @@ Examples:
 """
 
 
+NAMESPACED_ID_PATTERN = r"^[a-z][a-z0-9_-]{0,31}:[^\s]{1,223}$"
+
+# Shared base of ControlId, AttckId and AttackId: the length and pattern
+# constraints are declared once and enforced by pydantic-core.
+NamespacedId = Annotated[str, Field(min_length=1, max_length=256, pattern=NAMESPACED_ID_PATTERN)]
+
+
 ControlId = Annotated[
-    str,
+    NamespacedId,
     Field(
-        min_length=1,
-        max_length=256,
-        pattern=r"^[a-z][a-z0-9_-]{0,31}:[^\s]{1,223}$",
         description=(
             "Canonical unique control id in the form 'namespace:key' (no whitespace). "
             "Examples: cap:edr, cisv8:4.2, iso27001:2022:A.5.1"
@@ -38,7 +42,7 @@ ControlId = Annotated[
         json_schema_extra={
             # NOTE: Attack-pattern ids (e.g. ATT&CK) must use the dedicated AttckId/attack models.
             # This prevents accidentally treating attack ids like controls in control-to-control mapping packs.
-            "not": {"pattern": "^attck:"}
+            "not": {"pattern": "^attck:"},
         },
     ),
     AfterValidator(lambda v: (_raise_if_attck_namespace(v))),
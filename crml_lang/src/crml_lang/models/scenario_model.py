@@ -20,16 +20,13 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from pydantic.json_schema import WithJsonSchema
 
 from .numberish import parse_floatish, parse_float_list
-from .control_ref import ControlId
+from .control_ref import ControlId, NamespacedId
 from .coverage_model import Coverage
 
 
 AttckId = Annotated[
-    str,
+    NamespacedId,
     Field(
-        min_length=1,
-        max_length=256,
-        pattern=r"^[a-z][a-z0-9_-]{0,31}:[^\s]{1,223}$",
         description=(
             "ATT&CK identifier in canonical namespaced form 'namespace:key' (no whitespace). "
             "Recommended namespace is 'attck'. Examples: attck:TA0001, attck:T1059, attck:T1059.003"
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import io
+import threading
+from functools import lru_cache
 from typing import Any
 
 
 _ERR_PYYAML_REQUIRED = "PyYAML is required: pip install pyyaml"
 
+_DUMP_BUFFERS = threading.local()
+
 
 def _yaml_module():
     """Import and return the PyYAML module.
@@ -22,35 +27,107 @@ def _yaml_module():
         raise ImportError(_ERR_PYYAML_REQUIRED) from e
 
 
-def load_yaml_mapping_from_str(text: str) -> dict[str, Any]:
-    """Parse YAML text and require a mapping/object at the root."""
+@lru_cache(maxsize=1)
+def _safe_loader() -> Any:
+    """Return the libyaml-backed safe loader when available.
+
+    `CSafeLoader` is only present when PyYAML was built against libyaml; fall
+    back to the pure-Python `SafeLoader` otherwise. Resolved once per process.
+    """
 
     yaml = _yaml_module()
-    data = yaml.safe_load(text)
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
+
+def _require_mapping(data: Any) -> dict[str, Any]:
     if not isinstance(data, dict):
         raise ValueError("YAML document must be a mapping/object at top-level")
 
     return data
 
 
+def load_yaml_mapping_from_str(text: str) -> dict[str, Any]:
+    """Parse YAML text and require a mapping/object at the root."""
+
+    yaml = _yaml_module()
+    return _require_mapping(yaml.load(text, Loader=_safe_loader()))
+
+
+def load_yaml_mapping_from_bytes(data: bytes) -> dict[str, Any]:
+    """Parse raw YAML bytes and require a mapping/object at the root.
+
+    The parser detects the encoding itself (UTF-8/UTF-16, BOM-aware), so callers
+    that already hold the file contents need not decode them first.
+    """
+
+    yaml = _yaml_module()
+    return _require_mapping(yaml.load(data, Loader=_safe_loader()))
+
+
 def load_yaml_mapping_from_path(path: str) -> dict[str, Any]:
-    """Read YAML file and require a mapping/object at the root."""
+    """Read YAML file and require a mapping/object at the root.
+
+    The file is opened in binary mode and handed to the parser directly, so
+    libyaml decodes the bytes itself (UTF-8/UTF-16, BOM-aware) without a
+    Python-level text layer or an intermediate string.
+    """
+
+    yaml = _yaml_module()
+    with open(path, "rb") as f:
+        return _require_mapping(yaml.load(f, Loader=_safe_loader()))
+
+
+@lru_cache(maxsize=1)
+def _safe_dumper() -> Any:
+    """Return the libyaml-backed safe dumper when available (see `_safe_loader`)."""
+
+    yaml = _yaml_module()
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _thread_dump_buffer() -> io.StringIO:
+    """Return this thread's reusable dump buffer, emptied."""
+
+    buf = getattr(_DUMP_BUFFERS, "buf", None)
+    if buf is None:
+        buf = _DUMP_BUFFERS.buf = io.StringIO()
+    buf.seek(0)
+    buf.truncate(0)
+    return buf
 
-    with open(path, "r", encoding="utf-8") as f:
-        return load_yaml_mapping_from_str(f.read())
 
+def dump_yaml_to_str(data: Any, *, sort_keys: bool = False, reuse_buffer: bool = False) -> str:
+    """Serialize data to YAML.
 
-def dump_yaml_to_str(data: Any, *, sort_keys: bool = False) -> str:
-    """Serialize data to YAML."""
+    With `reuse_buffer=True` the emitter writes into a per-thread `StringIO`
+    that is kept between calls, avoiding a fresh buffer for every dump in
+    hot loops.
+    """
 
     yaml = _yaml_module()
-    return yaml.safe_dump(data, sort_keys=sort_keys, allow_unicode=True)
+    if not reuse_buffer:
+        return yaml.dump(data, Dumper=_safe_dumper(), sort_keys=sort_keys, allow_unicode=True)
+
+    buf = _thread_dump_buffer()
+    yaml.dump(data, buf, Dumper=_safe_dumper(), sort_keys=sort_keys, allow_unicode=True)
+    return buf.getvalue()
 
 
 def dump_yaml_to_path(data: Any, path: str, *, sort_keys: bool = False) -> None:
-    """Serialize data to YAML at the given file path."""
+    """Serialize data to YAML at the given file path.
+
+    Events are emitted straight to the open file; no intermediate string is
+    built. The file is opened in binary mode and the emitter encodes to UTF-8
+    itself, bypassing Python's text-encoding layer.
+    """
 
     yaml = _yaml_module()
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=sort_keys, allow_unicode=True)
+    with open(path, "wb") as f:
+        yaml.dump(
+            data,
+            f,
+            Dumper=_safe_dumper(),
+            sort_keys=sort_keys,
+            allow_unicode=True,
+            encoding="utf-8",
+        )
@@ -3,8 +3,7 @@ from __future__ import annotations
 from crml_engine.runtime import run_portfolio_bundle_simulation
 
 
-def test_run_portfolio_bundle_simulation_from_yaml_str() -> None:
-    bundle_yaml = """
+_BUNDLE_YAML = """
 crml_portfolio_bundle: "1.0"
 portfolio_bundle:
   portfolio:
@@ -42,6 +41,10 @@ portfolio_bundle:
   assessments: []
 """.lstrip()
 
+
+def test_run_portfolio_bundle_simulation_from_yaml_str() -> None:
+    bundle_yaml = _BUNDLE_YAML
+
     res = run_portfolio_bundle_simulation(bundle_yaml, source_kind="yaml", n_runs=200, seed=123)
     assert res.success is True
     assert res.metrics is not None
@@ -51,3 +54,15 @@ portfolio_bundle:
     assert res.metrics.max is not None
     assert res.metrics.eal > 0.0
     assert res.metrics.max > 0.0
+
+
+def test_run_portfolio_bundle_simulation_trusted_matches_validated() -> None:
+    from crml_lang import CRPortfolioBundle
+
+    canonical = CRPortfolioBundle.load_from_yaml_str(_BUNDLE_YAML).dump_to_yaml_str()
+
+    validated = run_portfolio_bundle_simulation(canonical, source_kind="yaml", n_runs=200, seed=7)
+    trusted = run_portfolio_bundle_simulation(canonical, source_kind="yaml", n_runs=200, seed=7, trusted=True)
+
+    assert trusted.success is True
+    assert trusted.metrics == validated.metrics
@@ -68,3 +68,68 @@ portfolio_bundle:
     assert res.metrics is not None
     assert res.metrics.eal is not None
     assert res.metrics.eal > 0
+
+
+def test_control_multipliers_combine_state_effectiveness_and_coverage():
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from crml_engine.runtime import _control_multipliers_for_scenario
+
+    def ctrl(cid, eff, cov, affects):
+        return SimpleNamespace(
+            id=cid,
+            combined_implementation_effectiveness=eff,
+            combined_coverage_value=cov,
+            affects=affects,
+        )
+
+    sc = SimpleNamespace(
+        controls=[
+            ctrl("a", 0.5, 1.0, "frequency"),
+            ctrl("b", 0.4, 0.5, "both"),
+            ctrl("c", 0.0, 1.0, "severity"),
+            ctrl("d", 0.5, None, "severity"),
+        ]
+    )
+    state = {
+        "a": np.array([1.0, 0.0, 1.0, 0.0]),
+        "b": np.array([1.0, 1.0, 0.0, 0.0]),
+        # Not referenced by the scenario, so never read (its length would not stack).
+        "unused": np.array([1.0]),
+    }
+
+    freq_mult, sev_mult = _control_multipliers_for_scenario(sc, state, 4)
+
+    np.testing.assert_allclose(freq_mult, [0.4, 0.8, 0.5, 1.0])
+    np.testing.assert_allclose(sev_mult, [0.4, 0.4, 0.5, 0.5])
+
+
+def test_control_multipliers_handle_full_strength_and_long_chains():
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from crml_engine.runtime import _control_multipliers_for_scenario
+
+    def ctrl(cid, eff):
+        return SimpleNamespace(
+            id=cid,
+            combined_implementation_effectiveness=eff,
+            combined_coverage_value=1.0,
+            affects="frequency",
+        )
+
+    blocking = SimpleNamespace(controls=[ctrl("full", 1.0)])
+    long_chain = SimpleNamespace(controls=[ctrl(f"c{i}", 0.9) for i in range(200)])
+    state = {"full": np.array([1.0, 0.0])}
+    state.update({f"c{i}": np.array([1.0, 1.0]) for i in range(200)})
+
+    blocking_freq, blocking_sev = _control_multipliers_for_scenario(blocking, state, 2)
+    chain_freq, chain_sev = _control_multipliers_for_scenario(long_chain, state, 2)
+
+    np.testing.assert_array_equal(blocking_freq, [0.0, 1.0])
+    np.testing.assert_allclose(chain_freq, [0.1**200] * 2, rtol=1e-9)
+    np.testing.assert_array_equal(blocking_sev, np.ones(2))
+    np.testing.assert_array_equal(chain_sev, np.ones(2))
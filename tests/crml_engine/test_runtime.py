@@ -148,3 +148,37 @@ scenario:
     assert eal_single is not None
     assert eal_mu is not None
     assert abs(eal_single - eal_mu) / max(1.0, eal_single) < 0.02
+
+
+def test_run_simulation_cli_json_output(valid_bundle_file, capsys):
+    import json
+
+    from crml_engine.runtime import run_simulation_cli
+
+    assert run_simulation_cli(valid_bundle_file, n_runs=50, output_format="json") is True
+    out = json.loads(capsys.readouterr().out)
+    assert out["success"] is True
+    assert out["metrics"]["eal"] is not None
+
+
+def test_run_simulation_cli_json_keeps_non_finite_values(valid_bundle_file, capsys, monkeypatch):
+    import json
+    import math
+
+    import crml_engine.runtime as runtime
+    from crml_engine.models.result_model import Metadata, Metrics
+
+    def fake_run_portfolio_bundle_simulation(*args, **kwargs):
+        return SimulationResult(
+            success=True,
+            metrics=Metrics(eal=float("nan"), max=float("inf")),
+            metadata=Metadata(runs=1, control_details={"reduction": float("-inf")}),
+        )
+
+    monkeypatch.setattr(runtime, "run_portfolio_bundle_simulation", fake_run_portfolio_bundle_simulation)
+
+    assert runtime.run_simulation_cli(valid_bundle_file, n_runs=1, output_format="json") is True
+    out = json.loads(capsys.readouterr().out)
+    assert math.isnan(out["metrics"]["eal"])
+    assert out["metrics"]["max"] == math.inf
+    assert out["metadata"]["control_details"]["reduction"] == -math.inf
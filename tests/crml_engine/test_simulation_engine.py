@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 from crml_engine.simulation.frequency import FrequencyEngine
 from crml_engine.simulation.severity import SeverityEngine
-from crml_engine.simulation.engine import run_monte_carlo
+from crml_engine.simulation.engine import run_monte_carlo, _aggregate_severities_by_count
 from crml_engine.models.fx_model import FXConfig, DEFAULT_FX_RATES
 
 # --- Frequency Tests ---
@@ -91,6 +91,15 @@ def test_severity_generation_lognormal():
 
 # --- Engine Tests ---
 
+def test_aggregate_severities_by_count_handles_zero_count_runs():
+    counts = np.array([0, 2, 0, 0, 3, 1, 0])
+    severities = np.array([1.0, 2.0, 10.0, 20.0, 30.0, 5.0])
+
+    losses = _aggregate_severities_by_count(counts, severities)
+
+    assert losses.tolist() == [0.0, 3.0, 0.0, 0.0, 60.0, 5.0, 0.0]
+
+
 def test_full_engine_execution(tmp_path):
     # Minimal valid CRML
     content = """
@@ -120,3 +129,234 @@ scenario:
     assert result.metrics.eal is not None
     assert result.metrics.eal > 0
     assert result.metadata.model_name == "test-model"
+
+
+def test_seeded_run_does_not_touch_global_numpy_rng(valid_crml_content):
+    np.random.seed(123)
+    expected = np.random.random()
+
+    np.random.seed(123)
+    run_monte_carlo(valid_crml_content, n_runs=100, seed=42)
+
+    assert np.random.random() == expected
+
+
+def test_parallel_engine_execution_is_reproducible(monkeypatch):
+    import crml_engine.simulation.engine as engine
+
+    monkeypatch.setattr(engine, "PARALLEL_MIN_RUNS_PER_WORKER", 100)
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "test-model"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 2.0}
+  severity:
+    model: lognormal
+    parameters: {median: 1000, sigma: 1.0}
+"""
+    mult = np.linspace(0.5, 1.0, 400)
+    kwargs = dict(n_runs=400, seed=7, raw_data_limit=None, severity_loss_multiplier=mult, num_workers=2)
+
+    first = run_monte_carlo(content, **kwargs)
+    second = run_monte_carlo(content, **kwargs)
+
+    assert first.success is True, first.errors
+    assert first.distribution.raw_data == second.distribution.raw_data
+    assert len(first.distribution.raw_data) == 400
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_parallel_engine_does_not_fork_a_threaded_process(monkeypatch):
+    import threading
+    import warnings
+
+    import crml_engine.simulation.engine as engine
+
+    monkeypatch.setattr(engine, "PARALLEL_MIN_RUNS_PER_WORKER", 100)
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "test-model"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 2.0}
+  severity:
+    model: lognormal
+    parameters: {median: 1000, sigma: 1.0}
+"""
+    # A live background thread, as with the bundler/loader thread pools; a
+    # fork() here emits the multi-threaded fork DeprecationWarning. os.fork
+    # cannot raise it as an error, so record warnings to observe it.
+    release = threading.Event()
+    worker = threading.Thread(target=release.wait)
+    worker.start()
+    try:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", DeprecationWarning)
+            result = run_monte_carlo(content, n_runs=400, seed=7, raw_data_limit=None, num_workers=2)
+    finally:
+        release.set()
+        worker.join()
+
+    assert result.success is True, result.errors
+    assert not [w for w in caught if "fork()" in str(w.message)]
+    assert len(result.distribution.raw_data) == 400
+
+
+def test_linear_histogram_matches_numpy():
+    from crml_engine.simulation.utils import linear_histogram
+
+    values = np.random.default_rng(0).lognormal(5.0, 2.0, 10_000)
+    counts, edges = linear_histogram(values, bins=50, lo=0.0, hi=float(values.max()))
+    expected_counts, expected_edges = np.histogram(values, bins=50, range=(0.0, float(values.max())))
+
+    assert counts.tolist() == expected_counts.tolist()
+    np.testing.assert_allclose(edges, expected_edges)
+
+
+def test_linear_histogram_matches_numpy_on_bin_edges():
+    from crml_engine.simulation.utils import linear_histogram
+
+    for dtype in (np.float64, np.float32):
+        for lo, hi, bins in [(0.1, 0.7, 6), (0.0, 1.0, 10), (0.3, 2.9, 13), (1.0, 1e6, 100)]:
+            edges = np.linspace(lo, hi, bins + 1, dtype=dtype)
+            # Every edge plus its neighbouring floats inside the range.
+            values = np.concatenate(
+                [edges, np.nextafter(edges[1:], dtype(-np.inf)), np.nextafter(edges[:-1], dtype(np.inf))]
+            )
+            counts, got_edges = linear_histogram(values, bins=bins, lo=lo, hi=hi)
+            expected_counts, expected_edges = np.histogram(values, bins=bins, range=(lo, hi))
+
+            assert counts.tolist() == expected_counts.tolist()
+            assert got_edges.dtype == expected_edges.dtype
+
+
+def test_float32_internal_dtype_matches_float64_metrics():
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "test-model"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 3.0}
+  severity:
+    model: lognormal
+    parameters: {median: 50000, sigma: 1.5}
+"""
+    r64 = run_monte_carlo(content, n_runs=20_000, seed=11)
+    r32 = run_monte_carlo(content, n_runs=20_000, seed=11, internal_dtype=np.float32)
+
+    assert r32.success is True, r32.errors
+    for field in ("eal", "var_95", "var_99", "var_999", "median", "max", "std_dev"):
+        assert getattr(r32.metrics, field) == pytest.approx(getattr(r64.metrics, field), rel=1e-5)
+
+
+def test_chunked_severity_sampling_matches_single_chunk(monkeypatch):
+    import crml_engine.simulation.engine as engine
+
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "test-model"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 4.0}
+  severity:
+    model: gamma
+    parameters: {shape: 2.0, scale: 1000}
+"""
+    whole = run_monte_carlo(content, n_runs=2_000, seed=3, raw_data_limit=None)
+    monkeypatch.setattr(engine, "SEVERITY_CHUNK_EVENTS", 37)
+    chunked = run_monte_carlo(content, n_runs=2_000, seed=3, raw_data_limit=None)
+
+    assert chunked.success is True, chunked.errors
+    assert chunked.distribution.raw_data == whole.distribution.raw_data
+
+
+def test_is_file_path_skips_inline_documents(tmp_path):
+    from crml_engine.simulation.utils import is_file_path
+
+    f = tmp_path / "model.yaml"
+    f.write_text("crml_scenario: '1.0'\n")
+
+    assert is_file_path(str(f)) is True
+    assert is_file_path(str(tmp_path / "missing.yaml")) is False
+    assert is_file_path("crml_scenario: '1.0'\nmeta: {}\n") is False
+    assert is_file_path("x" * 100_000) is False
+
+
+def test_is_file_path_accepts_filenames_starting_with_yaml_markers(tmp_path, monkeypatch):
+    from crml_engine.simulation.utils import is_file_path
+
+    monkeypatch.chdir(tmp_path)
+    for name in ("[draft] scenario.yaml", "#1.yaml", "{tenant}.yaml", "---.yaml"):
+        (tmp_path / name).write_text("crml_scenario: '1.0'\n")
+        assert is_file_path(name) is True
+
+
+def test_all_zero_losses_produce_canned_metrics(valid_crml_content):
+    result = run_monte_carlo(valid_crml_content, n_runs=500, seed=1, frequency_rate_multiplier=0.0, raw_data_limit=10)
+
+    assert result.success is True, result.errors
+    assert result.metrics.eal == 0.0
+    assert result.metrics.var_999 == 0.0
+    assert result.metrics.std_dev == 0.0
+    assert result.distribution.bins == [0.0, 1.0]
+    assert result.distribution.frequencies == [500]
+    assert result.distribution.raw_data == [0.0] * 10
+
+
+def test_metrics_only_run_skips_distribution(valid_crml_content):
+    full = run_monte_carlo(valid_crml_content, n_runs=1_000, seed=5)
+    metrics_only = run_monte_carlo(valid_crml_content, n_runs=1_000, seed=5, include_distribution=False)
+    no_raw = run_monte_carlo(valid_crml_content, n_runs=1_000, seed=5, raw_data_limit=0)
+
+    assert metrics_only.metrics == full.metrics
+    assert metrics_only.distribution.bins == []
+    assert metrics_only.distribution.raw_data == []
+    assert no_raw.distribution.raw_data == []
+    assert no_raw.distribution.frequencies == full.distribution.frequencies
+
+
+def test_streaming_metrics_approximate_exact_quantiles():
+    from crml_engine.simulation.streaming import StreamingMetrics
+
+    values = np.random.default_rng(2).lognormal(10.0, 2.0, 200_000)
+    values[::3] = 0.0
+
+    summary = StreamingMetrics()
+    for chunk in np.array_split(values, 7):
+        part = StreamingMetrics()
+        part.add(chunk)
+        summary.merge(part)
+    metrics = summary.to_metrics()
+
+    assert metrics.eal == pytest.approx(float(np.mean(values)), rel=1e-9)
+    assert metrics.std_dev == pytest.approx(float(np.std(values)), rel=1e-9)
+    assert metrics.max == float(np.max(values))
+    for q, field in ((0.5, "median"), (0.95, "var_95"), (0.99, "var_99")):
+        assert getattr(metrics, field) == pytest.approx(float(np.quantile(values, q)), rel=0.025)
+
+
+def test_streaming_run_monte_carlo_returns_metrics_only(monkeypatch, valid_crml_content):
+    import crml_engine.simulation.engine as engine
+
+    monkeypatch.setattr(engine, "STREAMING_MIN_RUNS", 1_000)
+    monkeypatch.setattr(engine, "STREAMING_CHUNK_RUNS", 1_500)
+    exact = run_monte_carlo(valid_crml_content, n_runs=6_000, seed=9)
+    streamed = run_monte_carlo(valid_crml_content, n_runs=6_000, seed=9, streaming_metrics=True)
+
+    assert streamed.success is True, streamed.errors
+    assert streamed.distribution.raw_data == []
+    assert streamed.metrics.eal == pytest.approx(exact.metrics.eal, rel=0.1)
+    assert streamed.metrics.var_95 == pytest.approx(exact.metrics.var_95, rel=0.1)
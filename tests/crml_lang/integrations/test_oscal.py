@@ -0,0 +1,20 @@
+import json
+
+from crml_lang.integrations.oscal.catalog_ingest import _load_mapping_from_path
+
+
+def test_load_mapping_dispatches_on_extension(tmp_path):
+    doc = {"catalog": {"uuid": "u-1", "metadata": {"title": "Example"}}}
+
+    json_path = tmp_path / "catalog.json"
+    json_path.write_text(json.dumps(doc), encoding="utf-8")
+
+    yaml_path = tmp_path / "catalog.yaml"
+    yaml_path.write_text("catalog:\n  uuid: u-1\n  metadata:\n    title: Example\n", encoding="utf-8")
+
+    other_path = tmp_path / "catalog.txt"
+    other_path.write_text(json.dumps(doc), encoding="utf-8")
+
+    assert _load_mapping_from_path(json_path) == doc
+    assert _load_mapping_from_path(yaml_path) == doc
+    assert _load_mapping_from_path(other_path) == doc
@@ -75,3 +75,225 @@ def test_empty_rows(tmp_path):
     assert len(catalog.catalog.controls) == 2
     assert catalog.catalog.controls[0].id == "scf:AC-1"
     assert catalog.catalog.controls[1].id == "scf:AC-2"
+
+
+def test_require_scf_caches_outcome(monkeypatch):
+    from crml_lang.integrations.scf import _require
+
+    monkeypatch.setattr(_require, "_checked", None)
+    _require.require_scf()
+    assert _require._checked is True
+
+    def fail(name):
+        raise AssertionError("dependency check should be cached")
+
+    monkeypatch.setattr(_require, "find_spec", fail)
+    _require.require_scf()
+
+    err = ImportError("missing")
+    monkeypatch.setattr(_require, "_checked", err)
+    with pytest.raises(ImportError) as first:
+        _require.require_scf()
+    with pytest.raises(ImportError) as second:
+        _require.require_scf()
+    assert first.value is second.value is err
+
+
+def test_read_scf_catalog_streams_rows_past_header_window(tmp_path):
+    """Data rows beyond the header scan window are still read, in order."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Secure Controls Framework"])
+    ws.append([])
+    ws.append(["SCF #", "Control Question", "Domain"])
+    for i in range(50):
+        ws.append([f"GOV-{i:02d}", f"Q{i}", "Governance"])
+
+    path = tmp_path / "scf_long.xlsx"
+    wb.save(path)
+
+    catalog = read_scf_catalog_as_crml(str(path))
+    assert [c.id for c in catalog.catalog.controls] == [f"scf:GOV-{i:02d}" for i in range(50)]
+
+
+@pytest.mark.parametrize("bogus_ref", ["A1:A1", "A1:C1048576"])
+def test_read_scf_catalog_ignores_bogus_sheet_dimensions(tmp_path, bogus_ref):
+    """Wrong `dimension` metadata neither truncates nor pads the rows read."""
+    import re
+    import zipfile
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SCF #", "Control Question", "Domain"])
+    ws.append(["AC-1", "Q1", "D1"])
+    ws.append(["AC-2", "Q2", "D2"])
+    good = tmp_path / "good.xlsx"
+    wb.save(good)
+
+    path = tmp_path / "bogus.xlsx"
+    with zipfile.ZipFile(good) as src, zipfile.ZipFile(path, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = re.sub(rb'<dimension ref="[^"]*"', f'<dimension ref="{bogus_ref}"'.encode(), data)
+            dst.writestr(item, data)
+
+    catalog = read_scf_catalog_as_crml(str(path))
+    assert [c.id for c in catalog.catalog.controls] == ["scf:AC-1", "scf:AC-2"]
+
+
+def test_read_scf_catalog_closes_workbook_on_error(tmp_path, monkeypatch):
+    import openpyxl
+
+    wb = Workbook()
+    wb.active.append(["Wrong Column"])
+    path = tmp_path / "bad.xlsx"
+    wb.save(path)
+
+    opened = []
+    real_load = openpyxl.load_workbook
+
+    def tracking_load(*args, **kwargs):
+        opened.append(real_load(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(openpyxl, "load_workbook", tracking_load)
+    with pytest.raises(ValueError):
+        read_scf_catalog_as_crml(str(path))
+    assert opened[0]._archive.fp is None
+
+
+def test_read_scf_catalog_handles_missing_columns_and_short_rows(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Control Question", "SCF #"])
+    ws.append(["Q1", "AC-1"])
+    ws.append([None, "AC-2"])
+    path = tmp_path / "scf_sparse.xlsx"
+    wb.save(path)
+
+    catalog = read_scf_catalog_as_crml(str(path))
+    controls = catalog.catalog.controls
+    assert [(c.id, c.title, c.tags) for c in controls] == [
+        ("scf:AC-1", "Q1", None),
+        ("scf:AC-2", "SCF Control scf:AC-2", None),
+    ]
+
+
+def test_read_scf_catalog_stringifies_non_text_cells(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SCF #", "Control Question", "Domain"])
+    ws.append([101, "  Padded question  ", 7])
+    path = tmp_path / "scf_numeric.xlsx"
+    wb.save(path)
+
+    control = read_scf_catalog_as_crml(str(path)).catalog.controls[0]
+    assert (control.id, control.title, control.tags) == ("scf:101", "Padded question", ["7"])
+
+
+def test_read_scf_catalog_still_validates_entries(tmp_path):
+    """Entries are validated in one batch, but invalid ids are still rejected."""
+    from pydantic import ValidationError
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SCF #", "Control Question"])
+    ws.append(["AC-1", "Q1"])
+    ws.append(["BAD NS:AC-2", "Q2"])
+    path = tmp_path / "scf_invalid.xlsx"
+    wb.save(path)
+
+    with pytest.raises(ValidationError):
+        read_scf_catalog_as_crml(str(path))
+
+
+def test_read_scf_catalog_prefers_versioned_scf_sheet(tmp_path):
+    wb = Workbook()
+    wb.active.title = "Notes"
+    wb.active.append(["nothing here"])
+    ws = wb.create_sheet("SCF 2025.1")
+    ws.append(["SCF #", "Control Question"])
+    ws.append(["AC-1", "Q1"])
+    path = tmp_path / "scf_multi.xlsx"
+    wb.save(path)
+
+    catalog = read_scf_catalog_as_crml(str(path))
+    assert [c.id for c in catalog.catalog.controls] == ["scf:AC-1"]
+
+
+def test_read_scf_catalog_domain_tags_are_independent_lists(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SCF #", "Control Question", "Domain"])
+    ws.append(["AC-1", "Q1", "Access"])
+    ws.append(["AC-2", "Q2", "Access"])
+    path = tmp_path / "scf_domains.xlsx"
+    wb.save(path)
+
+    first, second = read_scf_catalog_as_crml(str(path)).catalog.controls
+    assert first.tags == second.tags == ["Access"]
+    first.tags.append("extra")
+    assert second.tags == ["Access"]
+
+
+def test_read_scf_catalog_infers_renamed_headers(tmp_path):
+    """Without known labels, the header row and columns are inferred from content."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Secure Controls Framework export"])
+    ws.append(["Area", "Identifier", "Wording", "Notes"])
+    ws.append(["Governance", "GOV-01", "Is a governance program documented?", "n/a"])
+    ws.append(["Governance", "GOV-02", "Are policies published and reviewed?", "annual"])
+    ws.append(["Network Security", "NET-01", "Is network traffic monitored?", "n/a"])
+    path = tmp_path / "scf_renamed.xlsx"
+    wb.save(path)
+
+    controls = read_scf_catalog_as_crml(str(path)).catalog.controls
+    assert [(c.id, c.title) for c in controls] == [
+        ("scf:GOV-01", "Is a governance program documented?"),
+        ("scf:GOV-02", "Are policies published and reviewed?"),
+        ("scf:NET-01", "Is network traffic monitored?"),
+    ]
+
+
+def test_read_scf_catalog_unlabeled_without_id_column_fails(tmp_path):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "Value"])
+    ws.append(["alpha", 1])
+    ws.append(["beta", 2])
+    path = tmp_path / "not_scf.xlsx"
+    wb.save(path)
+
+    with pytest.raises(ValueError, match="Could not identify SCF headers"):
+        read_scf_catalog_as_crml(str(path))
+
+
+def test_read_scf_catalog_debug_logs_rows_without_id(tmp_path, caplog):
+    import logging
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["SCF #", "Control Question"])
+    ws.append(["AC-1", "Q1"])
+    ws.append([None, None])
+    ws.append([None, "orphan question"])
+    ws.cell(row=7, column=2).value = "late orphan"
+    path = tmp_path / "scf_debug.xlsx"
+    wb.save(path)
+
+    logger_name = "crml_lang.integrations.scf.catalog_ingest"
+    read_scf_catalog_as_crml(str(path))
+    assert not [r for r in caplog.records if r.name == logger_name]
+
+    with caplog.at_level(logging.DEBUG, logger=logger_name):
+        catalog = read_scf_catalog_as_crml(str(path))
+    assert len(catalog.catalog.controls) == 1
+    messages = [r.getMessage() for r in caplog.records if r.name == logger_name]
+    assert any("header at row 1" in m for m in messages)
+    # Logged rows are sheet rows, counting the blank and missing rows in between.
+    assert [m for m in messages if "no control id" in m] == [
+        "Skipping non-blank SCF row 4: no control id",
+        "Skipping non-blank SCF row 7: no control id",
+    ]
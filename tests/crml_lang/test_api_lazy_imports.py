@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import crml_lang
+from crml_lang import api
+
+
+def test_import_does_not_build_document_models() -> None:
+    src = Path(__file__).resolve().parents[2] / "crml_lang" / "src"
+    code = (
+        "import sys; sys.path.insert(0, sys.argv[1]); import crml_lang; "
+        "print(sorted(m for m in sys.modules if m.startswith('crml_lang.models.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code, str(src)], capture_output=True, text=True, check=True)
+
+    assert out.stdout.strip() == "[]"
+
+
+def test_lazy_document_classes_are_stable() -> None:
+    assert crml_lang.CRScenario is api.CRScenario
+    assert crml_lang.CRPortfolioBundle.__name__ == "CRPortfolioBundle"
+    assert crml_lang.CRPortfolioBundle.__module__ == "crml_lang.api"
+    assert "CRAssessment" in dir(crml_lang)
+
+
+def test_yaml_load_reuses_parent_schema(valid_crml_content: str) -> None:
+    from crml_lang.models.scenario_model import CRScenario as _CRScenario
+
+    cls = api._build_document_class("CRScenario")
+    scenario = cls.load_from_yaml_str(valid_crml_content)
+
+    assert type(scenario) is cls
+    assert cls.__pydantic_serializer__ is _CRScenario.__pydantic_serializer__
+    assert cls.__pydantic_complete__ is False
+    assert "lambda:" in scenario.dump_to_yaml_str()
+
+
+def test_document_classes_add_no_instance_slots() -> None:
+    from crml_lang.models.scenario_model import CRScenario as _CRScenario
+
+    assert api.CRScenario.__basicsize__ == _CRScenario.__basicsize__
+    assert "__slots__" in vars(api.CRScenario)
+
+
+def test_concurrent_first_access_builds_one_class(monkeypatch) -> None:
+    import threading
+    import time
+
+    monkeypatch.delitem(api.__dict__, "CRAssessment", raising=False)
+    build = api._build_document_class
+
+    def slow_build(name: str) -> type:
+        time.sleep(0.05)
+        return build(name)
+
+    monkeypatch.setattr(api, "_build_document_class", slow_build)
+
+    barrier = threading.Barrier(4)
+    results: list[type] = []
+
+    def first_access() -> None:
+        barrier.wait()
+        results.append(api.CRAssessment)
+
+    threads = [threading.Thread(target=first_access) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 4
+    assert all(cls is results[0] for cls in results)
@@ -55,3 +55,10 @@ portfolio:
     assert stderr.getvalue() == ""
     assert out_path.exists() is True
     assert "Wrote" in stdout.getvalue()
+
+    from crml_lang import CRPortfolioBundle
+
+    text = out_path.read_text(encoding="utf-8")
+    assert "warnings:" not in text
+    bundle = CRPortfolioBundle.load_from_yaml(str(out_path))
+    assert bundle.portfolio_bundle.scenarios[0].id == "s1"
@@ -75,3 +75,35 @@ catalog:
     report = validate_control_catalog(yaml_text, source_kind="yaml")
     assert report.ok is False
     assert any("defense" in e.path.lower() or "defense" in e.message.lower() for e in report.errors)
+
+
+def test_control_id_pattern_is_enforced_by_model() -> None:
+    import pytest
+    from pydantic import ValidationError
+
+    from crml_lang.models.control_catalog_model import ControlCatalogEntry
+
+    assert ControlCatalogEntry(id="cisv8:4.2").id == "cisv8:4.2"
+    for bad in ("no-namespace", "CIS:4.2", "cisv8:4 2", "cisv8:4.2\n"):
+        with pytest.raises(ValidationError, match="should match pattern"):
+            ControlCatalogEntry(id=bad)
+
+
+def test_control_id_pattern_error_matches_field_pattern_constraint() -> None:
+    from typing import Annotated
+
+    import pytest
+    from pydantic import Field, TypeAdapter, ValidationError
+
+    from crml_lang.models.attack_catalog_model import AttackId
+    from crml_lang.models.control_ref import NAMESPACED_ID_PATTERN, ControlId
+
+    def errors(annotation) -> list:
+        with pytest.raises(ValidationError) as exc:
+            TypeAdapter(annotation).validate_python("CIS:4.2")
+        return exc.value.errors(include_url=False)
+
+    expected = errors(Annotated[str, Field(pattern=NAMESPACED_ID_PATTERN)])
+    assert expected[0]["type"] == "string_pattern_mismatch"
+    assert errors(ControlId) == expected
+    assert errors(AttackId) == expected
@@ -264,3 +264,204 @@ def test_validate_portfolio_bundle_errors_when_portfolio_references_assessments_
         "Portfolio references 'portfolio.assessments'" in e.message and "control-assessment.yaml" in e.message
         for e in report.errors
     )
+
+
+def test_bundle_dump_omits_only_empty_warnings(valid_bundle_content: str) -> None:
+    from crml_lang.api import CRPortfolioBundle
+    from crml_lang.models.portfolio_bundle import BundleMessage
+
+    bundle = CRPortfolioBundle.load_from_yaml_str(valid_bundle_content)
+    assert "warnings" not in bundle.dump_to_yaml_str()
+
+    bundle.portfolio_bundle.warnings = [BundleMessage(level="warning", path="x", message="careful")]
+    assert "careful" in bundle.dump_to_yaml_str()
+
+
+def test_bundle_portfolio_prefetch_inlines_packs_and_reports_missing(tmp_path) -> None:
+    from pathlib import Path
+
+    examples = Path(__file__).resolve().parents[2] / "examples"
+    portfolio_text = (examples / "portfolios" / "lesson-03a-org-controls-phishing.yaml").read_text(encoding="utf-8")
+    portfolio_text = portfolio_text.replace("../", f"{examples.as_posix()}/")
+    portfolio_text = portfolio_text.replace(
+        "  assessments:\n",
+        "    - missing-catalog.yaml\n  assessments:\n",
+    )
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(portfolio_text, encoding="utf-8")
+
+    report = bundle_portfolio(str(portfolio_path), source_kind="path")
+
+    assert report.ok is True
+    assert report.bundle is not None
+    payload = report.bundle.portfolio_bundle
+    assert len(payload.control_catalogs) == 1
+    assert len(payload.assessments) == 1
+    assert [w.path for w in report.warnings] == ["portfolio.control_catalogs[1]"]
+    assert "missing-catalog.yaml" in report.warnings[0].message
+
+
+def test_load_yaml_file_cache_invalidates_on_change(tmp_path) -> None:
+    from crml_lang.bundling import portfolio_bundler
+
+    p = tmp_path / "doc.yaml"
+    p.write_text("a: 1\n", encoding="utf-8")
+
+    first = portfolio_bundler._load_yaml_file(str(p))
+    assert portfolio_bundler._load_yaml_file(str(p)) is first
+
+    p.write_text("a: 22\n", encoding="utf-8")
+    assert portfolio_bundler._load_yaml_file(str(p)) == {"a": 22}
+
+
+def test_load_validated_returns_fresh_model_per_call(tmp_path) -> None:
+    from crml_lang.bundling import portfolio_bundler
+    from crml_lang.models.control_catalog_model import CRControlCatalog
+
+    p = tmp_path / "catalog.yaml"
+    text = """
+crml_control_catalog: "1.0"
+meta: {name: "c"}
+catalog:
+  framework: "Org"
+  controls:
+    - id: "org:a"
+""".lstrip()
+    p.write_text(text, encoding="utf-8")
+
+    first = portfolio_bundler._load_validated(str(p), CRControlCatalog, None)
+    second = portfolio_bundler._load_validated(str(p), CRControlCatalog, None)
+    assert second is not first
+    first.meta.name = "mutated"
+    assert second.meta.name == "c"
+
+    p.write_text(text + '    - id: "org:b"\n', encoding="utf-8")
+    changed = portfolio_bundler._load_validated(str(p), CRControlCatalog, None)
+    assert [c.id for c in changed.catalog.controls] == ["org:a", "org:b"]
+
+
+def test_bundle_portfolio_reuses_provided_documents_without_revalidation() -> None:
+    from pathlib import Path
+
+    from crml_lang.api import CRControlCatalog
+
+    examples = Path(__file__).resolve().parents[2] / "examples"
+    catalog = CRControlCatalog.load_from_yaml(str(examples / "control_catalogs" / "lesson-org-control-catalog.yaml"))
+
+    provided = [catalog]
+    report = bundle_portfolio(
+        str(examples / "portfolios" / "lesson-03a-org-controls-phishing.yaml"),
+        control_catalogs=provided,
+    )
+
+    assert report.ok is True
+    assert report.bundle.portfolio_bundle.control_catalogs[0] is catalog
+    assert len(report.bundle.portfolio_bundle.control_catalogs) == 2
+    assert provided == [catalog]
+
+
+def test_bundle_portfolio_reads_duplicate_references_once(tmp_path, monkeypatch) -> None:
+    from pathlib import Path
+
+    from crml_lang.bundling import portfolio_bundler
+
+    examples = Path(__file__).resolve().parents[2] / "examples"
+    (tmp_path / "sub").mkdir()
+    for name, src in [
+        ("catalog.yaml", examples / "control_catalogs" / "lesson-org-control-catalog.yaml"),
+        ("assessment.yaml", examples / "control_assessments" / "lesson-org-control-assessment.yaml"),
+        ("scenario.yaml", examples / "scenarios" / "lesson-02-phishing-org-controls.yaml"),
+    ]:
+        (tmp_path / name).write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
+
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(
+        """
+crml_portfolio: "1.0"
+meta: {name: "dupes"}
+portfolio:
+  semantics: {method: sum}
+  assets:
+    - name: employees
+      cardinality: 120
+    - name: endpoints
+      cardinality: 180
+  control_catalogs: [catalog.yaml, sub/../catalog.yaml]
+  assessments: [assessment.yaml]
+  scenarios:
+    - id: phishing
+      path: scenario.yaml
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    loaded: list[str] = []
+    real_read = portfolio_bundler._read_file_bytes
+
+    def counting_read(path: str, size: int) -> bytes:
+        loaded.append(path)
+        return real_read(path, size)
+
+    monkeypatch.setattr(portfolio_bundler, "_read_file_bytes", counting_read)
+
+    report = bundle_portfolio(str(portfolio_path), source_kind="path")
+
+    assert report.ok is True
+    assert len(report.bundle.portfolio_bundle.control_catalogs) == 2
+    assert sorted(Path(p).name for p in loaded) == ["assessment.yaml", "catalog.yaml", "portfolio.yaml", "scenario.yaml"]
+
+
+def test_bundle_portfolio_model_mode_warns_on_pack_paths_without_reading(monkeypatch) -> None:
+    from pathlib import Path
+
+    from crml_lang.bundling import portfolio_bundler
+
+    examples = Path(__file__).resolve().parents[2] / "examples"
+    source = bundle_portfolio(str(examples / "portfolios" / "lesson-03a-org-controls-phishing.yaml"))
+    payload = source.bundle.portfolio_bundle
+
+    def fail(*args, **kwargs):
+        raise AssertionError("model-mode must not touch the filesystem")
+
+    monkeypatch.setattr(portfolio_bundler, "_prefetch_yaml_files", fail)
+    monkeypatch.setattr(portfolio_bundler, "_inline_category", fail)
+
+    report = bundle_portfolio(
+        payload.portfolio,
+        source_kind="model",
+        scenarios={s.id: s.scenario for s in payload.scenarios},
+        control_catalogs=list(payload.control_catalogs),
+    )
+
+    assert report.ok is True
+    assert report.bundle.portfolio_bundle.control_catalogs == payload.control_catalogs
+    assert report.bundle.portfolio_bundle.assessments == []
+    assert [w.path for w in report.warnings] == ["portfolio.control_catalogs[0]", "portfolio.assessments[0]"]
+
+
+def test_bundle_portfolio_model_mode_warnings_serialize_like_validated_messages() -> None:
+    import warnings
+
+    from crml_lang.models.portfolio_bundle import BundleMessage
+
+    portfolio = CRPortfolio.load_from_yaml_str(
+        """
+crml_portfolio: "1.0"
+meta: {name: "p"}
+portfolio:
+  semantics: {method: sum}
+  control_catalogs: [a.yaml, b.yaml]
+  scenarios: []
+""".lstrip()
+    )
+
+    report = bundle_portfolio(portfolio, source_kind="model", scenarios={})
+
+    assert report.ok is True
+    assert [w.path for w in report.warnings] == ["portfolio.control_catalogs[0]", "portfolio.control_catalogs[1]"]
+    for w in report.warnings:
+        assert BundleMessage.model_validate(w.model_dump()) == w
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = report.bundle.model_dump(mode="json")
+    assert [w["level"] for w in dumped["portfolio_bundle"]["warnings"]] == ["warning", "warning"]
@@ -210,3 +210,220 @@ relationships:
     assert len(imported.attack_catalogs) == 1
     assert len(imported.control_relationships) == 1
     assert len(imported.attack_control_relationships) == 1
+
+
+def test_xlsx_export_keeps_sheet_formatting(tmp_path) -> None:
+    yaml_text = """
+crml_control_relationships: "1.0"
+meta:
+  name: "demo-relationships"
+relationships:
+  relationships:
+    - source: "cisv8:4.2"
+      targets:
+        - target: "cap:secure-config"
+          relationship_type: "mitigates"
+          overlap:
+            weight: 0.8
+            dimensions:
+              coverage: 0.9
+"""
+
+    doc = CRControlRelationships.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_relationships=[doc])
+
+    wb = openpyxl.load_workbook(str(out_xlsx))
+    ws = wb["control_relationships"]
+    assert ws.row_dimensions[1].hidden
+    assert ws.freeze_panes == "A3"
+    assert ws.auto_filter.ref == "A2:O3"
+    assert ws["A2"].font.b
+    assert ws["A2"].comment is not None
+    assert ws["I3"].number_format == "0.00"
+    assert ws.column_dimensions["I"].number_format == "0.00"
+    assert ws["J3"].alignment.wrap_text
+    assert [str(dv.sqref) for dv in ws.data_validations.dataValidation] == ["H3"]
+
+    meta = wb["_meta"]
+    assert not meta.row_dimensions[1].hidden
+    assert meta.auto_filter.ref == "A1:D2"
+
+
+def test_xlsx_import_header_only_sheets(tmp_path) -> None:
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx))
+
+    imported = import_xlsx(str(out_xlsx))
+    assert imported.control_catalogs == []
+    assert imported.attack_catalogs == []
+    assert imported.control_relationships == []
+    assert imported.attack_control_relationships == []
+
+
+def test_xlsx_import_tolerates_missing_optional_columns(tmp_path) -> None:
+    yaml_text = """
+crml_control_catalog: "1.0"
+meta:
+  name: "demo-catalog"
+catalog:
+  framework: "CIS v8"
+  controls:
+    - id: "cisv8:4.2"
+      title: "Secure configuration"
+"""
+
+    doc = CRControlCatalog.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_catalogs=[doc])
+
+    wb = openpyxl.load_workbook(str(out_xlsx))
+    ws = wb["control_catalogs"]
+    header = [c.value for c in ws[1]]
+    # Drop the optional URL column and the trailing JSON column.
+    ws.delete_cols(header.index("defense_in_depth_layers_json") + 1)
+    ws.delete_cols(header.index("url") + 1)
+
+    imported = import_xlsx(wb)
+    assert imported.control_catalogs[0].model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
+
+
+def test_xlsx_import_decodes_doc_meta_once_per_document(tmp_path, monkeypatch) -> None:
+    from crml_lang.mapping import xlsx as xlsx_mod
+
+    yaml_text = """
+crml_control_catalog: "1.0"
+meta:
+  name: "demo-catalog"
+  tags: ["community"]
+catalog:
+  framework: "CIS v8"
+  controls:
+    - id: "cisv8:4.1"
+    - id: "cisv8:4.2"
+    - id: "cisv8:4.3"
+"""
+
+    doc = CRControlCatalog.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_catalogs=[doc])
+
+    calls = []
+    real_doc_key = xlsx_mod._doc_key
+    monkeypatch.setattr(xlsx_mod, "_doc_key", lambda *a: calls.append(a) or real_doc_key(*a))
+
+    imported = import_xlsx(str(out_xlsx))
+    assert len(calls) == 1
+    assert imported.control_catalogs[0].model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
+
+
+def test_xlsx_import_path_uses_read_only_workbook_and_closes_it(tmp_path, monkeypatch) -> None:
+    out_xlsx = tmp_path / "bad.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "_meta"
+    wb.active.append(["format", "version"])
+    wb.active.append(["not_crml", "1.0"])
+    wb.save(str(out_xlsx))
+
+    opened = []
+    real_load = openpyxl.load_workbook
+
+    def _load(*args, **kwargs):
+        wb = real_load(*args, **kwargs)
+        opened.append((wb, kwargs))
+        return wb
+
+    monkeypatch.setattr(openpyxl, "load_workbook", _load)
+
+    with pytest.raises(ValueError, match="Unsupported workbook format"):
+        import_xlsx(str(out_xlsx))
+
+    (loaded, kwargs), = opened
+    assert kwargs == {"read_only": True, "data_only": True}
+    assert loaded._archive.fp is None
+
+
+def test_xlsx_export_reports_first_failing_path_in_order(tmp_path) -> None:
+    from pydantic import ValidationError
+
+    bad_catalog = tmp_path / "bad_catalog.yaml"
+    bad_catalog.write_text('crml_control_catalog: "1.0"\nmeta:\n  name: "x"\n', encoding="utf-8")
+
+    with pytest.raises(ValidationError):
+        export_xlsx(
+            str(tmp_path / "out.xlsx"),
+            control_catalog_paths=[bad_catalog],
+            attack_catalog_paths=[tmp_path / "missing.yaml"],
+        )
+
+    with pytest.raises(FileNotFoundError):
+        export_xlsx(
+            str(tmp_path / "out.xlsx"),
+            control_catalog_paths=[tmp_path / "missing.yaml", bad_catalog],
+        )
+
+
+def test_xlsx_import_skips_blank_rows(tmp_path) -> None:
+    yaml_text = """
+crml_control_catalog: "1.0"
+meta:
+  name: "demo-catalog"
+catalog:
+  framework: "CIS v8"
+  controls:
+    - id: "cisv8:4.1"
+    - id: "cisv8:4.2"
+"""
+
+    doc = CRControlCatalog.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_catalogs=[doc])
+
+    wb = openpyxl.load_workbook(str(out_xlsx))
+    ws = wb["control_catalogs"]
+    ws.insert_rows(4, amount=2)
+    ws.cell(row=ws.max_row + 3, column=1).value = ""
+    wb.save(str(out_xlsx))
+
+    imported = import_xlsx(str(out_xlsx))
+    assert imported.control_catalogs[0].model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
+
+
+def test_xlsx_import_groups_unsorted_relationship_rows(tmp_path) -> None:
+    yaml_text = """
+crml_control_relationships: "1.0"
+meta:
+  name: "demo-relationships"
+relationships:
+  relationships:
+    - source: "cisv8:4.1"
+      targets:
+        - target: "cap:mfa"
+          relationship_type: "mitigates"
+          overlap:
+            weight: 0.5
+    - source: "cisv8:4.2"
+      targets:
+        - target: "cap:secure-config"
+          relationship_type: "mitigates"
+          overlap:
+            weight: 0.8
+"""
+
+    doc = CRControlRelationships.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_relationships=[doc])
+
+    # Append a second target for the first source after the other source.
+    wb = openpyxl.load_workbook(str(out_xlsx))
+    ws = wb["control_relationships"]
+    keys = [c.value for c in ws[1]]
+    row = [c.value for c in ws[3]]
+    row[keys.index("target_id")] = "cap:logging"
+    ws.append(row)
+    wb.save(str(out_xlsx))
+
+    imported = import_xlsx(str(out_xlsx))
+    rels = imported.control_relationships[0].relationships.relationships
+    assert [r.source for r in rels] == ["cisv8:4.1", "cisv8:4.2"]
+    assert [t.target for t in rels[0].targets] == ["cap:mfa", "cap:logging"]
@@ -19,3 +19,50 @@ def test_dump_to_yaml_file_round_trip(tmp_path, valid_crml_content):
     round_tripped = CRScenario.load_from_yaml(str(out_path))
     assert round_tripped.crml_scenario == scenario.crml_scenario
     assert round_tripped.meta.name == scenario.meta.name
+
+
+def test_dump_to_yaml_file_matches_str(tmp_path, valid_crml_content):
+    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+    scenario.meta.description = "multi\nline ünïcode description " * 5
+
+    out_path = tmp_path / "out.yaml"
+    scenario.dump_to_yaml(str(out_path))
+
+    assert out_path.read_bytes() == scenario.dump_to_yaml_str().encode("utf-8")
+    assert CRScenario.load_from_yaml(str(out_path)) == scenario
+
+
+def test_dump_to_yaml_str_reuse_buffer(valid_crml_content):
+    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+    expected = scenario.dump_to_yaml_str()
+
+    first = scenario.dump_to_yaml_str(reuse_buffer=True)
+    scenario.meta.name = "x"
+    second = scenario.dump_to_yaml_str(reuse_buffer=True)
+
+    assert first == expected
+    assert "name: x\n" in second
+    assert len(second) < len(first)
+
+
+def test_module_level_dump_dispatches_on_type(valid_crml_content):
+    from crml_lang import dump_to_yaml_str
+
+    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+
+    assert dump_to_yaml_str(scenario) == scenario.dump_to_yaml_str()
+    assert dump_to_yaml_str({"a": 1}) == "a: 1\n"
+
+
+def test_module_dump_functions_accept_plain_models(tmp_path, valid_crml_content):
+    from crml_lang.api import dump_to_yaml, dump_to_yaml_str
+    from crml_lang.models.scenario_model import CRScenario as PlainCRScenario
+
+    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+    plain = PlainCRScenario.model_validate(scenario.model_dump(by_alias=True))
+
+    assert dump_to_yaml_str(plain) == scenario.dump_to_yaml_str()
+
+    out_path = tmp_path / "out.yaml"
+    dump_to_yaml(plain, str(out_path))
+    assert out_path.read_text(encoding="utf-8") == scenario.dump_to_yaml_str()
@@ -26,3 +26,46 @@ def test_module_level_helpers_match_methods(valid_crml_file: str, valid_crml_con
     s1 = load_from_yaml_str(valid_crml_content)
     s2 = CRScenario.load_from_yaml_str(valid_crml_content)
     assert s1.model_dump() == s2.model_dump()
+
+
+def test_trusted_load_matches_validated_roundtrip(valid_crml_content: str) -> None:
+    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+    trusted = CRScenario.load_from_yaml_str(scenario.dump_to_yaml_str(), trusted=True)
+
+    assert trusted == scenario
+    assert type(trusted.scenario.frequency) is type(scenario.scenario.frequency)
+
+
+def test_trusted_load_builds_nested_bundle_models() -> None:
+    from pathlib import Path
+
+    from crml_lang import CRPortfolioBundle
+
+    path = Path(__file__).resolve().parents[2] / "examples" / "portfolio_bundles" / "lesson-03a-org-controls-phishing-bundle.yaml"
+    bundle = CRPortfolioBundle.load_from_yaml(str(path))
+    trusted = CRPortfolioBundle.load_from_yaml_str(bundle.dump_to_yaml_str(), trusted=True)
+
+    assert trusted == bundle
+    assert trusted.model_dump(by_alias=True) == bundle.model_dump(by_alias=True)
+
+
+def test_load_many_from_yaml_preserves_order(tmp_path, valid_crml_content: str) -> None:
+    paths = []
+    for i in range(4):
+        p = tmp_path / f"s{i}.yaml"
+        p.write_text(valid_crml_content.replace("test-model", f"model-{i}"), encoding="utf-8")
+        paths.append(str(p))
+
+    scenarios = CRScenario.load_many_from_yaml(paths, max_workers=3)
+
+    assert [s.meta.name for s in scenarios] == [f"model-{i}" for i in range(4)]
+    assert all(type(s) is CRScenario for s in scenarios)
+
+
+def test_load_from_yaml_path_handles_bom_and_unicode(tmp_path, valid_crml_content: str) -> None:
+    p = tmp_path / "bom.yaml"
+    p.write_bytes(b"\xef\xbb\xbf" + valid_crml_content.replace("test-model", "modèle-ü").encode("utf-8"))
+
+    scenario = CRScenario.load_from_yaml(str(p))
+
+    assert scenario.meta.name == "modèle-ü"